@@ -3,23 +3,288 @@ Analytics functionality for analyzing evaluation data and generating insights.
 """
 import logging
 import json
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
-from sqlalchemy import func, desc, and_, or_
+from cachetools import TTLCache
+from sqlalchemy import event, func, desc, and_, select, insert, bindparam, lambda_stmt
 
+from analytics_kernels import group_means
 from database import get_db_session
 from models import (
     Content, Evaluation, EvaluationScore, EvaluationCriterion,
-    AnalyticsReport, ImprovementSuggestion, User
+    AnalyticsReport, ImprovementSuggestion, ScoreRollup, User, PRIORITY_RANKS,
+    PASSED_QC, PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW, STATUS_OPEN
+)
+from config import (
+    IMPROVEMENT_THRESHOLD, CONTENT_DOMAINS, ANALYTICS_DEFAULT_TIMEFRAME, HUMAN_BENCHMARK_CACHE_TTL,
+    ANALYTICS_SCORE_ROLLUPS
+)
+
+# Length in days of each named analytics timeframe; anything else means all time
+TIMEFRAME_DAYS = {
+    "last_7_days": 7,
+    "last_30_days": 30,
+    "last_90_days": 90,
+    "last_year": 365
+}
+ALL_TIME_START = datetime(2000, 1, 1)  # Effectively all time
+
+# Human benchmark scores change slowly, so they are shared between analytics calls
+_human_benchmark_cache = TTLCache(maxsize=1, ttl=HUMAN_BENCHMARK_CACHE_TTL)
+_human_benchmark_lock = threading.Lock()
+
+# Rows fetched per batch when streaming query results into DataFrames
+STREAM_BATCH_SIZE = 10000
+
+# Prebuilt statements for the report and suggestion getters
+_REPORT_BY_ID = select(AnalyticsReport).where(AnalyticsReport.id == bindparam("report_id"))
+_REPORT_OWNER = select(AnalyticsReport.created_by).where(AnalyticsReport.id == bindparam("report_id"))
+_RECENT_REPORTS = select(
+    AnalyticsReport.id,
+    AnalyticsReport.report_type,
+    AnalyticsReport.title,
+    AnalyticsReport.description,
+    AnalyticsReport.created_at
+).order_by(
+    AnalyticsReport.created_at.desc()
+).limit(bindparam("limit"))
+_SUGGESTION_COLUMNS = (
+    ImprovementSuggestion.id,
+    ImprovementSuggestion.model_name,
+    ImprovementSuggestion.domain,
+    ImprovementSuggestion.criterion,
+    ImprovementSuggestion.current_score,
+    ImprovementSuggestion.target_score,
+    ImprovementSuggestion.suggestion,
+    ImprovementSuggestion.priority,
+    ImprovementSuggestion.status,
+    ImprovementSuggestion.created_at
 )
-from config import IMPROVEMENT_THRESHOLD, CONTENT_DOMAINS, ANALYTICS_DEFAULT_TIMEFRAME
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Criterion-specific advice appended to improvement suggestions
+SUGGESTION_SNIPPETS = {
+    "accuracy": "Enhance factual correctness by improving source validation and fact-checking processes.",
+    "coherence": "Improve logical flow and narrative consistency by strengthening contextual awareness across longer texts.",
+    "relevance": "Improve focus on provided topics by enhancing prompt understanding and topic adherence mechanisms.",
+    "creativity": "Increase originality by expanding the model's diverse expression patterns and reducing repetitive structures.",
+    "completeness": "Ensure comprehensive coverage of subjects by improving the model's thoroughness in addressing all aspects of a topic.",
+    "language_quality": "Enhance grammar, vocabulary and writing style by refining linguistic patterns and reducing awkward phrasing."
+}
+
+
+def clear_human_benchmark_cache():
+    """Drop cached human benchmark scores, e.g. after adding human content or evaluations."""
+    with _human_benchmark_lock:
+        _human_benchmark_cache.clear()
+
+
+@event.listens_for(Content, "after_insert")
+@event.listens_for(Content, "after_update")
+@event.listens_for(Content, "after_delete")
+def _invalidate_human_benchmark_cache(mapper, connection, target):
+    """Drop the cached human benchmark scores whenever content is added, changed or removed."""
+    clear_human_benchmark_cache()
+
+
+@lru_cache(maxsize=1)
+def get_criteria_names() -> Dict[int, str]:
+    """
+    Load the evaluation criterion id to name map, cached until criteria change.
+    
+    The evaluator's EvaluationCriterion listeners clear this cache on ORM writes;
+    call ``get_criteria_names.cache_clear()`` after changing criteria through Core.
+    
+    Returns:
+        Dictionary mapping criterion ID to criterion name
+    """
+    with get_db_session() as session:
+        return dict(session.execute(select(EvaluationCriterion.id, EvaluationCriterion.name)).all())
+
+
+def _fetch_frame(session, query, columns: List[str]) -> pd.DataFrame:
+    """
+    Stream the rows of a select statement into a DataFrame in bounded batches.
+    
+    Args:
+        session: Database session
+        query: Core select statement
+        columns: Column names for the resulting DataFrame
+        
+    Returns:
+        DataFrame with one row per result row
+    """
+    result = session.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE))
+    frames = [pd.DataFrame(partition, columns=columns) for partition in result.partitions()]
+    
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    
+    return pd.concat(frames, ignore_index=True)
+
+
+def _average_scores(scores: pd.DataFrame, keys: List[str]) -> Dict[Any, float]:
+    """
+    Combine per-group score sums and counts into weighted averages.
+    
+    Args:
+        scores: DataFrame with score_sum and score_count columns
+        keys: Columns to group by
+        
+    Returns:
+        Dictionary mapping group key (a tuple for several keys) to average score
+    """
+    if scores.empty:
+        return {}
+    
+    if len(keys) == 1:
+        codes, groups = pd.factorize(scores[keys[0]])
+    else:
+        codes, groups = pd.MultiIndex.from_frame(scores[keys]).factorize()
+    
+    # Rows with a missing key get code -1 and are left out, as groupby would
+    valid = codes >= 0
+    means = group_means(
+        codes[valid],
+        scores["score_sum"].to_numpy()[valid],
+        scores["score_count"].to_numpy()[valid],
+        len(groups)
+    )
+    
+    return dict(zip(groups, means.tolist()))
+
+
+def _score_table(scores: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Average summed score rows into a model x key table.
+    
+    Args:
+        scores: DataFrame with model_name, key, score_sum and score_count columns
+        key: Column to spread across the table (criterion or domain)
+        
+    Returns:
+        DataFrame with one row per model, one column per key and NaN for missing scores
+    """
+    averages = _average_scores(scores, ["model_name", key])
+    if not averages:
+        return pd.DataFrame(dtype=float)
+    
+    return pd.Series(averages, dtype=float).unstack()
+
+
+def _rank_models(model_scores: pd.Series, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Rank models by score, highest first.
+    
+    Args:
+        model_scores: Series of scores indexed by model name; missing scores are skipped
+        top_k: Optional number of top models to keep (default all)
+        
+    Returns:
+        List of {"model", "score"} entries in ranking order
+    """
+    # Stable sort keeps tied models in their original order
+    ranked = model_scores.dropna().sort_values(ascending=False, kind="stable")
+    if top_k is not None:
+        ranked = ranked.head(top_k)
+    
+    return [{"model": model, "score": score} for model, score in ranked.items()]
+
+
+def _best_models(scores: pd.DataFrame, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the best scoring model for each criterion or domain.
+    
+    Args:
+        scores: DataFrame of scores with one row per model and one column per key
+        keys: Criteria or domains to look up
+        
+    Returns:
+        Dictionary mapping key to its best positive score and the model that achieved it
+    """
+    scores = scores.reindex(columns=[key for key in dict.fromkeys(keys) if key in scores.columns])
+    if scores.empty:
+        return {}
+    
+    # Missing scores become -inf so they never win the argmax
+    values = np.nan_to_num(scores.to_numpy(dtype=np.float64), nan=-np.inf)
+    
+    # Repeated reports over unchanged data reuse the previous result
+    return _best_models_snapshot(tuple(scores.index), tuple(scores.columns), values.tobytes())
+
+
+@lru_cache(maxsize=64)
+def _best_models_snapshot(models: Tuple[str, ...], keys: Tuple[str, ...], values: bytes) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the best model per key from a hashable snapshot of a score table.
+    
+    Args:
+        models: Model name of each table row
+        keys: Criterion or domain of each table column
+        values: Raw float64 scores in row-major order, -inf where missing
+        
+    Returns:
+        Dictionary mapping key to its best positive score and the model that achieved it
+    """
+    values = np.frombuffer(values, dtype=np.float64).reshape(len(models), len(keys))
+    best_rows = values.argmax(axis=0)
+    best_scores = values[best_rows, np.arange(len(keys))]
+    
+    return {
+        key: {"score": float(score), "model": models[row]}
+        for key, row, score in zip(keys, best_rows, best_scores)
+        if score > 0
+    }
+
+
+def _gap_table(human_scores: Dict[str, float], best_ai: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Compare human scores with the best AI scores for the keys both have.
+    
+    Args:
+        human_scores: Dictionary mapping criterion or domain to human score
+        best_ai: Dictionary mapping criterion or domain to best AI score and model
+        
+    Returns:
+        DataFrame indexed by key with human_score, ai_score, gap and best_model columns
+    """
+    keys = [key for key in human_scores if key in best_ai]
+    gaps = pd.DataFrame(
+        {
+            "human_score": [human_scores[key] for key in keys],
+            "ai_score": [best_ai[key]["score"] for key in keys],
+            "best_model": [best_ai[key]["model"] for key in keys]
+        },
+        index=keys
+    )
+    gaps["gap"] = gaps["human_score"] - gaps["ai_score"]
+    
+    return gaps[["human_score", "ai_score", "gap", "best_model"]]
+
+
+def _summarize_scores(scores: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Average summed score rows by criterion and by domain.
+    
+    Args:
+        scores: DataFrame with criterion, domain, score_sum and score_count columns
+        
+    Returns:
+        Dictionary with score data
+    """
+    return {
+        "criteria": _average_scores(scores, ["criterion"]),  # Avg score by criterion
+        "domains": _average_scores(scores, ["domain"])       # Avg score by domain
+    }
+
 
 class AnalyticsEngine:
     """
@@ -35,7 +300,8 @@ class AnalyticsEngine:
         model_names: List[str], 
         domains: List[str] = None, 
         criteria: List[str] = None,
-        timeframe: str = ANALYTICS_DEFAULT_TIMEFRAME
+        timeframe: str = ANALYTICS_DEFAULT_TIMEFRAME,
+        top_k: int = None
     ) -> Dict[str, Any]:
         """
         Generate a comparison between different AI models.
@@ -45,22 +311,17 @@ class AnalyticsEngine:
             domains: Optional list of content domains to filter by
             criteria: Optional list of criteria to include
             timeframe: Time period for analysis
+            top_k: Optional number of top models to keep in each ranking
             
         Returns:
-            Dictionary with comparison results
+            Dictionary with comparison results, including the saved report_id
         """
         # Define timeframe date range
         end_date = datetime.utcnow()
-        if timeframe == "last_7_days":
-            start_date = end_date - timedelta(days=7)
-        elif timeframe == "last_30_days":
-            start_date = end_date - timedelta(days=30)
-        elif timeframe == "last_90_days":
-            start_date = end_date - timedelta(days=90)
-        elif timeframe == "last_year":
-            start_date = end_date - timedelta(days=365)
+        if timeframe in TIMEFRAME_DAYS:
+            start_date = end_date - timedelta(days=TIMEFRAME_DAYS[timeframe])
         else:  # Default to all time
-            start_date = datetime(2000, 1, 1)  # Effectively all time
+            start_date = ALL_TIME_START
         
         # Collect data for each model
         results = {
@@ -69,85 +330,114 @@ class AnalyticsEngine:
             "criteria_rankings": {},
             "domain_rankings": {},
             "timeframe": timeframe,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": end_date.isoformat(),
             "total_evaluations_analyzed": 0
         }
         
+        # Criteria rarely change, so the id -> name map is cached per process
+        all_criteria = get_criteria_names()
+        
         with get_db_session() as session:
-            # Get all criteria if not specified
-            all_criteria = {}
-            for criterion in session.query(EvaluationCriterion).all():
-                all_criteria[criterion.id] = criterion.name
-            
             criteria_ids = None
             if criteria:
                 # Map criteria names to IDs
                 criteria_map = {name: id for id, name in all_criteria.items()}
                 criteria_ids = [criteria_map.get(name) for name in criteria if name in criteria_map]
             
-            # Create base query to get evaluation scores
-            total_evaluations = 0
-            
+            # Start every requested model empty so models without data still appear
             for model_name in model_names:
-                # Get all content IDs for this model
-                content_query = session.query(Content.id).filter(
-                    Content.model_name == model_name,
-                    Content.source_type == 'ai'
+                results["models"][model_name] = {
+                    "score": 0,
+                    "evaluations": 0,
+                    "criteria_scores": {},
+                    "domain_scores": {}
+                }
+            
+            # Aggregate scores for all models, domains and criteria in a single query
+            if ANALYTICS_SCORE_ROLLUPS:
+                # Daily rollups resolve the timeframe to whole days
+                score_query = select(
+                    ScoreRollup.model_name,
+                    ScoreRollup.domain,
+                    ScoreRollup.criterion_id,
+                    func.sum(ScoreRollup.score_sum).label('score_sum'),
+                    func.sum(ScoreRollup.score_count).label('score_count')
+                ).where(
+                    ScoreRollup.model_name.in_(model_names),
+                    ScoreRollup.day.between(start_date.date(), end_date.date())
                 )
-                
-                if domains:
-                    content_query = content_query.filter(Content.domain.in_(domains))
-                
-                content_ids = [row[0] for row in content_query.all()]
-                
-                if not content_ids:
-                    # Skip if no content found for this model
-                    results["models"][model_name] = {
-                        "score": 0,
-                        "evaluations": 0,
-                        "criteria_scores": {},
-                        "domain_scores": {}
-                    }
-                    continue
-                
-                # Get all evaluations for these contents within timeframe
-                eval_query = session.query(Evaluation).filter(
-                    Evaluation.content_id.in_(content_ids),
+                score_columns = (ScoreRollup.model_name, ScoreRollup.domain, ScoreRollup.criterion_id)
+            else:
+                score_query = select(
+                    Content.model_name,
+                    Content.domain,
+                    EvaluationScore.criterion_id,
+                    func.sum(EvaluationScore.score).label('score_sum'),
+                    func.count(EvaluationScore.id).label('score_count')
+                ).join(
+                    Evaluation, Evaluation.content_id == Content.id
+                ).join(
+                    EvaluationScore, EvaluationScore.evaluation_id == Evaluation.id
+                ).where(
+                    Content.model_name.in_(model_names),
+                    Content.source_type == 'ai',
                     Evaluation.completion_time.between(start_date, end_date),
-                    Evaluation.passed_quality_checks != False  # Include NULL and True
+                    PASSED_QC
                 )
-                
-                evaluation_ids = [evaluation.id for evaluation in eval_query.all()]
-                total_evaluations += len(evaluation_ids)
-                
-                if not evaluation_ids:
-                    # Skip if no evaluations found
-                    results["models"][model_name] = {
-                        "score": 0,
-                        "evaluations": 0,
-                        "criteria_scores": {},
-                        "domain_scores": {}
-                    }
+                score_columns = (Content.model_name, Content.domain, EvaluationScore.criterion_id)
+            
+            # Count evaluations per model (including evaluations without scores)
+            evaluation_query = select(
+                Content.model_name,
+                func.count(Evaluation.id)
+            ).join(
+                Evaluation, Evaluation.content_id == Content.id
+            ).where(
+                Content.model_name.in_(model_names),
+                Content.source_type == 'ai',
+                Evaluation.completion_time.between(start_date, end_date),
+                PASSED_QC
+            )
+            
+            model_column, domain_column, criterion_column = score_columns
+            if domains:
+                score_query = score_query.where(domain_column.in_(domains))
+                evaluation_query = evaluation_query.where(Content.domain.in_(domains))
+            
+            if criteria_ids:
+                score_query = score_query.where(criterion_column.in_(criteria_ids))
+            
+            score_query = score_query.group_by(*score_columns)
+            evaluation_query = evaluation_query.group_by(Content.model_name)
+            
+            # Average scores by criterion and by domain for each model
+            scores = _fetch_frame(
+                session,
+                score_query,
+                ["model_name", "domain", "criterion_id", "score_sum", "score_count"]
+            )
+            scores["score_sum"] = scores["score_sum"].astype(float)
+            scores["criterion"] = scores["criterion_id"].map(
+                lambda criterion_id: all_criteria.get(criterion_id, f"criterion_{criterion_id}")
+            )
+            
+            criteria_scores = defaultdict(dict)
+            for (model_name, criterion_name), avg_score in _average_scores(scores, ["model_name", "criterion"]).items():
+                criteria_scores[model_name][criterion_name] = avg_score
+            
+            domain_scores = defaultdict(dict)
+            for (model_name, domain), avg_score in _average_scores(scores, ["model_name", "domain"]).items():
+                domain_scores[model_name][domain] = avg_score
+            
+            evaluation_counts = dict(session.execute(evaluation_query).all())
+            total_evaluations = sum(evaluation_counts.values())
+            
+            for model_name in model_names:
+                evaluation_count = evaluation_counts.get(model_name, 0)
+                if not evaluation_count:
                     continue
                 
-                # Get scores for these evaluations
-                score_query = session.query(
-                    EvaluationScore.criterion_id,
-                    func.avg(EvaluationScore.score).label('avg_score')
-                ).filter(
-                    EvaluationScore.evaluation_id.in_(evaluation_ids)
-                )
-                
-                if criteria_ids:
-                    score_query = score_query.filter(EvaluationScore.criterion_id.in_(criteria_ids))
-                
-                score_query = score_query.group_by(EvaluationScore.criterion_id)
-                
-                # Collect scores by criterion
-                model_criteria_scores = {}
-                for criterion_id, avg_score in score_query.all():
-                    criterion_name = all_criteria.get(criterion_id, f"criterion_{criterion_id}")
-                    model_criteria_scores[criterion_name] = float(avg_score)
+                model_criteria_scores = criteria_scores[model_name]
                 
                 # Calculate overall score for model
                 overall_score = sum(model_criteria_scores.values()) / len(model_criteria_scores) if model_criteria_scores else 0
@@ -156,83 +446,51 @@ class AnalyticsEngine:
                 model_domain_scores = {}
                 if domains:
                     for domain in domains:
-                        # Get content IDs for this domain
-                        domain_content_ids = session.query(Content.id).filter(
-                            Content.model_name == model_name,
-                            Content.domain == domain,
-                            Content.source_type == 'ai'
-                        ).all()
-                        
-                        domain_content_ids = [row[0] for row in domain_content_ids]
-                        
-                        if not domain_content_ids:
-                            model_domain_scores[domain] = 0
-                            continue
-                        
-                        # Get evaluation IDs for these contents
-                        domain_eval_ids = [
-                            e.id for e in session.query(Evaluation).filter(
-                                Evaluation.content_id.in_(domain_content_ids),
-                                Evaluation.completion_time.between(start_date, end_date),
-                                Evaluation.passed_quality_checks != False
-                            ).all()
-                        ]
-                        
-                        if not domain_eval_ids:
-                            model_domain_scores[domain] = 0
-                            continue
-                        
-                        # Get average score across all criteria for this domain
-                        domain_avg = session.query(
-                            func.avg(EvaluationScore.score)
-                        ).filter(
-                            EvaluationScore.evaluation_id.in_(domain_eval_ids)
-                        ).scalar()
-                        
-                        model_domain_scores[domain] = float(domain_avg) if domain_avg else 0
+                        model_domain_scores[domain] = domain_scores[model_name].get(domain, 0)
                 
                 # Store results for this model
                 results["models"][model_name] = {
                     "score": overall_score,
-                    "evaluations": len(evaluation_ids),
+                    "evaluations": evaluation_count,
                     "criteria_scores": model_criteria_scores,
                     "domain_scores": model_domain_scores
                 }
             
+            # Lay scores out as model x criterion and model x domain tables for ranking
+            overall_scores = pd.Series(
+                {model: data["score"] for model, data in results["models"].items()},
+                dtype=float
+            )
+            criteria_table = pd.DataFrame.from_dict(
+                {model: data["criteria_scores"] for model, data in results["models"].items()},
+                orient="index",
+                dtype=float
+            )
+            domain_table = pd.DataFrame.from_dict(
+                {model: data["domain_scores"] for model, data in results["models"].items()},
+                orient="index",
+                dtype=float
+            )
+            
             # Calculate overall rankings
-            model_scores = [(model, data["score"]) for model, data in results["models"].items()]
-            model_scores.sort(key=lambda x: x[1], reverse=True)
-            results["overall_ranking"] = [{"model": model, "score": score} for model, score in model_scores]
+            results["overall_ranking"] = _rank_models(overall_scores, top_k)
             
             # Calculate criteria rankings
-            all_criteria_used = set()
-            for model_data in results["models"].values():
-                all_criteria_used.update(model_data["criteria_scores"].keys())
-            
-            for criterion in all_criteria_used:
-                criterion_scores = []
-                for model, data in results["models"].items():
-                    if criterion in data["criteria_scores"]:
-                        criterion_scores.append({"model": model, "score": data["criteria_scores"][criterion]})
-                
-                criterion_scores.sort(key=lambda x: x["score"], reverse=True)
-                results["criteria_rankings"][criterion] = criterion_scores
+            for criterion in criteria_table.columns:
+                results["criteria_rankings"][criterion] = _rank_models(criteria_table[criterion], top_k)
             
             # Calculate domain rankings
             if domains:
                 for domain in domains:
-                    domain_scores = []
-                    for model, data in results["models"].items():
-                        if domain in data["domain_scores"]:
-                            domain_scores.append({"model": model, "score": data["domain_scores"][domain]})
-                    
-                    domain_scores.sort(key=lambda x: x["score"], reverse=True)
-                    results["domain_rankings"][domain] = domain_scores
+                    if domain in domain_table.columns:
+                        results["domain_rankings"][domain] = _rank_models(domain_table[domain], top_k)
+                    else:
+                        results["domain_rankings"][domain] = []
             
             results["total_evaluations_analyzed"] = total_evaluations
             
             # Save the report
-            self.save_analytics_report(
+            results["report_id"] = self.save_analytics_report(
                 "model_comparison",
                 f"Model Comparison ({timeframe})",
                 "Comparison of performance across different AI models",
@@ -240,9 +498,11 @@ class AnalyticsEngine:
                     "model_names": model_names,
                     "domains": domains,
                     "criteria": criteria,
-                    "timeframe": timeframe
+                    "timeframe": timeframe,
+                    "top_k": top_k
                 },
-                results
+                results,
+                session=session
             )
             
             return results
@@ -262,7 +522,7 @@ class AnalyticsEngine:
             comparison_model: Optional model to compare against
             
         Returns:
-            Dictionary with improvement suggestions
+            Dictionary with improvement suggestions, including the saved report_id
         """
         results = {
             "model_name": model_name,
@@ -280,7 +540,7 @@ class AnalyticsEngine:
                 return {
                     "model_name": model_name,
                     "error": "No evaluation data found for this model",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": results["generated_at"]
                 }
             
             # Get comparison scores
@@ -329,30 +589,21 @@ class AnalyticsEngine:
             # Generate improvement suggestions
             suggestions = []
             
+            # Find the lowest scoring criterion in every domain that needs improvement
+            worst_criteria = {}
+            if results["domains_to_improve"]:
+                worst_criteria = self._get_worst_domain_criteria(
+                    session,
+                    model_name,
+                    [domain_gap["domain"] for domain_gap in results["domains_to_improve"]]
+                )
+            
             # Domain-specific suggestions
             for domain_gap in results["domains_to_improve"]:
                 domain = domain_gap["domain"]
                 
-                # Find the worst criteria in this domain
-                domain_criteria = {}
-                for content_id in model_scores["domain_contents"].get(domain, []):
-                    for eval_id in model_scores["content_evals"].get(content_id, []):
-                        for criterion, score in model_scores["eval_scores"].get(eval_id, {}).items():
-                            if criterion not in domain_criteria:
-                                domain_criteria[criterion] = []
-                            domain_criteria[criterion].append(score)
-                
-                # Calculate average score per criterion in this domain
-                domain_criteria_avg = {}
-                for criterion, scores in domain_criteria.items():
-                    if scores:
-                        domain_criteria_avg[criterion] = sum(scores) / len(scores)
-                
-                # Find lowest scoring criteria in this domain
-                sorted_criteria = sorted(domain_criteria_avg.items(), key=lambda x: x[1])
-                
-                if sorted_criteria:
-                    worst_criterion, worst_score = sorted_criteria[0]
+                if domain in worst_criteria:
+                    worst_criterion, worst_score = worst_criteria[domain]
                     
                     # Create improvement suggestion
                     suggestion = self._create_improvement_suggestion(
@@ -366,12 +617,12 @@ class AnalyticsEngine:
                     suggestions.append(suggestion)
             
             # General criteria suggestions
+            suggested_criteria = {s["criterion"] for s in suggestions}
             for criterion_gap in results["criteria_to_improve"]:
                 criterion = criterion_gap["criterion"]
                 
                 # Check if we already have a suggestion for this criterion
-                existing = any(s["criterion"] == criterion for s in suggestions)
-                if existing:
+                if criterion in suggested_criteria:
                     continue
                 
                 # Create general suggestion
@@ -384,26 +635,32 @@ class AnalyticsEngine:
                 )
                 
                 suggestions.append(suggestion)
+                suggested_criteria.add(criterion)
             
             results["suggestions"] = suggestions
             
-            # Save suggestions to database
-            for suggestion in suggestions:
-                improvement = ImprovementSuggestion(
-                    model_name=model_name,
-                    domain=suggestion["domain"] if "domain" in suggestion else None,
-                    criterion=suggestion["criterion"],
-                    current_score=suggestion["current_score"],
-                    target_score=suggestion["target_score"],
-                    suggestion=suggestion["suggestion"],
-                    priority=suggestion["priority"],
-                    status="open"
+            # Save suggestions to database in a single bulk insert
+            if suggestions:
+                session.execute(
+                    insert(ImprovementSuggestion),
+                    [
+                        {
+                            "model_name": model_name,
+                            "domain": suggestion.get("domain"),
+                            "criterion": suggestion["criterion"],
+                            "current_score": suggestion["current_score"],
+                            "target_score": suggestion["target_score"],
+                            "suggestion": suggestion["suggestion"],
+                            "priority": suggestion["priority"],
+                            "priority_rank": PRIORITY_RANKS[suggestion["priority"]],
+                            "status": STATUS_OPEN
+                        }
+                        for suggestion in suggestions
+                    ]
                 )
-                
-                session.add(improvement)
             
             # Save report
-            self.save_analytics_report(
+            results["report_id"] = self.save_analytics_report(
                 "improvement_areas",
                 f"Improvement Areas for {model_name}",
                 f"Analysis of areas where {model_name} needs improvement compared to {comparison_model}",
@@ -412,7 +669,8 @@ class AnalyticsEngine:
                     "threshold": threshold,
                     "comparison_model": comparison_model
                 },
-                results
+                results,
+                session=session
             )
             
             return results
@@ -428,171 +686,132 @@ class AnalyticsEngine:
         Returns:
             Dictionary with score data
         """
-        result = {
-            "criteria": {},     # Avg score by criterion
-            "domains": {},      # Avg score by domain
-            "domain_contents": {},  # Content IDs by domain
-            "content_evals": {},    # Evaluation IDs by content
-            "eval_scores": {}       # Scores by evaluation
-        }
+        scores = self._get_score_totals(
+            session,
+            [Content.model_name == model_name, Content.source_type == 'ai']
+        )
+        return _summarize_scores(scores)
+    
+    def _get_all_model_scores(self, session) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get evaluation scores for every AI model in a single query.
         
-        # Get all content for this model
-        contents = session.query(Content).filter(
-            Content.model_name == model_name,
-            Content.source_type == 'ai'
-        ).all()
-        
-        if not contents:
-            return result
-        
-        # Group content by domain
-        for content in contents:
-            if content.domain not in result["domain_contents"]:
-                result["domain_contents"][content.domain] = []
-            result["domain_contents"][content.domain].append(content.id)
-        
-        # Get all evaluations for these contents
-        content_ids = [content.id for content in contents]
-        evaluations = session.query(Evaluation).filter(
-            Evaluation.content_id.in_(content_ids),
-            Evaluation.passed_quality_checks != False,
-            Evaluation.completion_time.isnot(None)
-        ).all()
-        
-        if not evaluations:
-            return result
-        
-        # Group evaluations by content
-        for evaluation in evaluations:
-            if evaluation.content_id not in result["content_evals"]:
-                result["content_evals"][evaluation.content_id] = []
-            result["content_evals"][evaluation.content_id].append(evaluation.id)
-        
-        # Get all scores
-        evaluation_ids = [evaluation.id for evaluation in evaluations]
-        scores = session.query(
-            EvaluationScore,
-            EvaluationCriterion.name.label('criterion_name')
-        ).join(
-            EvaluationCriterion,
-            EvaluationScore.criterion_id == EvaluationCriterion.id
-        ).filter(
-            EvaluationScore.evaluation_id.in_(evaluation_ids)
-        ).all()
-        
-        # Process all scores
-        criteria_scores = {}
-        domain_scores = {domain: [] for domain in result["domain_contents"]}
-        
-        for score, criterion_name in scores:
-            # Add to eval_scores
-            if score.evaluation_id not in result["eval_scores"]:
-                result["eval_scores"][score.evaluation_id] = {}
-            result["eval_scores"][score.evaluation_id][criterion_name] = score.score
-            
-            # Add to criteria scores
-            if criterion_name not in criteria_scores:
-                criteria_scores[criterion_name] = []
-            criteria_scores[criterion_name].append(score.score)
-            
-            # Find which domain this score belongs to
-            for domain, content_ids in result["domain_contents"].items():
-                for content_id in content_ids:
-                    if content_id in result["content_evals"] and score.evaluation_id in result["content_evals"][content_id]:
-                        domain_scores[domain].append(score.score)
-                        break
-        
-        # Calculate averages
-        for criterion, scores in criteria_scores.items():
-            if scores:
-                result["criteria"][criterion] = sum(scores) / len(scores)
-        
-        for domain, scores in domain_scores.items():
-            if scores:
-                result["domains"][domain] = sum(scores) / len(scores)
+        Args:
+            session: Database session
+            
+        Returns:
+            Tuple of (model x criterion, model x domain) average score tables
+        """
+        scores = self._get_score_totals(
+            session,
+            [Content.source_type == 'ai', Content.model_name.isnot(None)],
+            [Content.model_name]
+        )
         
-        return result
+        return _score_table(scores, "criterion"), _score_table(scores, "domain")
     
     def _get_human_benchmark_scores(self, session) -> Dict[str, Any]:
         """
         Get benchmark scores from human-created content.
         
+        Results are cached for HUMAN_BENCHMARK_CACHE_TTL seconds and dropped
+        when content changes or an evaluation of human content is submitted.
+        
         Args:
             session: Database session
             
         Returns:
             Dictionary with benchmark score data
         """
-        result = {
-            "criteria": {},     # Avg score by criterion
-            "domains": {},      # Avg score by domain
-        }
+        with _human_benchmark_lock:
+            cached = _human_benchmark_cache.get("scores")
         
-        # Get all human content
-        contents = session.query(Content).filter(
-            Content.source_type == 'human'
-        ).all()
+        if cached is not None:
+            return cached
         
-        if not contents:
-            return result
+        scores = self._get_score_totals(
+            session,
+            [Content.source_type == 'human']
+        )
+        benchmark = _summarize_scores(scores)
         
-        # Get all evaluations for human content
-        content_ids = [content.id for content in contents]
-        evaluations = session.query(Evaluation).filter(
-            Evaluation.content_id.in_(content_ids),
-            Evaluation.passed_quality_checks != False,
-            Evaluation.completion_time.isnot(None)
-        ).all()
-        
-        if not evaluations:
-            return result
-        
-        # Get content domains for each evaluation
-        eval_domains = {}
-        for content in contents:
-            for evaluation in evaluations:
-                if evaluation.content_id == content.id:
-                    eval_domains[evaluation.id] = content.domain
-        
-        # Get all scores
-        evaluation_ids = [evaluation.id for evaluation in evaluations]
-        scores = session.query(
-            EvaluationScore,
-            EvaluationCriterion.name.label('criterion_name')
+        with _human_benchmark_lock:
+            _human_benchmark_cache["scores"] = benchmark
+        
+        return benchmark
+    
+    def _get_worst_domain_criteria(self, session, model_name: str, domains: List[str]) -> Dict[str, Tuple[str, float]]:
+        """
+        Find the lowest scoring criterion of a model within each of the given domains.
+        
+        Args:
+            session: Database session
+            model_name: AI model name
+            domains: Content domains to inspect
+            
+        Returns:
+            Dictionary mapping domain to a (criterion, average score) tuple
+        """
+        scores = self._get_score_totals(
+            session,
+            [
+                Content.model_name == model_name,
+                Content.source_type == 'ai',
+                Content.domain.in_(domains)
+            ]
+        )
+        
+        scores["avg_score"] = scores["score_sum"] / scores["score_count"]
+        scores = scores.sort_values(["domain", "avg_score", "criterion"]).drop_duplicates("domain")
+        
+        return {
+            row.domain: (row.criterion, row.avg_score)
+            for row in scores.itertuples(index=False)
+        }
+    
+    def _get_score_totals(self, session, content_filters: List[Any], group_columns: List[Any] = ()) -> pd.DataFrame:
+        """
+        Sum and count evaluation scores per (criterion, domain) on the database side.
+        
+        Args:
+            session: Database session
+            content_filters: Filter expressions applied to Content
+            group_columns: Additional Content columns to group by
+            
+        Returns:
+            DataFrame with one row per group and score_sum/score_count columns
+        """
+        query = select(
+            *group_columns,
+            EvaluationCriterion.name,
+            Content.domain,
+            func.sum(EvaluationScore.score),
+            func.count(EvaluationScore.id)
+        ).select_from(
+            EvaluationScore
         ).join(
             EvaluationCriterion,
             EvaluationScore.criterion_id == EvaluationCriterion.id
-        ).filter(
-            EvaluationScore.evaluation_id.in_(evaluation_ids)
-        ).all()
-        
-        # Process scores
-        criteria_scores = {}
-        domain_scores = {}
-        
-        for score, criterion_name in scores:
-            # Add to criteria scores
-            if criterion_name not in criteria_scores:
-                criteria_scores[criterion_name] = []
-            criteria_scores[criterion_name].append(score.score)
-            
-            # Add to domain scores
-            if score.evaluation_id in eval_domains:
-                domain = eval_domains[score.evaluation_id]
-                if domain not in domain_scores:
-                    domain_scores[domain] = []
-                domain_scores[domain].append(score.score)
-        
-        # Calculate averages
-        for criterion, scores in criteria_scores.items():
-            if scores:
-                result["criteria"][criterion] = sum(scores) / len(scores)
-        
-        for domain, scores in domain_scores.items():
-            if scores:
-                result["domains"][domain] = sum(scores) / len(scores)
+        ).join(
+            Evaluation,
+            EvaluationScore.evaluation_id == Evaluation.id
+        ).join(
+            Content,
+            Evaluation.content_id == Content.id
+        ).where(
+            *content_filters,
+            PASSED_QC,
+            Evaluation.completion_time.isnot(None)
+        ).group_by(
+            *group_columns,
+            EvaluationCriterion.name,
+            Content.domain
+        )
         
-        return result
+        columns = [column.key for column in group_columns] + ["criterion", "domain", "score_sum", "score_count"]
+        scores = _fetch_frame(session, query, columns)
+        scores["score_sum"] = scores["score_sum"].astype(float)
+        return scores
     
     def _create_improvement_suggestion(
         self, 
@@ -617,16 +836,16 @@ class AnalyticsEngine:
         """
         # Format scores
         current_formatted = f"{current_score:.2f}"
-        target_formatted = f"{target_formatted:.2f}" if isinstance(target_score, float) else "N/A"
+        target_formatted = f"{target_score:.2f}" if isinstance(target_score, float) else "N/A"
         score_gap = target_score - current_score if isinstance(target_score, float) else 0
         
         # Set priority based on gap
         if score_gap >= 1.0:
-            priority = "high"
+            priority = PRIORITY_HIGH
         elif score_gap >= 0.5:
-            priority = "medium"
+            priority = PRIORITY_MEDIUM
         else:
-            priority = "low"
+            priority = PRIORITY_LOW
         
         suggestion = {
             "model_name": model_name,
@@ -646,18 +865,9 @@ class AnalyticsEngine:
         suggestion_text += f"from {current_formatted} to {target_formatted}."
         
         # Add specific suggestions based on criterion
-        if criterion.lower() == "accuracy":
-            suggestion_text += " Enhance factual correctness by improving source validation and fact-checking processes."
-        elif criterion.lower() == "coherence":
-            suggestion_text += " Improve logical flow and narrative consistency by strengthening contextual awareness across longer texts."
-        elif criterion.lower() == "relevance":
-            suggestion_text += " Improve focus on provided topics by enhancing prompt understanding and topic adherence mechanisms."
-        elif criterion.lower() == "creativity":
-            suggestion_text += " Increase originality by expanding the model's diverse expression patterns and reducing repetitive structures."
-        elif criterion.lower() == "completeness":
-            suggestion_text += " Ensure comprehensive coverage of subjects by improving the model's thoroughness in addressing all aspects of a topic."
-        elif criterion.lower() == "language_quality":
-            suggestion_text += " Enhance grammar, vocabulary and writing style by refining linguistic patterns and reducing awkward phrasing."
+        snippet = SUGGESTION_SNIPPETS.get(criterion.lower())
+        if snippet:
+            suggestion_text += f" {snippet}"
         
         suggestion["suggestion"] = suggestion_text
         return suggestion
@@ -670,7 +880,7 @@ class AnalyticsEngine:
             domains: Optional list of domains to filter by
             
         Returns:
-            Dictionary with gap analysis
+            Dictionary with gap analysis, including the saved report_id
         """
         results = {
             "overall_gap": 0,
@@ -686,142 +896,62 @@ class AnalyticsEngine:
             if not human_scores["criteria"]:
                 return {
                     "error": "No human benchmark data available",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": results["generated_at"]
                 }
             
-            # Get all AI models
-            ai_models = session.query(Content.model_name).filter(
-                Content.source_type == 'ai'
-            ).distinct().all()
+            # Get model x criterion and model x domain scores for all AI models at once
+            criteria_table, domain_table = self._get_all_model_scores(session)
             
-            ai_models = [model[0] for model in ai_models if model[0]]
-            
-            if not ai_models:
+            if criteria_table.empty:
                 return {
                     "error": "No AI model data available",
-                    "generated_at": datetime.utcnow().isoformat()
+                    "generated_at": results["generated_at"]
                 }
             
-            # Get scores for each model
-            all_model_scores = {}
-            for model in ai_models:
-                all_model_scores[model] = self._get_model_scores(session, model)
-            
             # Filter domains if needed
             if domains:
-                valid_domains = []
-                for domain in domains:
-                    # Check if we have data for this domain
-                    human_has_domain = domain in human_scores["domains"]
-                    ai_has_domain = any(domain in model_data["domains"] for model_data in all_model_scores.values())
-                    
-                    if human_has_domain and ai_has_domain:
-                        valid_domains.append(domain)
-                
-                domains = valid_domains
+                # Keep domains that have both human and AI data
+                domains = [
+                    domain for domain in domains
+                    if domain in human_scores["domains"] and domain in domain_table.columns
+                ]
             else:
                 # Use all available domains
-                domains = set(human_scores["domains"].keys())
-                for model_data in all_model_scores.values():
-                    domains.update(model_data["domains"].keys())
-                domains = list(domains)
+                domains = list(set(human_scores["domains"].keys()) | set(domain_table.columns))
             
             # Calculate best AI score for each criterion and domain
-            best_ai_criteria = {}
-            best_ai_domains = {}
-            
-            # For each criterion
-            for criterion in human_scores["criteria"]:
-                best_score = 0
-                best_model = None
-                
-                for model, model_data in all_model_scores.items():
-                    if criterion in model_data["criteria"]:
-                        score = model_data["criteria"][criterion]
-                        if score > best_score:
-                            best_score = score
-                            best_model = model
-                
-                if best_model:
-                    best_ai_criteria[criterion] = {
-                        "score": best_score,
-                        "model": best_model
-                    }
-            
-            # For each domain
-            for domain in domains:
-                best_score = 0
-                best_model = None
-                
-                for model, model_data in all_model_scores.items():
-                    if domain in model_data["domains"]:
-                        score = model_data["domains"][domain]
-                        if score > best_score:
-                            best_score = score
-                            best_model = model
-                
-                if best_model:
-                    best_ai_domains[domain] = {
-                        "score": best_score,
-                        "model": best_model
-                    }
+            best_ai_criteria = _best_models(criteria_table, list(human_scores["criteria"]))
+            best_ai_domains = _best_models(domain_table, domains)
             
             # Calculate gaps
-            criteria_gaps = {}
-            for criterion, human_score in human_scores["criteria"].items():
-                if criterion in best_ai_criteria:
-                    ai_score = best_ai_criteria[criterion]["score"]
-                    gap = human_score - ai_score
-                    
-                    criteria_gaps[criterion] = {
-                        "human_score": human_score,
-                        "ai_score": ai_score,
-                        "gap": gap,
-                        "best_model": best_ai_criteria[criterion]["model"]
-                    }
-            
-            domain_gaps = {}
-            for domain, human_score in human_scores["domains"].items():
-                if domain in best_ai_domains:
-                    ai_score = best_ai_domains[domain]["score"]
-                    gap = human_score - ai_score
-                    
-                    domain_gaps[domain] = {
-                        "human_score": human_score,
-                        "ai_score": ai_score,
-                        "gap": gap,
-                        "best_model": best_ai_domains[domain]["model"]
-                    }
+            criteria_gaps = _gap_table(human_scores["criteria"], best_ai_criteria)
+            domain_gaps = _gap_table(human_scores["domains"], best_ai_domains)
             
             # Calculate overall gap
-            all_gaps = []
-            for gap_data in criteria_gaps.values():
-                all_gaps.append(gap_data["gap"])
-            for gap_data in domain_gaps.values():
-                all_gaps.append(gap_data["gap"])
-            
-            overall_gap = sum(all_gaps) / len(all_gaps) if all_gaps else 0
+            all_gaps = pd.concat([criteria_gaps["gap"], domain_gaps["gap"]])
+            overall_gap = float(all_gaps.mean()) if not all_gaps.empty else 0
             
             results["overall_gap"] = overall_gap
-            results["criteria"] = criteria_gaps
-            results["domains"] = domain_gaps
+            results["criteria"] = criteria_gaps.to_dict(orient="index")
+            results["domains"] = domain_gaps.to_dict(orient="index")
             
             # Save report
-            self.save_analytics_report(
+            results["report_id"] = self.save_analytics_report(
                 "human_ai_gap",
                 "Human vs AI Content Gap Analysis",
                 "Analysis of the performance gap between human and AI-generated content",
                 {
                     "domains": domains
                 },
-                results
+                results,
+                session=session
             )
             
             return results
     
     def save_analytics_report(self, report_type: str, title: str, description: str, 
                             parameters: Dict[str, Any], results: Dict[str, Any], 
-                            user_id: int = None) -> int:
+                            user_id: int = None, session=None) -> int:
         """
         Save an analytics report to the database.
         
@@ -832,90 +962,156 @@ class AnalyticsEngine:
             parameters: Parameters used to generate the report
             results: Report results
             user_id: Optional user ID of the creator
+            session: Optional open session to save the report in
             
         Returns:
             Report ID
         """
+        report_ids = self.save_analytics_reports(
+            [
+                {
+                    "report_type": report_type,
+                    "title": title,
+                    "description": description,
+                    "parameters": parameters,
+                    "results": results,
+                    "user_id": user_id
+                }
+            ],
+            session=session
+        )
+        
+        return report_ids[0] if report_ids else None
+    
+    def save_analytics_reports(self, reports: List[Dict[str, Any]], session=None) -> List[int]:
+        """
+        Save several analytics reports with a single bulk insert.
+        
+        Args:
+            reports: Reports with report_type, title, description, parameters,
+                results and optional user_id keys
+            session: Optional open session to save the reports in
+            
+        Returns:
+            Report IDs in the same order as the reports (empty on failure)
+        """
+        if not reports:
+            return []
+        
+        created_at = datetime.utcnow()
+        rows = [
+            {
+                "report_type": report["report_type"],
+                "title": report["title"],
+                "description": report.get("description"),
+                "parameters": report.get("parameters"),
+                "results": report.get("results"),
+                "created_at": created_at,
+                "created_by": report.get("user_id")
+            }
+            for report in reports
+        ]
+        query = insert(AnalyticsReport).returning(AnalyticsReport.id, sort_by_parameter_order=True)
+        
         try:
-            with get_db_session() as session:
-                report = AnalyticsReport(
-                    report_type=report_type,
-                    title=title,
-                    description=description,
-                    parameters=parameters,
-                    results=results,
-                    created_at=datetime.utcnow(),
-                    created_by=user_id
-                )
-                
-                session.add(report)
-                session.commit()
-                
-                logger.info(f"Saved analytics report ID {report.id} of type {report_type}")
-                return report.id
+            if session is None:
+                with get_db_session() as own_session:
+                    report_ids = list(own_session.scalars(query, rows))
+            else:
+                # Savepoint so a failed save doesn't roll back the caller's work
+                with session.begin_nested():
+                    report_ids = list(session.scalars(query, rows))
+            
+            for report, report_id in zip(reports, report_ids):
+                logger.info(f"Saved analytics report ID {report_id} of type {report['report_type']}")
+            return report_ids
                 
         except Exception as e:
-            logger.error(f"Error saving analytics report: {e}")
-            return None
+            logger.error(f"Error saving analytics reports: {e}")
+            return []
     
-    def get_analytics_report(self, report_id: int) -> Optional[Dict[str, Any]]:
+    def get_analytics_report(self, report_id: int, session=None) -> Optional[Dict[str, Any]]:
         """
         Get a saved analytics report.
         
         Args:
             report_id: Report ID to retrieve
+            session: Optional open session to read from
             
         Returns:
             Report data or None if not found
         """
-        with get_db_session() as session:
-            report = session.query(AnalyticsReport).get(report_id)
-            
-            if not report:
-                return None
-            
-            return {
-                "id": report.id,
-                "report_type": report.report_type,
-                "title": report.title,
-                "description": report.description,
-                "parameters": report.parameters,
-                "results": report.results,
-                "created_at": report.created_at.isoformat()
-            }
+        if session is None:
+            with get_db_session() as session:
+                return self.get_analytics_report(report_id, session=session)
+        
+        report = session.scalars(_REPORT_BY_ID, {"report_id": report_id}).first()
+        
+        if not report:
+            return None
+        
+        return {
+            "id": report.id,
+            "report_type": report.report_type,
+            "title": report.title,
+            "description": report.description,
+            "parameters": report.parameters,
+            "results": report.results,
+            "created_at": report.created_at.isoformat()
+        }
     
-    def get_recent_reports(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_report_owner(self, report_id: int, session=None) -> Tuple[bool, Optional[int]]:
+        """
+        Look up who created a report without loading its parameters and results.
+        
+        Args:
+            report_id: Report ID to look up
+            session: Optional open session to read from
+            
+        Returns:
+            Tuple of (report exists, creator user ID or None)
+        """
+        if session is None:
+            with get_db_session() as session:
+                return self.get_report_owner(report_id, session=session)
+        
+        row = session.execute(_REPORT_OWNER, {"report_id": report_id}).first()
+        
+        if row is None:
+            return False, None
+        
+        return True, row.created_by
+    
+    def get_recent_reports(self, limit: int = 10, session=None) -> List[Dict[str, Any]]:
         """
         Get list of recent analytics reports.
         
         Args:
             limit: Maximum number of reports to return
+            session: Optional open session to read from
             
         Returns:
             List of report summaries
         """
-        with get_db_session() as session:
-            reports = session.query(AnalyticsReport).order_by(
-                AnalyticsReport.created_at.desc()
-            ).limit(limit).all()
-            
-            result = []
-            for report in reports:
-                result.append({
-                    "id": report.id,
-                    "report_type": report.report_type,
-                    "title": report.title,
-                    "description": report.description,
-                    "created_at": report.created_at.isoformat()
-                })
-            
-            return result
+        if session is None:
+            with get_db_session() as session:
+                return self.get_recent_reports(limit, session=session)
+        
+        # Only the summary columns; the JSON parameters and results can be large
+        reports = session.execute(_RECENT_REPORTS, {"limit": limit}).mappings().all()
+        
+        # Second precision is enough for listings and skips microsecond formatting
+        return [
+            {**report, "created_at": report["created_at"].isoformat(timespec="seconds")}
+            for report in reports
+        ]
     
     def get_improvement_suggestions(
         self, 
         model_name: str = None, 
         domain: str = None,
-        status: str = None
+        status: str = None,
+        session=None
     ) -> List[Dict[str, Any]]:
         """
         Get improvement suggestions with optional filters.
@@ -924,47 +1120,40 @@ class AnalyticsEngine:
             model_name: Optional AI model name to filter by
             domain: Optional content domain to filter by
             status: Optional suggestion status to filter by
+            session: Optional open session to read from
             
         Returns:
             List of improvement suggestions
         """
-        with get_db_session() as session:
-            query = session.query(ImprovementSuggestion)
-            
-            if model_name:
-                query = query.filter(ImprovementSuggestion.model_name == model_name)
-            
-            if domain:
-                query = query.filter(ImprovementSuggestion.domain == domain)
-            
-            if status:
-                query = query.filter(ImprovementSuggestion.status == status)
-            
-            # Order by priority and creation date
-            query = query.order_by(
-                case(
-                    (ImprovementSuggestion.priority == 'high', 1),
-                    (ImprovementSuggestion.priority == 'medium', 2),
-                    else_=3
-                ),
-                ImprovementSuggestion.created_at.desc()
-            )
-            
-            suggestions = query.all()
-            
-            result = []
-            for suggestion in suggestions:
-                result.append({
-                    "id": suggestion.id,
-                    "model_name": suggestion.model_name,
-                    "domain": suggestion.domain,
-                    "criterion": suggestion.criterion,
-                    "current_score": suggestion.current_score,
-                    "target_score": suggestion.target_score,
-                    "suggestion": suggestion.suggestion,
-                    "priority": suggestion.priority,
-                    "status": suggestion.status,
-                    "created_at": suggestion.created_at.isoformat()
-                })
-            
-            return result
\ No newline at end of file
+        if session is None:
+            with get_db_session() as session:
+                return self.get_improvement_suggestions(model_name, domain, status, session=session)
+        
+        # Lambda statements are cached by which filters are applied, so each
+        # combination is only built and compiled once per process
+        query = lambda_stmt(lambda: select(*_SUGGESTION_COLUMNS))
+        
+        if model_name:
+            query += lambda q: q.where(ImprovementSuggestion.model_name == model_name)
+        
+        if domain:
+            query += lambda q: q.where(ImprovementSuggestion.domain == domain)
+        
+        if status:
+            query += lambda q: q.where(ImprovementSuggestion.status == status)
+        
+        # Order by priority and creation date
+        query += lambda q: q.order_by(
+            ImprovementSuggestion.priority_rank,
+            ImprovementSuggestion.created_at.desc()
+        )
+        
+        result = []
+        rows = session.execute(query, execution_options={"yield_per": STREAM_BATCH_SIZE})
+        for suggestion in rows.mappings():
+            result.append({
+                **suggestion,
+                "created_at": suggestion["created_at"].isoformat()
+            })
+        
+        return result
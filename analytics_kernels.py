@@ -0,0 +1,79 @@
+"""
+Numeric kernels used by the analytics engine for grouped score reductions.
+
+The kernels are JIT-compiled with numba when it is installed and fall back to
+vectorized numpy otherwise.
+"""
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _group_means_numpy(keys: np.ndarray, sums: np.ndarray, counts: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Compute weighted per-group means with numpy.
+
+    Args:
+        keys: int32 array of group indices, one per row
+        sums: float64 array of score sums, one per row
+        counts: float64 array of score counts, one per row
+        n_groups: Number of distinct groups
+
+    Returns:
+        float64 array with the mean score of each group
+    """
+    total_sums = np.bincount(keys, weights=sums, minlength=n_groups)
+    total_counts = np.bincount(keys, weights=counts, minlength=n_groups)
+    return total_sums / np.maximum(total_counts, 1)
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _group_means_numba(keys, sums, counts, n_groups):
+        # Serial loop: scattered += into shared buckets is not safe under prange
+        total_sums = np.zeros(n_groups)
+        total_counts = np.zeros(n_groups)
+        for i in range(keys.size):
+            total_sums[keys[i]] += sums[i]
+            total_counts[keys[i]] += counts[i]
+        return total_sums / np.maximum(total_counts, 1)
+
+    # Compile once at import so the first request doesn't pay for it
+    try:
+        _group_means_numba(
+            np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.float64), np.ones(1, dtype=np.float64), 1
+        )
+    except Exception as e:
+        logger.warning(f"Disabling numba analytics kernels: {str(e)}")
+        _NUMBA_AVAILABLE = False
+
+
+def group_means(keys: np.ndarray, sums: np.ndarray, counts: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Combine per-row score sums and counts into a weighted mean for each group.
+
+    Args:
+        keys: Group index of each row, in the range [0, n_groups)
+        sums: Score sum of each row
+        counts: Number of scores behind each row's sum
+        n_groups: Number of distinct groups
+
+    Returns:
+        float64 array with the mean score of each group
+    """
+    keys = np.ascontiguousarray(keys, dtype=np.int32)
+    sums = np.ascontiguousarray(sums, dtype=np.float64)
+    counts = np.ascontiguousarray(counts, dtype=np.float64)
+
+    if _NUMBA_AVAILABLE:
+        return _group_means_numba(keys, sums, counts, n_groups)
+
+    return _group_means_numpy(keys, sums, counts, n_groups)
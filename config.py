@@ -26,12 +26,36 @@ elif DB_TYPE == "postgresql":
 else:
     raise ValueError(f"Unsupported database type: {DB_TYPE}")
 
+# Number of compiled SQL statements kept in the engine's LRU statement cache
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "1024"))
+
+# PostgreSQL connection pool settings
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "5"))  # Connections opened at startup
+
+# Rows sent per statement when bulk writes are batched
+DB_BATCH_PAGE_SIZE = int(os.getenv("DB_BATCH_PAGE_SIZE", "500"))
+
 # Application Configuration
 DEBUG = os.getenv("DEBUG", "True").lower() in ["true", "1", "t"]
 SECRET_KEY = os.getenv("SECRET_KEY", "dev-key-replace-in-production")
 APP_HOST = os.getenv("APP_HOST", "0.0.0.0")
 APP_PORT = int(os.getenv("APP_PORT", "5000"))
 
+# Log (or, with NPLUSONE_RAISE, fail on) relationships lazily loaded more than
+# once in a request, which usually means a missing joinedload/selectinload
+NPLUSONE_DETECT = os.getenv("NPLUSONE_DETECT", str(DEBUG)).lower() in ["true", "1", "t"]
+NPLUSONE_RAISE = os.getenv("NPLUSONE_RAISE", "False").lower() in ["true", "1", "t"]
+
+# Logged-in users are reused between requests for this long; role and is_active
+# are still re-read on every request because they drive authorization
+USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "5"))  # Seconds
+
+# Compiled Jinja templates are cached here outside debug mode (default: a per-user temp dir)
+TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR")
+
 # Content Domains
 CONTENT_DOMAINS = [
     "creative_writing",
@@ -69,15 +93,45 @@ EVALUATION_CRITERIA = {
         "scale": [1, 5]
     }
 }
+CRITERIA_CACHE_TTL = int(os.getenv("CRITERIA_CACHE_TTL", "300"))  # Seconds
+# Qualification checks authorize evaluations, so other workers and Core writes
+# may only see a deactivated user or unverified expert for this long
+QUALIFICATION_CACHE_TTL = int(os.getenv("QUALIFICATION_CACHE_TTL", "5"))  # Seconds
 
 # Quality Control Configuration
 MIN_EVALUATION_TIME_SECONDS = 60  # Minimum time an evaluator should spend
 QUALITY_CHECK_FREQUENCY = 0.1  # Frequency of inserting quality check questions
 AGREEMENT_THRESHOLD = 0.7  # Minimum agreement level between evaluators
+QUALITY_ISSUES_CACHE_TTL = int(os.getenv("QUALITY_ISSUES_CACHE_TTL", "300"))  # Seconds
+# How long another worker may keep grading against an edited answer key
+QUALITY_CHECK_ANSWER_CACHE_TTL = int(os.getenv("QUALITY_CHECK_ANSWER_CACHE_TTL", "60"))  # Seconds
+
+# Serve evaluation statistics and dashboard counts from the evaluation_stats and
+# content_stats summary tables instead of counting rows on every request. Writes
+# that bypass the ORM and Evaluator need a `flask rebuild-summaries` afterwards.
+EVALUATION_STATS_SUMMARY = os.getenv("EVALUATION_STATS_SUMMARY", "True").lower() in ["true", "1", "t"]
+EVALUATION_STATS_CACHE_TTL = int(os.getenv("EVALUATION_STATS_CACHE_TTL", "60"))  # Seconds
 
 # Analytics Configuration
 ANALYTICS_DEFAULT_TIMEFRAME = "last_30_days"
 IMPROVEMENT_THRESHOLD = 0.3  # 30% improvement as mentioned in the outline
+HUMAN_BENCHMARK_CACHE_TTL = int(os.getenv("HUMAN_BENCHMARK_CACHE_TTL", "300"))  # Seconds
+# Read model comparison scores from the daily score_rollups table instead of
+# aggregating every evaluation score for each report. Only submit_evaluation()
+# maintains the rollups, so leave this off unless that is the sole write path for
+# scores and quality check results (run `flask rebuild-summaries` after other writes)
+ANALYTICS_SCORE_ROLLUPS = os.getenv("ANALYTICS_SCORE_ROLLUPS", "False").lower() in ["true", "1", "t"]
+AI_MODEL_CACHE_TTL = int(os.getenv("AI_MODEL_CACHE_TTL", "60"))  # Seconds
+DASHBOARD_STATS_CACHE_TTL = int(os.getenv("DASHBOARD_STATS_CACHE_TTL", "30"))  # Seconds
+EXPERT_DASHBOARD_CACHE_TTL = int(os.getenv("EXPERT_DASHBOARD_CACHE_TTL", "30"))  # Seconds
+SYSTEM_STATISTICS_CACHE_TTL = int(os.getenv("SYSTEM_STATISTICS_CACHE_TTL", "60"))  # Seconds
+
+# Background CSV exports
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "2"))
+EXPORT_JOB_TTL = int(os.getenv("EXPORT_JOB_TTL", "3600"))  # Seconds an export stays pollable
+# Export job state shared by all workers; must not be under the static folder,
+# which would publish every job's owner and status
+EXPORT_JOB_DIR = os.getenv("EXPORT_JOB_DIR", "export_jobs")
 
 # API Configuration
 API_VERSION = "v1"
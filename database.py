@@ -2,23 +2,113 @@
 Database initialization and session management for the Generative AI Content Evaluation System.
 """
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy import create_engine, case, cast, delete, event, func, insert, inspect, literal, select, text, union_all, update, Date, Text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from contextlib import contextmanager
+from typing import List
 import logging
+import orjson
 
-from config import DATABASE_URI
-from models import Base, User, ExpertProfile, Content, EvaluationCriterion, Evaluation, EvaluationScore, QualityCheckQuestion, AnalyticsReport, ImprovementSuggestion
+from config import (
+    DB_TYPE, DATABASE_URI, QUERY_CACHE_SIZE, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE,
+    DB_POOL_WARM, DB_BATCH_PAGE_SIZE, EVALUATION_CRITERIA
+)
+from models import Base, User, ExpertProfile, Content, EvaluationCriterion, Evaluation, EvaluationScore, EvaluationStat, ContentStat, ScoreRollup, QualityCheckQuestion, AnalyticsReport, ImprovementSuggestion, PASSED_QC, PRIORITY_RANKS, PRIORITY_LOW
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WAL lets readers run alongside a writer; the rest trade durability on power
+# loss for fewer fsyncs and keep more of the database in memory
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+# Dialect-specific INSERT constructs, which support ON CONFLICT clauses
+DIALECT_INSERTS = {
+    'postgresql': postgresql.insert,
+    'sqlite': sqlite.insert,
+}
+
+# SQL equivalent of PRIORITY_RANKS, used to backfill ranks of older suggestions
+_PRIORITY_RANK_CASE = case(
+    *((ImprovementSuggestion.priority == priority, rank) for priority, rank in PRIORITY_RANKS.items()),
+    else_=PRIORITY_RANKS[PRIORITY_LOW]
+)
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON column values with orjson, which also handles numpy values and datetimes."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create engine and session factory
-engine = create_engine(DATABASE_URI, echo=False)
-session_factory = sessionmaker(bind=engine)
-Session = scoped_session(session_factory)
+engine_options = {}
+if DB_TYPE == "sqlite":
+    # Sessions may be used from Flask worker threads other than the creating one
+    engine_options["connect_args"] = {"check_same_thread": False}
+    if DATABASE_URI in ("sqlite://", "sqlite:///:memory:"):
+        # Each connection would get its own empty in-memory database
+        engine_options["poolclass"] = StaticPool
+elif DB_TYPE == "postgresql":
+    # Keep enough warm connections for concurrent analytics sessions and
+    # replace ones the server may have dropped before handing them out
+    engine_options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE
+    )
+
+# Bulk inserts are sent as multi-row INSERT ... VALUES statements of this many rows
+engine_options["insertmanyvalues_page_size"] = DB_BATCH_PAGE_SIZE
+
+# psycopg2 would otherwise run executemany() UPDATEs and DELETEs one row per
+# round trip; execute_batch pages them instead. Only the sync driver takes these.
+driver_options = {}
+if DB_TYPE == "postgresql":
+    driver_options.update(
+        executemany_mode="values_plus_batch",
+        executemany_batch_page_size=DB_BATCH_PAGE_SIZE
+    )
+
+# The analytics queries are re-issued with the same shape and different
+# parameters, so keep enough compiled statements cached to cover them all
+engine = create_engine(
+    DATABASE_URI,
+    echo=False,
+    query_cache_size=QUERY_CACHE_SIZE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **engine_options,
+    **driver_options
+)
+
+if DB_TYPE == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLITE_PRAGMAS to every new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+# Every get_db_session() gets its own session, and loaded objects stay usable
+# after the commit on exit instead of reloading on first access
+Session = sessionmaker(bind=engine, expire_on_commit=False)
+
+# Read-only Flask views share one session per request (and so at most one pooled
+# connection); main.py closes it with remove_request_session() at teardown
+request_session = scoped_session(Session)
 
 
 @contextmanager
@@ -36,21 +126,46 @@ def get_db_session():
         session.close()
 
 
+@contextmanager
+def get_request_session():
+    """
+    Context manager for the current request's shared, read-only session.
+    
+    Unlike get_db_session(), nothing is committed or closed on exit; the session
+    lives until remove_request_session() runs at the end of the request.
+    """
+    yield request_session()
+
+
+def remove_request_session(exception=None):
+    """Close the current request's session, discarding anything left uncommitted."""
+    request_session.remove()
+
+
 def init_db():
     """Initialize the database by creating all tables if they don't exist."""
     try:
         # Create tables if they don't exist
         Base.metadata.create_all(engine)
+        _add_missing_columns()
+        _create_missing_indexes()
         logger.info("Database tables created successfully")
         
         # Initialize with default data if needed
         with get_db_session() as session:
             # Check if we need to add initial data
-            if session.query(EvaluationCriterion).count() == 0:
+            if _count(session, EvaluationCriterion) == 0:
                 _add_default_criteria(session)
                 
-            if session.query(User).filter_by(username='admin').count() == 0:
+            if _count(session, User, User.username == 'admin') == 0:
                 _create_admin_user(session)
+            
+            _backfill_priority_ranks(session)
+            _backfill_expert_domains(session)
+            
+            # Only fill summary tables that have never been built; recounting
+            # populated ones is left to rebuild_summary_tables()
+            _rebuild_summary_tables(session, only_empty=True)
                 
         logger.info("Database initialized with default data")
         return True
@@ -60,21 +175,264 @@ def init_db():
         return False
 
 
+def score_rollup_query(*criteria):
+    """
+    Build the SELECT that sums completed AI evaluation scores into score_rollups rows.
+    
+    Only evaluations that did not fail quality checks are counted, matching the
+    live analytics queries.
+    
+    Args:
+        *criteria: Additional filters on the evaluations to include
+        
+    Returns:
+        Select yielding model_name, domain, criterion_id, day, score_sum and score_count
+    """
+    day = func.date(Evaluation.completion_time, type_=Date)
+    return select(
+        Content.model_name,
+        Content.domain,
+        EvaluationScore.criterion_id,
+        day,
+        func.sum(EvaluationScore.score),
+        func.count(EvaluationScore.id)
+    ).select_from(
+        EvaluationScore
+    ).join(
+        Evaluation, Evaluation.id == EvaluationScore.evaluation_id
+    ).join(
+        Content, Content.id == Evaluation.content_id
+    ).where(
+        Content.source_type == 'ai',
+        Content.model_name.isnot(None),
+        Evaluation.completion_time.isnot(None),
+        PASSED_QC,
+        *criteria
+    ).group_by(
+        Content.model_name, Content.domain, EvaluationScore.criterion_id, day
+    )
+
+
+def _count_query(model, *criteria):
+    """Build a flat SELECT count(*) over a model's table, without the ORM's subquery wrapping."""
+    return select(func.count()).select_from(model.__table__).where(*criteria)
+
+
+def _count(session, model, *criteria) -> int:
+    """Count the rows of a model's table that match the given criteria."""
+    return session.execute(_count_query(model, *criteria)).scalar()
+
+
+def _add_missing_columns():
+    """Add model columns that are missing from tables created before they were declared."""
+    inspector = inspect(engine)
+    
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            
+            for column in table.columns:
+                if column.name not in existing:
+                    column_sql = CreateColumn(column).compile(dialect=engine.dialect)
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column_sql}"))
+                    logger.info(f"Added missing column {table.name}.{column.name}")
+
+
+def _backfill_priority_ranks(session):
+    """Fill in priority ranks for suggestions saved before the rank column existed."""
+    session.query(ImprovementSuggestion).filter(
+        ImprovementSuggestion.priority_rank.is_(None)
+    ).update(
+        {ImprovementSuggestion.priority_rank: _PRIORITY_RANK_CASE},
+        synchronize_session=False
+    )
+
+
+def _backfill_expert_domains(session):
+    """Rewrite expert domains saved as encoded JSON strings as JSON lists."""
+    # Read the raw stored text so DomainList doesn't hide the old formats
+    rows = session.execute(
+        select(ExpertProfile.id, cast(ExpertProfile.domains, Text)).where(ExpertProfile.domains.isnot(None))
+    ).all()
+    
+    fixes = []
+    for profile_id, raw in rows:
+        try:
+            domains = orjson.loads(raw)
+            if isinstance(domains, list):
+                continue
+            
+            # A list that was JSON-encoded before being stored as JSON
+            if isinstance(domains, str):
+                domains = orjson.loads(domains)
+        except orjson.JSONDecodeError:
+            domains = None
+        
+        fixes.append({"id": profile_id, "domains": domains if isinstance(domains, list) else []})
+    
+    if fixes:
+        session.execute(update(ExpertProfile), fixes)
+        logger.info(f"Converted the expertise domains of {len(fixes)} expert profiles to JSON lists")
+
+
+def rebuild_summary_tables() -> List[str]:
+    """
+    Recount every summary table from the rows it summarizes.
+    
+    The write paths keep the summaries current, so this is only needed after
+    writes that bypass them (manual SQL, bulk imports). Run it as an explicit
+    maintenance step, e.g. ``flask rebuild-summaries``.
+    
+    Returns:
+        Names of the rebuilt tables
+    """
+    with get_db_session() as session:
+        return _rebuild_summary_tables(session)
+
+
+def _rebuild_summary_tables(session, only_empty: bool = False) -> List[str]:
+    """
+    Recount summary tables inside the caller's transaction.
+    
+    Args:
+        session: Database session
+        only_empty: Skip tables that already have rows
+        
+    Returns:
+        Names of the rebuilt tables
+    """
+    rebuilt = []
+    for model, rebuild in _SUMMARY_TABLES:
+        # Hold off concurrent upserts until the recount commits, so none is
+        # lost or counted twice; SQLite already serializes writers
+        if session.get_bind().dialect.name == 'postgresql':
+            session.execute(text(f"LOCK TABLE {model.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+        
+        if only_empty and session.query(session.query(model).exists()).scalar():
+            continue
+        
+        rebuild(session)
+        rebuilt.append(model.__tablename__)
+    
+    if rebuilt:
+        logger.info(f"Rebuilt summary tables: {', '.join(rebuilt)}")
+    return rebuilt
+
+
+def _rebuild_evaluation_stats(session):
+    """Recount the evaluation_stats summary table from the evaluations themselves."""
+    session.execute(delete(EvaluationStat))
+    session.execute(insert(EvaluationStat).from_select(
+        ["evaluator_id", "domain", "source_type", "total", "completed"],
+        select(
+            Evaluation.evaluator_id,
+            Content.domain,
+            Content.source_type,
+            func.count(),
+            func.count(Evaluation.completion_time)
+        ).join(
+            Content, Content.id == Evaluation.content_id
+        ).group_by(
+            Evaluation.evaluator_id, Content.domain, Content.source_type
+        )
+    ))
+
+
+def _rebuild_content_stats(session):
+    """Recount the content_stats summary table from the content itself."""
+    session.execute(delete(ContentStat))
+    session.execute(insert(ContentStat).from_select(
+        ["domain", "source_type", "total"],
+        select(
+            Content.domain, Content.source_type, func.count()
+        ).group_by(
+            Content.domain, Content.source_type
+        )
+    ))
+
+
+def _add_to_content_stats(connection, domain: str, source_type: str, amount: int):
+    """Add to the content_stats count of a domain and source type."""
+    upsert = DIALECT_INSERTS[connection.dialect.name](ContentStat).values(
+        domain=domain, source_type=source_type, total=amount
+    )
+    connection.execute(upsert.on_conflict_do_update(
+        index_elements=["domain", "source_type"],
+        set_={"total": ContentStat.total + upsert.excluded.total}
+    ))
+
+
+# The content_stats listeners below only see ORM unit-of-work writes; Core
+# insert(Content) and bulk update()/delete() need rebuild_summary_tables() afterwards
+@event.listens_for(Content, "after_insert")
+def _count_inserted_content(mapper, connection, target):
+    """Count new content in the same transaction that inserts it."""
+    _add_to_content_stats(connection, target.domain, target.source_type, 1)
+
+
+@event.listens_for(Content, "after_delete")
+def _count_deleted_content(mapper, connection, target):
+    """Stop counting deleted content."""
+    _add_to_content_stats(connection, target.domain, target.source_type, -1)
+
+
+@event.listens_for(Content, "after_update")
+def _count_moved_content(mapper, connection, target):
+    """Move content whose domain or source type changed to its new count."""
+    state = inspect(target)
+    domain = state.attrs.domain.history
+    source_type = state.attrs.source_type.history
+    
+    if not (domain.has_changes() or source_type.has_changes()):
+        return
+    
+    old_domain = domain.deleted[0] if domain.deleted else target.domain
+    old_source_type = source_type.deleted[0] if source_type.deleted else target.source_type
+    _add_to_content_stats(connection, old_domain, old_source_type, -1)
+    _add_to_content_stats(connection, target.domain, target.source_type, 1)
+
+
+def _rebuild_score_rollups(session):
+    """Recompute the score_rollups table from the evaluation scores themselves."""
+    session.execute(delete(ScoreRollup))
+    session.execute(insert(ScoreRollup).from_select(
+        ["model_name", "domain", "criterion_id", "day", "score_sum", "score_count"],
+        score_rollup_query()
+    ))
+
+
+# Summary tables and the functions that recount them from scratch
+_SUMMARY_TABLES = (
+    (EvaluationStat, _rebuild_evaluation_stats),
+    (ScoreRollup, _rebuild_score_rollups),
+    (ContentStat, _rebuild_content_stats),
+)
+
+
+def _create_missing_indexes():
+    """Create model indexes that are missing from tables created before they were declared."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(engine, checkfirst=True)
+            except Exception as e:
+                # e.g. a GIN index on a column that predates its JSONB type
+                logger.warning(f"Could not create index {index.name}: {e}")
+
+
 def _add_default_criteria(session):
     """Add default evaluation criteria."""
-    default_criteria = [
-        EvaluationCriterion(name="accuracy", description="Factual correctness and absence of errors", scale_min=1, scale_max=5),
-        EvaluationCriterion(name="coherence", description="Logical flow and consistency of ideas", scale_min=1, scale_max=5),
-        EvaluationCriterion(name="relevance", description="Appropriateness to the given topic or context", scale_min=1, scale_max=5),
-        EvaluationCriterion(name="creativity", description="Originality and innovative thinking", scale_min=1, scale_max=5),
-        EvaluationCriterion(name="completeness", description="Comprehensive coverage of the subject matter", scale_min=1, scale_max=5),
-        EvaluationCriterion(name="language_quality", description="Grammar, vocabulary, and overall writing quality", scale_min=1, scale_max=5),
-    ]
-    
-    for criterion in default_criteria:
-        session.add(criterion)
+    session.add_all([
+        EvaluationCriterion(
+            name=name,
+            description=spec["description"],
+            scale_min=spec["scale"][0],
+            scale_max=spec["scale"][1]
+        )
+        for name, spec in EVALUATION_CRITERIA.items()
+    ])
     
-    logger.info(f"Added {len(default_criteria)} default evaluation criteria")
+    logger.info(f"Added {len(EVALUATION_CRITERIA)} default evaluation criteria")
 
 
 def _create_admin_user(session):
@@ -97,6 +455,33 @@ def _create_admin_user(session):
     logger.info("Created admin user")
 
 
+def warm_pool(size: int = DB_POOL_WARM) -> int:
+    """
+    Open pooled connections up front so the first requests skip connect and auth.
+    
+    Args:
+        size: Number of connections to open, capped at the pool size
+        
+    Returns:
+        Number of connections opened
+    """
+    if DB_TYPE == "postgresql":
+        size = min(size, DB_POOL_SIZE)
+    
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    except Exception as e:
+        logger.warning(f"Stopped warming the connection pool: {e}")
+    finally:
+        # Closing hands each connection back to the pool, where it stays open
+        for connection in connections:
+            connection.close()
+    
+    return len(connections)
+
+
 def drop_db():
     """Drop all tables from the database."""
     try:
@@ -108,17 +493,36 @@ def drop_db():
         return False
 
 
-def get_model_counts():
-    """Get count of records for each model."""
-    with get_db_session() as session:
-        counts = {
-            "users": session.query(User).count(),
-            "expert_profiles": session.query(ExpertProfile).count(),
-            "contents": session.query(Content).count(),
-            "evaluations": session.query(Evaluation).count(),
-            "evaluation_scores": session.query(EvaluationScore).count(),
-            "quality_check_questions": session.query(QualityCheckQuestion).count(),
-            "analytics_reports": session.query(AnalyticsReport).count(),
-            "improvement_suggestions": session.query(ImprovementSuggestion).count(),
-        }
-        return counts
\ No newline at end of file
+def get_model_counts(session=None):
+    """
+    Get count of records for each model.
+    
+    Args:
+        session: Optional open session to count in
+        
+    Returns:
+        Dictionary of table name to row count
+    """
+    if session is None:
+        with get_db_session() as session:
+            return get_model_counts(session=session)
+    
+    models = {
+        "users": User,
+        "expert_profiles": ExpertProfile,
+        "contents": Content,
+        "evaluations": Evaluation,
+        "evaluation_scores": EvaluationScore,
+        "quality_check_questions": QualityCheckQuestion,
+        "analytics_reports": AnalyticsReport,
+        "improvement_suggestions": ImprovementSuggestion,
+    }
+    
+    # Count every table in one round trip
+    query = union_all(*(
+        _count_query(model).add_columns(literal(name))
+        for name, model in models.items()
+    ))
+    
+    counts = {name: count for count, name in session.execute(query)}
+    return {name: counts[name] for name in models}
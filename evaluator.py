@@ -2,23 +2,303 @@
 Core evaluation logic for the Generative AI Content Evaluation System.
 """
 import logging
+import threading
+from collections import defaultdict, namedtuple
 from datetime import datetime
-import random
-import json
 from typing import Dict, List, Optional, Tuple, Any
 
-from database import get_db_session
+from cachetools import TTLCache
+from sqlalchemy import func, cast, event, insert, literal, select, update, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from analytics import get_criteria_names, clear_human_benchmark_cache
+from database import get_db_session, score_rollup_query, DIALECT_INSERTS
 from models import (
-    Content, Evaluation, EvaluationScore, EvaluationCriterion,
+    Content, Evaluation, EvaluationScore, EvaluationStat, EvaluationCriterion, ScoreRollup,
     QualityCheckQuestion, User, ExpertProfile
 )
 from quality_control import QualityController
-from config import CONTENT_DOMAINS, EVALUATION_CRITERIA
+from config import (
+    CONTENT_DOMAINS, EVALUATION_CRITERIA, CRITERIA_CACHE_TTL, EVALUATION_STATS_SUMMARY,
+    EVALUATION_STATS_CACHE_TTL, QUALIFICATION_CACHE_TTL
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows fetched per batch when streaming potentially large result sets
+STREAM_BATCH_SIZE = 1000
+
+# Read-only copy of an evaluation criterion that is safe to share between sessions
+CriterionInfo = namedtuple(
+    "CriterionInfo", ["id", "name", "description", "scale_min", "scale_max", "domain"]
+)
+
+# Criteria rarely change, so they are cached per domain between requests
+_criteria_cache = TTLCache(maxsize=64, ttl=CRITERIA_CACHE_TTL)
+_criteria_lock = threading.Lock()
+
+
+# Evaluation statistics per user (None for everyone), dropped when that user's evaluations change
+_statistics_cache = TTLCache(maxsize=1024, ttl=EVALUATION_STATS_CACHE_TTL)
+_statistics_lock = threading.Lock()
+
+# Qualification checks per (user, domain); kept short because they authorize
+# evaluations and writes in other processes never invalidate this copy
+_qualification_cache = TTLCache(maxsize=4096, ttl=QUALIFICATION_CACHE_TTL)
+_qualification_lock = threading.Lock()
+
+
+@event.listens_for(EvaluationCriterion, "after_insert")
+@event.listens_for(EvaluationCriterion, "after_update")
+@event.listens_for(EvaluationCriterion, "after_delete")
+def _invalidate_criteria_cache(mapper, connection, target):
+    """Drop cached criteria whenever a criterion is added, changed or removed."""
+    clear_criteria_cache()
+
+
+def clear_criteria_cache():
+    """Drop all cached evaluation criteria, including the analytics name map."""
+    with _criteria_lock:
+        _criteria_cache.clear()
+    get_criteria_names.cache_clear()
+
+
+def _forget_evaluation_statistics(*user_ids: int):
+    """Drop the cached statistics of the given users and the system-wide totals."""
+    with _statistics_lock:
+        for user_id in (None, *user_ids):
+            _statistics_cache.pop(user_id, None)
+
+
+def _is_qualified(user_id: int, domain: str) -> bool:
+    """
+    Check if a user may evaluate a domain.
+    
+    Answers are cached for QUALIFICATION_CACHE_TTL seconds and dropped early when
+    a user or expert profile changes through the ORM in this process.
+    
+    Args:
+        user_id: User ID to check
+        domain: Content domain
+        
+    Returns:
+        Boolean indicating if user is qualified
+    """
+    with _qualification_lock:
+        cached = _qualification_cache.get((user_id, domain))
+    
+    if cached is not None:
+        return cached
+    
+    qualified = _load_qualification(user_id, domain)
+    
+    with _qualification_lock:
+        _qualification_cache[(user_id, domain)] = qualified
+    
+    return qualified
+
+
+def _load_qualification(user_id: int, domain: str) -> bool:
+    """Look up whether a user is active and an admin or a verified expert in a domain."""
+    with get_db_session() as session:
+        # Check if user exists and is active
+        role = session.query(User.role).filter(
+            User.id == user_id,
+            User.is_active == True
+        ).scalar()
+        
+        if role is None:
+            return False
+        
+        # Admins can evaluate any domain
+        if role == 'admin':
+            return True
+        
+        # Check expert profile
+        domains = session.query(ExpertProfile.domains).filter(
+            ExpertProfile.user_id == user_id,
+            ExpertProfile.verified == True
+        ).scalar()
+        
+        # Check if domain is in expertise domains
+        return domain in domains if domains else False
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+@event.listens_for(ExpertProfile, "after_insert")
+@event.listens_for(ExpertProfile, "after_update")
+@event.listens_for(ExpertProfile, "after_delete")
+def _invalidate_qualifications(mapper, connection, target):
+    """Drop cached qualifications whenever a user or expert profile changes."""
+    with _qualification_lock:
+        _qualification_cache.clear()
+
+
+def _has_domain(session, domain: str):
+    """
+    Build a filter matching expert profiles whose domains list contains a domain.
+    
+    Args:
+        session: Session the filter will be executed with
+        domain: Content domain to look for
+        
+    Returns:
+        SQL expression for use in a query filter
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        # JSONB containment, served by the ix_expert_domains GIN index
+        return cast(ExpertProfile.domains, JSONB).contains([domain])
+    
+    # Other backends store the list as JSON text, where each domain is quoted
+    return cast(ExpertProfile.domains, String).contains(f'"{domain}"', autoescape=True)
+
+
+def _seconds_between(session, start, end: datetime):
+    """
+    Build an expression for the whole seconds from a datetime column to a point in time.
+    
+    Args:
+        session: Session the expression will be executed with
+        start: Datetime column to measure from
+        end: Point in time to measure to
+        
+    Returns:
+        SQL integer expression
+    """
+    end = literal(end, DateTime)
+    
+    if session.get_bind().dialect.name == 'postgresql':
+        return cast(func.floor(func.extract('epoch', end - start)), Integer)
+    
+    # SQLite stores datetimes as text, which julianday() parses into days. The
+    # float day fraction is a few microseconds off, so round to milliseconds
+    # before truncating, or an exact 60s interval can come out as 59
+    return cast(func.round((func.julianday(end) - func.julianday(start)) * 86400, 3), Integer)
+
+
+def _submission_error(session, evaluation_id: int) -> Optional[str]:
+    """
+    Explain why an evaluation cannot be submitted.
+    
+    Args:
+        session: Database session
+        evaluation_id: ID of the evaluation
+        
+    Returns:
+        Error message, or None if the evaluation exists and is not completed yet
+    """
+    row = session.query(Evaluation.completion_time).filter(Evaluation.id == evaluation_id).first()
+    
+    if row is None:
+        return f"Evaluation ID {evaluation_id} not found"
+    
+    if row.completion_time is not None:
+        return f"Evaluation ID {evaluation_id} already completed"
+    
+    return None
+
+
+def _add_to_evaluation_stats(session, *criteria, total: int = 0, completed: int = 0):
+    """
+    Count evaluations towards the evaluation_stats summary of their evaluator and content.
+    
+    Args:
+        session: Session to run the upsert in, inside the caller's transaction
+        *criteria: Filters selecting the evaluations to count
+        total: Amount to add to the total of each evaluation's summary row
+        completed: Amount to add to the completed count of each evaluation's summary row
+    """
+    evaluations = select(
+        Evaluation.evaluator_id,
+        Content.domain,
+        Content.source_type,
+        literal(total, Integer),
+        literal(completed, Integer)
+    ).join(
+        Content, Content.id == Evaluation.content_id
+    ).where(*criteria)
+    
+    upsert = DIALECT_INSERTS[session.get_bind().dialect.name](EvaluationStat).from_select(
+        ["evaluator_id", "domain", "source_type", "total", "completed"],
+        evaluations
+    )
+    session.execute(upsert.on_conflict_do_update(
+        index_elements=["evaluator_id", "domain", "source_type"],
+        set_={
+            "total": EvaluationStat.total + upsert.excluded.total,
+            "completed": EvaluationStat.completed + upsert.excluded.completed
+        }
+    ))
+
+
+def _add_to_score_rollups(session, *criteria):
+    """
+    Add the scores of newly completed evaluations to the score_rollups table.
+    
+    Args:
+        session: Session to run the upsert in, inside the caller's transaction
+        *criteria: Filters selecting the evaluations whose scores to add
+    """
+    upsert = DIALECT_INSERTS[session.get_bind().dialect.name](ScoreRollup).from_select(
+        ["model_name", "domain", "criterion_id", "day", "score_sum", "score_count"],
+        score_rollup_query(*criteria)
+    )
+    session.execute(upsert.on_conflict_do_update(
+        index_elements=["model_name", "domain", "criterion_id", "day"],
+        set_={
+            "score_sum": ScoreRollup.score_sum + upsert.excluded.score_sum,
+            "score_count": ScoreRollup.score_count + upsert.excluded.score_count
+        }
+    ))
+
+
+def _content_for_evaluation_query(
+    domain: str = None,
+    source_type: str = None,
+    model_name: str = None,
+    exclude_ids: List[int] = None
+):
+    """
+    Build the statement picking the least-evaluated content that matches the filters.
+    
+    Args:
+        domain: Content domain (e.g., creative_writing)
+        source_type: 'ai' or 'human'
+        model_name: Specific AI model to filter by
+        exclude_ids: List of content IDs to exclude
+        
+    Returns:
+        Select statement yielding at most one Content
+    """
+    query = select(Content)
+    
+    if domain:
+        query = query.where(Content.domain == domain)
+    
+    if source_type:
+        query = query.where(Content.source_type == source_type)
+    
+    if model_name:
+        query = query.where(Content.model_name == model_name)
+    
+    if exclude_ids:
+        query = query.where(~Content.id.in_(exclude_ids))
+    
+    # Count existing evaluations of each candidate only; the correlated
+    # count is an index lookup on evaluations.content_id per candidate
+    # rather than an aggregate over every evaluation in the table
+    eval_count = select(func.count(Evaluation.id)).where(
+        Evaluation.content_id == Content.id
+    ).correlate(Content).scalar_subquery()
+    
+    # Prioritize contents with fewer evaluations, breaking ties randomly
+    # for fair distribution
+    return query.order_by(eval_count, func.random()).limit(1)
+
 
 class Evaluator:
     """
@@ -48,60 +328,53 @@ class Evaluator:
         Returns:
             Content object or None if no suitable content is found
         """
+        query = _content_for_evaluation_query(domain, source_type, model_name, exclude_ids)
+        
         with get_db_session() as session:
-            query = session.query(Content)
-            
-            if domain:
-                query = query.filter(Content.domain == domain)
-            
-            if source_type:
-                query = query.filter(Content.source_type == source_type)
-            
-            if model_name:
-                query = query.filter(Content.model_name == model_name)
-            
-            if exclude_ids:
-                query = query.filter(~Content.id.in_(exclude_ids))
-            
-            # Get contents that need more evaluations first
-            contents = query.all()
-            
-            if not contents:
-                return None
-            
-            # Sort by number of existing evaluations (prioritize those with fewer)
-            contents_with_counts = []
-            for content in contents:
-                eval_count = session.query(Evaluation).filter(
-                    Evaluation.content_id == content.id
-                ).count()
-                contents_with_counts.append((content, eval_count))
-            
-            # Sort by evaluation count and add some randomness for fair distribution
-            contents_with_counts.sort(key=lambda x: (x[1], random.random()))
-            
-            return contents_with_counts[0][0] if contents_with_counts else None
+            return session.scalars(query).first()
 
-    def get_evaluation_criteria(self, domain: str = None) -> List[EvaluationCriterion]:
+    def get_evaluation_criteria(self, domain: str = None) -> List[CriterionInfo]:
         """
         Get evaluation criteria, optionally filtered by domain.
         
+        Results are cached per domain for CRITERIA_CACHE_TTL seconds and dropped
+        whenever a criterion is inserted, updated or deleted through the ORM.
+        
         Args:
             domain: Content domain to get specific criteria for
             
         Returns:
-            List of EvaluationCriterion objects
+            List of CriterionInfo tuples
         """
+        key = domain or None
+        
+        with _criteria_lock:
+            cached = _criteria_cache.get(key)
+        
+        if cached is not None:
+            return list(cached)
+        
         with get_db_session() as session:
-            query = session.query(EvaluationCriterion)
+            query = session.query(
+                EvaluationCriterion.id,
+                EvaluationCriterion.name,
+                EvaluationCriterion.description,
+                EvaluationCriterion.scale_min,
+                EvaluationCriterion.scale_max,
+                EvaluationCriterion.domain
+            )
             
             if domain:
                 # Get both domain-specific and general criteria
                 query = query.filter((EvaluationCriterion.domain == domain) | 
                                     (EvaluationCriterion.domain.is_(None)))
             
-            criteria = query.all()
-            return criteria
+            criteria = tuple(CriterionInfo(*row) for row in query.all())
+        
+        with _criteria_lock:
+            _criteria_cache[key] = criteria
+        
+        return list(criteria)
 
     def start_evaluation(
         self, 
@@ -119,36 +392,45 @@ class Evaluator:
             Evaluation ID if successful, None otherwise
         """
         with get_db_session() as session:
-            # Check if user and content exist
-            user = session.query(User).get(user_id)
-            content = session.query(Content).get(content_id)
+            # Check if user and content exist, without loading either row
+            user_exists = session.query(User.id).filter(User.id == user_id).exists()
+            content_exists = session.query(Content.id).filter(Content.id == content_id).exists()
             
-            if not user or not content:
-                logger.error(f"User ID {user_id} or Content ID {content_id} not found")
+            if not session.query(user_exists & content_exists).scalar():
+                logger.error("User ID %s or Content ID %s not found", user_id, content_id)
                 return None
             
             # Check if this user already evaluated this content
-            existing = session.query(Evaluation).filter(
+            existing = session.query(Evaluation.id).filter(
                 Evaluation.evaluator_id == user_id,
                 Evaluation.content_id == content_id
-            ).first()
+            ).limit(1)
+            existing_id = existing.scalar()
+            
+            if existing_id is not None:
+                logger.warning("User %s already evaluated content %s", user_id, content_id)
+                return existing_id
+            
+            # Create new evaluation record; ix_eval_evaluator_content turns a
+            # concurrent start for the same pair into a no-op instead of a duplicate
+            evaluation_id = session.execute(
+                DIALECT_INSERTS[session.get_bind().dialect.name](Evaluation).values(
+                    evaluator_id=user_id,
+                    content_id=content_id,
+                    start_time=datetime.utcnow()
+                ).on_conflict_do_nothing().returning(Evaluation.id)
+            ).scalar()
             
-            if existing:
-                logger.warning(f"User {user_id} already evaluated content {content_id}")
-                return existing.id
+            if evaluation_id is None:
+                logger.warning("User %s already evaluated content %s", user_id, content_id)
+                return existing.scalar()
             
-            # Create new evaluation record
-            evaluation = Evaluation(
-                evaluator_id=user_id,
-                content_id=content_id,
-                start_time=datetime.utcnow()
-            )
-            
-            session.add(evaluation)
+            _add_to_evaluation_stats(session, Evaluation.id == evaluation_id, total=1)
             session.commit()
+            _forget_evaluation_statistics(user_id)
             
-            logger.info(f"Started evaluation ID {evaluation.id} for user {user_id} on content {content_id}")
-            return evaluation.id
+            logger.info("Started evaluation ID %s for user %s on content %s", evaluation_id, user_id, content_id)
+            return evaluation_id
 
     def submit_evaluation(
         self,
@@ -172,59 +454,86 @@ class Evaluator:
             Tuple of (success, message)
         """
         with get_db_session() as session:
-            evaluation = session.query(Evaluation).get(evaluation_id)
-            
-            if not evaluation:
-                return False, f"Evaluation ID {evaluation_id} not found"
-            
-            if evaluation.completion_time:
-                return False, f"Evaluation ID {evaluation_id} already completed"
-            
-            # Calculate duration
-            now = datetime.utcnow()
-            duration = (now - evaluation.start_time).total_seconds()
-            
-            # Check quality control requirements
+            # Check quality control requirements, but only for evaluations that
+            # can still be submitted
             passed_checks = True
             if quality_check_answers:
+                error = _submission_error(session, evaluation_id)
+                if error:
+                    return False, error
+                
                 passed_checks = self.quality_controller.validate_quality_checks(
                     quality_check_answers
                 )
             
-            # Update evaluation record
-            evaluation.completion_time = now
-            evaluation.duration_seconds = int(duration)
-            evaluation.overall_rating = overall_rating
-            evaluation.comments = comments
-            evaluation.passed_quality_checks = passed_checks
+            # Complete the evaluation in one statement; the completion_time
+            # condition also stops two concurrent submits from both succeeding
+            now = datetime.utcnow()
+            submitted = session.execute(
+                update(Evaluation).where(
+                    Evaluation.id == evaluation_id,
+                    Evaluation.completion_time.is_(None)
+                ).values(
+                    completion_time=now,
+                    duration_seconds=_seconds_between(session, Evaluation.start_time, now),
+                    overall_rating=overall_rating,
+                    comments=comments,
+                    passed_quality_checks=passed_checks
+                ).returning(
+                    Evaluation.evaluator_id,
+                    select(Content.source_type).where(
+                        Content.id == Evaluation.content_id
+                    ).scalar_subquery()
+                ).execution_options(synchronize_session=False)
+            ).first()
+            
+            if submitted is None:
+                return False, _submission_error(session, evaluation_id)
+            evaluator_id, source_type = submitted
+            
+            _add_to_evaluation_stats(session, Evaluation.id == evaluation_id, completed=1)
+            
+            # Load all referenced criteria at once
+            criteria = {
+                criterion.id: criterion
+                for criterion in session.query(EvaluationCriterion).filter(
+                    EvaluationCriterion.id.in_(list(scores.keys()))
+                )
+            }
             
             # Add individual scores
+            score_rows = []
             for criterion_id, score in scores.items():
                 # Validate criterion exists
-                criterion = session.query(EvaluationCriterion).get(criterion_id)
+                criterion = criteria.get(criterion_id)
                 if not criterion:
-                    logger.warning(f"Criterion ID {criterion_id} not found")
+                    logger.warning("Criterion ID %s not found", criterion_id)
                     continue
                 
                 # Validate score is within range
                 if score < criterion.scale_min or score > criterion.scale_max:
                     logger.warning(
-                        f"Score {score} out of range for criterion {criterion_id} "
-                        f"({criterion.scale_min}-{criterion.scale_max})"
+                        "Score %s out of range for criterion %s (%s-%s)",
+                        score, criterion_id, criterion.scale_min, criterion.scale_max
                     )
                     continue
                 
                 # Create score record
-                score_record = EvaluationScore(
-                    evaluation_id=evaluation_id,
-                    criterion_id=criterion_id,
-                    score=score
-                )
-                session.add(score_record)
+                score_rows.append({
+                    "evaluation_id": evaluation_id,
+                    "criterion_id": criterion_id,
+                    "score": score
+                })
             
+            if score_rows:
+                session.execute(insert(EvaluationScore), score_rows)
+                _add_to_score_rollups(session, Evaluation.id == evaluation_id)
             session.commit()
+            _forget_evaluation_statistics(evaluator_id)
+            if source_type == 'human':
+                clear_human_benchmark_cache()
             
-            logger.info(f"Completed evaluation ID {evaluation_id}")
+            logger.info("Completed evaluation ID %s", evaluation_id)
             return True, "Evaluation submitted successfully"
 
     def get_pending_evaluations(self, user_id: int) -> List[Dict[str, Any]]:
@@ -238,21 +547,29 @@ class Evaluator:
             List of pending evaluation details
         """
         with get_db_session() as session:
-            evaluations = session.query(Evaluation).filter(
+            # Join the content and fetch only the columns shown in the list
+            evaluations = session.query(
+                Evaluation.id,
+                Evaluation.start_time,
+                Content.id,
+                Content.title,
+                Content.domain
+            ).join(
+                Content, Content.id == Evaluation.content_id
+            ).filter(
                 Evaluation.evaluator_id == user_id,
                 Evaluation.completion_time.is_(None)
-            ).all()
+            ).yield_per(STREAM_BATCH_SIZE)
             
             result = []
-            for eval in evaluations:
-                content = session.query(Content).get(eval.content_id)
+            for evaluation_id, start_time, content_id, title, domain in evaluations:
                 result.append({
-                    "evaluation_id": eval.id,
-                    "content_id": content.id,
-                    "title": content.title,
-                    "domain": content.domain,
-                    "start_time": eval.start_time.isoformat(),
-                    "elapsed_seconds": (datetime.utcnow() - eval.start_time).total_seconds()
+                    "evaluation_id": evaluation_id,
+                    "content_id": content_id,
+                    "title": title,
+                    "domain": domain,
+                    "start_time": start_time.isoformat(),
+                    "elapsed_seconds": (datetime.utcnow() - start_time).total_seconds()
                 })
             
             return result
@@ -261,41 +578,64 @@ class Evaluator:
         """
         Get evaluation statistics, optionally filtered by user.
         
+        Results are cached for EVALUATION_STATS_CACHE_TTL seconds and dropped
+        when the user starts, submits or is assigned an evaluation.
+        
         Args:
             user_id: Optional user ID to filter by
             
         Returns:
             Dictionary of statistics
         """
+        user_id = user_id or None
+        with _statistics_lock:
+            cached = _statistics_cache.get(user_id)
+        
+        if cached is not None:
+            return cached
+        
         with get_db_session() as session:
-            query = session.query(Evaluation)
-            
-            if user_id:
-                query = query.filter(Evaluation.evaluator_id == user_id)
-            
-            total_evaluations = query.count()
-            completed_evaluations = query.filter(
-                Evaluation.completion_time.isnot(None)
-            ).count()
-            
-            # Get domain statistics
-            domains = {}
-            contents = session.query(Content).join(
-                Evaluation, Content.id == Evaluation.content_id
-            )
-            
-            if user_id:
-                contents = contents.filter(Evaluation.evaluator_id == user_id)
-            
-            for domain in CONTENT_DOMAINS:
-                domain_count = contents.filter(Content.domain == domain).count()
-                domains[domain] = domain_count
+            if EVALUATION_STATS_SUMMARY:
+                # Read the running counts kept up to date by the evaluation writes
+                query = session.query(
+                    EvaluationStat.domain,
+                    EvaluationStat.source_type,
+                    func.sum(EvaluationStat.total),
+                    func.sum(EvaluationStat.completed)
+                ).group_by(EvaluationStat.domain, EvaluationStat.source_type)
+                
+                if user_id:
+                    query = query.filter(EvaluationStat.evaluator_id == user_id)
+            else:
+                # Count the evaluations themselves
+                query = session.query(
+                    Content.domain,
+                    Content.source_type,
+                    func.count(Evaluation.id),
+                    func.count(Evaluation.completion_time)
+                ).join(
+                    Evaluation, Content.id == Evaluation.content_id
+                ).group_by(Content.domain, Content.source_type)
+                
+                if user_id:
+                    query = query.filter(Evaluation.evaluator_id == user_id)
+            
+            # Fold the (domain, source type) counts into the separate distributions
+            total_evaluations = 0
+            completed_evaluations = 0
+            domains = dict.fromkeys(CONTENT_DOMAINS, 0)
+            source_counts = defaultdict(int)
+            for domain, source_type, total, completed in query:
+                total_evaluations += total
+                completed_evaluations += completed
+                if domain in domains:
+                    domains[domain] += total
+                source_counts[source_type] += total
             
-            # Get AI vs human statistics
-            ai_content = contents.filter(Content.source_type == 'ai').count()
-            human_content = contents.filter(Content.source_type == 'human').count()
+            ai_content = source_counts['ai']
+            human_content = source_counts['human']
             
-            return {
+            statistics = {
                 "total_evaluations": total_evaluations,
                 "completed_evaluations": completed_evaluations,
                 "completion_rate": round(completed_evaluations / total_evaluations * 100, 1) if total_evaluations else 0,
@@ -305,6 +645,11 @@ class Evaluator:
                     "human": human_content
                 }
             }
+        
+        with _statistics_lock:
+            _statistics_cache[user_id] = statistics
+        
+        return statistics
 
     def get_expert_qualification(self, user_id: int, domain: str) -> bool:
         """
@@ -317,38 +662,7 @@ class Evaluator:
         Returns:
             Boolean indicating if user is qualified
         """
-        with get_db_session() as session:
-            # Check if user exists and is active
-            user = session.query(User).filter(
-                User.id == user_id,
-                User.is_active == True
-            ).first()
-            
-            if not user:
-                return False
-            
-            # Admins can evaluate any domain
-            if user.role == 'admin':
-                return True
-            
-            # Check expert profile
-            profile = session.query(ExpertProfile).filter(
-                ExpertProfile.user_id == user_id,
-                ExpertProfile.verified == True
-            ).first()
-            
-            if not profile:
-                return False
-            
-            # Check if domain is in expertise domains
-            domains = profile.domains
-            if isinstance(domains, str):
-                try:
-                    domains = json.loads(domains)
-                except:
-                    domains = []
-            
-            return domain in domains if domains else False
+        return _is_qualified(user_id, domain)
 
     def assign_content_to_experts(self, content_id: int, domain: str) -> List[int]:
         """
@@ -364,55 +678,53 @@ class Evaluator:
         evaluation_ids = []
         
         with get_db_session() as session:
-            # Find qualified experts
-            expert_profiles = session.query(ExpertProfile).filter(
-                ExpertProfile.verified == True
-            ).all()
-            
-            qualified_experts = []
-            for profile in expert_profiles:
-                domains = profile.domains
-                if isinstance(domains, str):
-                    try:
-                        domains = json.loads(domains)
-                    except:
-                        domains = []
-                
-                if domain in domains:
-                    # Check if user is active
-                    user = session.query(User).filter(
-                        User.id == profile.user_id,
-                        User.is_active == True
-                    ).first()
-                    
-                    if user:
-                        qualified_experts.append(user.id)
-            
-            logger.info(f"Found {len(qualified_experts)} qualified experts for domain {domain}")
-            
-            # Create evaluation assignments
-            for expert_id in qualified_experts:
-                # Check if already assigned
-                existing = session.query(Evaluation).filter(
-                    Evaluation.evaluator_id == expert_id,
-                    Evaluation.content_id == content_id
-                ).first()
-                
-                if existing:
-                    evaluation_ids.append(existing.id)
-                    continue
+            # Find verified, active experts in this domain together with their
+            # existing assignment of this content, if any
+            experts = session.query(ExpertProfile.user_id, Evaluation.id).join(
+                User, User.id == ExpertProfile.user_id
+            ).outerjoin(
+                Evaluation,
+                (Evaluation.evaluator_id == ExpertProfile.user_id) & (Evaluation.content_id == content_id)
+            ).filter(
+                ExpertProfile.verified == True,
+                User.is_active == True,
+                _has_domain(session, domain)
+            ).yield_per(STREAM_BATCH_SIZE)
+            
+            existing = {}
+            for expert_id, evaluation_id in experts:
+                existing.setdefault(expert_id, evaluation_id)
+            qualified_experts = list(existing)
+            
+            logger.info("Found %s qualified experts for domain %s", len(qualified_experts), domain)
+            
+            if not qualified_experts:
+                return evaluation_ids
+            
+            # Create the missing evaluation assignments with one bulk insert
+            now = datetime.utcnow()
+            new_experts = [expert_id for expert_id in qualified_experts if existing[expert_id] is None]
+            rows = [
+                {"evaluator_id": expert_id, "content_id": content_id, "start_time": now}
+                for expert_id in new_experts
+            ]
+            
+            if rows:
+                query = insert(Evaluation).returning(Evaluation.id, sort_by_parameter_order=True)
+                existing.update(zip(new_experts, session.scalars(query, rows)))
                 
-                # Create new evaluation
-                evaluation = Evaluation(
-                    evaluator_id=expert_id,
-                    content_id=content_id,
-                    start_time=datetime.utcnow()
+                _add_to_evaluation_stats(
+                    session,
+                    Evaluation.content_id == content_id,
+                    Evaluation.evaluator_id.in_(new_experts),
+                    total=1
                 )
-                
-                session.add(evaluation)
-                session.flush()
-                evaluation_ids.append(evaluation.id)
+            
+            evaluation_ids.extend(existing[expert_id] for expert_id in qualified_experts)
             
             session.commit()
+            
+            if new_experts:
+                _forget_evaluation_statistics(*new_experts)
         
         return evaluation_ids
\ No newline at end of file
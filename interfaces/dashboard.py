@@ -1,10 +1,18 @@
 """
 Dashboard routes for the Generative AI Content Evaluation System.
 """
+import json
 import logging
-from datetime import datetime, timedelta
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, g
 from flask_login import login_required, current_user
+from cachetools import TTLCache
+from sqlalchemy import event, func, select, tuple_
+from sqlalchemy.orm import joinedload, load_only
 from flask_wtf import FlaskForm
 from wtforms import StringField, SelectField, SelectMultipleField, SubmitField
 from wtforms.validators import Optional
@@ -12,13 +20,19 @@ from wtforms.validators import Optional
 from database import get_db_session
 from models import (
     User, Content, Evaluation, EvaluationCriterion, EvaluationScore,
-    AnalyticsReport, ImprovementSuggestion
+    AnalyticsReport, ImprovementSuggestion, ContentStat, EvaluationStat, STATUS_OPEN
+)
+from config import (
+    CONTENT_DOMAINS, AI_MODEL_CACHE_TTL, DASHBOARD_STATS_CACHE_TTL, EXPORT_WORKERS, EXPORT_JOB_TTL, EXPORT_JOB_DIR,
+    EVALUATION_STATS_SUMMARY
 )
-from config import CONTENT_DOMAINS
 from evaluator import Evaluator
 from quality_control import QualityController
 from analytics import AnalyticsEngine
-from utils import truncate_text, format_timestamp, get_domain_label, export_evaluations_to_csv
+from utils import (
+    truncate_text, format_timestamp, export_evaluations_to_csv,
+    parse_page_cursor, format_page_cursor, DOMAIN_CHOICES, DOMAIN_CHOICES_WITH_ALL
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -32,6 +46,100 @@ evaluator = Evaluator()
 quality_controller = QualityController()
 analytics_engine = AnalyticsEngine()
 
+# Report listings only show these columns; the JSON parameters and results can be large
+REPORT_LIST_COLUMNS = (
+    AnalyticsReport.id,
+    AnalyticsReport.report_type,
+    AnalyticsReport.title,
+    AnalyticsReport.description,
+    AnalyticsReport.created_at,
+    AnalyticsReport.created_by
+)
+
+# The list of AI model names backs several filter dropdowns and rarely changes
+_ai_model_cache = TTLCache(maxsize=1, ttl=AI_MODEL_CACHE_TTL)
+_ai_model_lock = threading.Lock()
+
+
+@event.listens_for(Content, "after_insert")
+@event.listens_for(Content, "after_update")
+@event.listens_for(Content, "after_delete")
+def _invalidate_ai_model_cache(mapper, connection, target):
+    """Drop the cached AI model names whenever content is added, changed or removed."""
+    with _ai_model_lock:
+        _ai_model_cache.clear()
+
+# The dashboard stats API is polled and shows the same system-wide numbers to everyone
+_dashboard_stats_cache = TTLCache(maxsize=1, ttl=DASHBOARD_STATS_CACHE_TTL)
+_dashboard_stats_lock = threading.Lock()
+
+# Exported CSV files are served from here as static files
+EXPORT_DIR = 'static/exports'
+os.makedirs(EXPORT_DIR, exist_ok=True)
+
+# CSV exports run on a small worker pool; jobs stay pollable for EXPORT_JOB_TTL seconds
+_export_executor = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix="csv-export")
+os.makedirs(EXPORT_JOB_DIR, exist_ok=True)
+
+
+def _export_job_path(job_id: str) -> str:
+    """Path of the state file of an export job, shared by all workers through EXPORT_JOB_DIR."""
+    return os.path.join(EXPORT_JOB_DIR, f'{job_id}.json')
+
+
+def _save_export_job(job_id: str, **state):
+    """Write the state of an export job, replacing it atomically so readers never see half a file."""
+    path = _export_job_path(job_id)
+    with open(f'{path}.tmp', 'w') as f:
+        json.dump(state, f)
+    os.replace(f'{path}.tmp', path)
+
+
+def _load_export_job(job_id: str):
+    """Read the state of an export job, or None if it is unknown or older than EXPORT_JOB_TTL."""
+    path = _export_job_path(job_id)
+    try:
+        if time.time() - os.path.getmtime(path) > EXPORT_JOB_TTL:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _purge_export_jobs():
+    """Delete export jobs older than EXPORT_JOB_TTL, together with their CSV files."""
+    cutoff = time.time() - EXPORT_JOB_TTL
+    for entry in os.scandir(EXPORT_JOB_DIR):
+        try:
+            if entry.stat().st_mtime >= cutoff:
+                continue
+            
+            if entry.name.endswith('.json'):
+                with open(entry.path) as f:
+                    filename = json.load(f).get('filename')
+                if filename and os.path.exists(os.path.join(EXPORT_DIR, filename)):
+                    os.remove(os.path.join(EXPORT_DIR, filename))
+            
+            os.remove(entry.path)
+        except (OSError, ValueError):
+            # Another worker purged it first, or the state file is unreadable
+            continue
+
+
+def _run_export(job_id: str, user_id: int, filename: str, filters: dict):
+    """Export evaluations to CSV in the background and record the outcome for any worker to report."""
+    status, count = 'failed', 0
+    try:
+        success, count = export_evaluations_to_csv(f'{EXPORT_DIR}/{filename}', filters)
+        if success:
+            status = 'complete'
+    except Exception as e:
+        logger.error(f"Export job {job_id} failed: {e}")
+    finally:
+        # Always settle the job, so pollers never wait on an export that died
+        _save_export_job(job_id, user_id=user_id, filename=filename, count=count, status=status)
+
 
 # Form classes
 class ModelComparisonForm(FlaskForm):
@@ -60,11 +168,189 @@ class ExportEvaluationsForm(FlaskForm):
 
 # Helper functions
 def is_admin():
-    """Check if the current user is an administrator."""
-    if not current_user.is_authenticated:
-        return False
+    """Check if the current user is an administrator, once per request."""
+    if 'is_admin' not in g:
+        g.is_admin = current_user.is_authenticated and current_user.role == 'admin'
+    
+    return g.is_admin
+
+
+@dashboard_bp.app_context_processor
+def inject_is_admin():
+    """Make the current user's admin status available to all templates."""
+    return {'is_admin': is_admin()}
+
+
+def get_content_breakdown(session) -> dict:
+    """
+    Count content in total, by source type and by domain with one query.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Dictionary with content_count, ai_content, human_content and content_by_domain
+    """
+    if EVALUATION_STATS_SUMMARY:
+        # Running counts kept up to date as content is added and removed
+        rows = session.query(ContentStat.domain, ContentStat.source_type, ContentStat.total).all()
+    else:
+        rows = session.query(
+            Content.domain, Content.source_type, func.count(Content.id)
+        ).group_by(Content.domain, Content.source_type).all()
+    
+    breakdown = {
+        'content_count': 0,
+        'ai_content': 0,
+        'human_content': 0,
+        'content_by_domain': {domain: 0 for domain in CONTENT_DOMAINS}
+    }
+    for domain, source_type, count in rows:
+        breakdown['content_count'] += count
+        if source_type in ('ai', 'human'):
+            breakdown[f'{source_type}_content'] += count
+        if domain in breakdown['content_by_domain']:
+            breakdown['content_by_domain'][domain] += count
+    
+    return breakdown
+
+
+def get_evaluation_counts(session) -> tuple:
+    """
+    Count all and completed evaluations in one query.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Tuple of (evaluation count, completed evaluation count)
+    """
+    return tuple(session.execute(_evaluation_count_columns()).one())
+
+
+def _evaluation_count_columns():
+    """Select the total and completed evaluation counts, labelled for get_system_counts()."""
+    if EVALUATION_STATS_SUMMARY:
+        # Sum the running per-evaluator counts instead of scanning evaluations
+        return select(
+            func.coalesce(func.sum(EvaluationStat.total), 0).label('evaluation_count'),
+            func.coalesce(func.sum(EvaluationStat.completed), 0).label('completed_evaluations')
+        )
+    
+    # COUNT(column) skips NULLs, so it only counts completed evaluations
+    return select(
+        func.count(Evaluation.id).label('evaluation_count'),
+        func.count(Evaluation.completion_time).label('completed_evaluations')
+    )
+
+
+def get_system_counts(session) -> dict:
+    """
+    Count evaluations, completed evaluations and users in one statement.
+    
+    Args:
+        session: Database session
+        
+    Returns:
+        Dictionary with evaluation_count, completed_evaluations and user_count
+    """
+    # The user count rides along as an uncorrelated scalar subquery
+    row = session.execute(
+        _evaluation_count_columns().add_columns(
+            select(func.count(User.id)).scalar_subquery().label('user_count')
+        )
+    ).one()
+    
+    return row._asdict()
+
+
+def get_dashboard_stats() -> dict:
+    """
+    Get the system-wide counts and recent activity shown on the dashboard.
+    
+    Results are cached for DASHBOARD_STATS_CACHE_TTL seconds.
+    
+    Returns:
+        Dictionary with content, evaluation and recent activity statistics
+    """
+    with _dashboard_stats_lock:
+        cached = _dashboard_stats_cache.get("stats")
+    
+    if cached is not None:
+        return cached
+    
+    with get_db_session() as session:
+        # Get counts
+        evaluation_count, completed_count = get_evaluation_counts(session)
+        
+        # Get content type and domain breakdown
+        content = get_content_breakdown(session)
+        
+        # Get recent activity
+        activity = []
+        recent_evals = session.query(Evaluation).options(
+            joinedload(Evaluation.evaluator).load_only(User.username),
+            joinedload(Evaluation.content).load_only(Content.title)
+        ).filter(
+            Evaluation.completion_time.isnot(None)
+        ).order_by(
+            Evaluation.completion_time.desc()
+        ).limit(5).all()
+        
+        for eval in recent_evals:
+            activity.append({
+                'type': 'evaluation',
+                'user': eval.evaluator.username,
+                'content': eval.content.title,
+                'timestamp': eval.completion_time.isoformat() if eval.completion_time else None
+            })
+    
+    stats = {
+        'content_count': content['content_count'],
+        'evaluation_count': evaluation_count,
+        'completion_rate': round(completed_count / evaluation_count * 100, 1) if evaluation_count else 0,
+        'content_types': {
+            'ai': content['ai_content'],
+            'human': content['human_content']
+        },
+        'domains': content['content_by_domain'],
+        'recent_activity': activity
+    }
+    
+    with _dashboard_stats_lock:
+        _dashboard_stats_cache["stats"] = stats
+    
+    return stats
+
+
+def get_ai_model_names() -> list:
+    """
+    Get the distinct names of models that produced AI content.
+    
+    Results are cached for AI_MODEL_CACHE_TTL seconds and dropped whenever
+    content changes.
+    
+    Returns:
+        List of model names
+    """
+    with _ai_model_lock:
+        cached = _ai_model_cache.get("models")
+    
+    if cached is not None:
+        return cached
+    
+    with get_db_session() as session:
+        models = session.query(Content.model_name).filter(
+            Content.source_type == 'ai',
+            Content.model_name.isnot(None)
+        ).distinct().all()
+        
+        models = [m[0] for m in models if m[0]]
+    
+    with _ai_model_lock:
+        _ai_model_cache["models"] = models
     
-    return current_user.role == 'admin'
+    return models
 
 
 # Custom decorator for admin-only routes
@@ -97,7 +383,9 @@ def index():
         pending = evaluator.get_pending_evaluations(current_user.id)
         
         # Get recent analytics reports if any
-        reports = session.query(AnalyticsReport).filter(
+        reports = session.query(AnalyticsReport).options(
+            load_only(*REPORT_LIST_COLUMNS)
+        ).filter(
             AnalyticsReport.created_by == current_user.id
         ).order_by(
             AnalyticsReport.created_at.desc()
@@ -108,7 +396,6 @@ def index():
         stats=stats,
         pending=pending,
         reports=reports,
-        is_admin=is_admin(),
         title='Dashboard'
     )
 
@@ -119,45 +406,45 @@ def admin():
     """Admin dashboard page."""
     with get_db_session() as session:
         # Get system stats
-        content_count = session.query(Content).count()
-        evaluation_count = session.query(Evaluation).count()
-        user_count = session.query(User).count()
-        completed_evaluations = session.query(Evaluation).filter(
-            Evaluation.completion_time.isnot(None)
-        ).count()
-        
-        # Get content by type
-        ai_content = session.query(Content).filter(Content.source_type == 'ai').count()
-        human_content = session.query(Content).filter(Content.source_type == 'human').count()
+        counts = get_system_counts(session)
+        evaluation_count = counts['evaluation_count']
+        completed_evaluations = counts['completed_evaluations']
         
-        # Get content by domain
-        content_by_domain = {}
-        for domain in CONTENT_DOMAINS:
-            count = session.query(Content).filter(Content.domain == domain).count()
-            content_by_domain[domain] = count
+        # Get content by type and domain
+        content = get_content_breakdown(session)
         
         # Get quality control issues
-        quality_issues = quality_controller.flag_low_quality_evaluations()
+        quality_issues = quality_controller.get_quality_issues()
         
         # Get recent reports
-        recent_reports = analytics_engine.get_recent_reports(5)
+        recent_reports = analytics_engine.get_recent_reports(5, session=session)
         
         # Get improvement suggestions
-        suggestions = session.query(ImprovementSuggestion).filter(
-            ImprovementSuggestion.status == 'open'
+        suggestions = session.query(ImprovementSuggestion).options(
+            load_only(
+                ImprovementSuggestion.model_name,
+                ImprovementSuggestion.domain,
+                ImprovementSuggestion.criterion,
+                ImprovementSuggestion.current_score,
+                ImprovementSuggestion.target_score,
+                ImprovementSuggestion.suggestion,
+                ImprovementSuggestion.priority
+            )
+        ).filter(
+            ImprovementSuggestion.status == STATUS_OPEN
         ).order_by(
             ImprovementSuggestion.created_at.desc()
         ).limit(5).all()
     
     stats = {
-        'content_count': content_count,
+        'content_count': content['content_count'],
         'evaluation_count': evaluation_count,
-        'user_count': user_count,
+        'user_count': counts['user_count'],
         'completed_evaluations': completed_evaluations,
         'completion_rate': round(completed_evaluations / evaluation_count * 100, 1) if evaluation_count else 0,
-        'ai_content': ai_content,
-        'human_content': human_content,
-        'content_by_domain': content_by_domain
+        'ai_content': content['ai_content'],
+        'human_content': content['human_content'],
+        'content_by_domain': content['content_by_domain']
     }
     
     return render_template(
@@ -177,33 +464,39 @@ def reports():
     """Analytics reports page."""
     with get_db_session() as session:
         # Get reports
-        query = session.query(AnalyticsReport)
+        query = session.query(AnalyticsReport).options(load_only(*REPORT_LIST_COLUMNS))
         
         # Filter by user if not admin
         if not is_admin():
             query = query.filter(AnalyticsReport.created_by == current_user.id)
         
+        # Continue after the last report of the previous page, if any
+        after = parse_page_cursor(request.args.get('after', ''))
+        if after:
+            query = query.filter(
+                tuple_(AnalyticsReport.created_at, AnalyticsReport.id) < tuple_(*after)
+            )
+        
         # Order by creation date (newest first)
-        query = query.order_by(AnalyticsReport.created_at.desc())
+        query = query.order_by(AnalyticsReport.created_at.desc(), AnalyticsReport.id.desc())
         
-        # Get paginated results
-        page = request.args.get('page', 1, type=int)
+        # Fetch one extra report to tell whether there is a next page
         per_page = 10
-        offset = (page - 1) * per_page
         
-        total = query.count()
-        reports = query.limit(per_page).offset(offset).all()
+        reports = query.limit(per_page + 1).all()
     
-    # Calculate pagination
-    total_pages = (total + per_page - 1) // per_page
+    has_more = len(reports) > per_page
+    reports = reports[:per_page]
+    next_after = None
+    if has_more:
+        last = reports[-1]
+        next_after = format_page_cursor(last.created_at, last.id)
     
     return render_template(
         'dashboard/reports.html',
         reports=reports,
-        page=page,
-        total_pages=total_pages,
-        total=total,
-        is_admin=is_admin(),
+        has_more=has_more,
+        next_after=next_after,
         title='Analytics Reports'
     )
 
@@ -212,21 +505,22 @@ def reports():
 @login_required
 def view_report(report_id):
     """View a specific analytics report."""
-    report = analytics_engine.get_analytics_report(report_id)
+    # Check permission before loading the report's results
+    found, owner_id = analytics_engine.get_report_owner(report_id)
     
-    if not report:
-        flash('Report not found', 'danger')
+    if found and not is_admin() and owner_id != current_user.id:
+        flash('You do not have permission to view this report', 'danger')
         return redirect(url_for('dashboard_bp.reports'))
     
-    # Check permission
-    if not is_admin() and report.get('created_by') != current_user.id:
-        flash('You do not have permission to view this report', 'danger')
+    report = analytics_engine.get_analytics_report(report_id) if found else None
+    
+    if not report:
+        flash('Report not found', 'danger')
         return redirect(url_for('dashboard_bp.reports'))
     
     return render_template(
         'dashboard/view_report.html',
         report=report,
-        is_admin=is_admin(),
         title=f'Report: {report["title"]}'
     )
 
@@ -239,17 +533,11 @@ def model_comparison():
     form = ModelComparisonForm()
     
     # Get available models
-    with get_db_session() as session:
-        models = session.query(Content.model_name).filter(
-            Content.source_type == 'ai',
-            Content.model_name.isnot(None)
-        ).distinct().all()
-        
-        models = [m[0] for m in models if m[0]]
+    models = get_ai_model_names()
     
     # Set form choices
     form.models.choices = [(m, m) for m in models]
-    form.domains.choices = [(d, get_domain_label(d)) for d in CONTENT_DOMAINS]
+    form.domains.choices = DOMAIN_CHOICES
     
     # Process form submission
     if form.validate_on_submit():
@@ -262,7 +550,6 @@ def model_comparison():
             return render_template(
                 'dashboard/model_comparison.html',
                 form=form,
-                is_admin=is_admin(),
                 title='Model Comparison'
             )
         
@@ -275,17 +562,7 @@ def model_comparison():
         )
         
         if comparison:
-            # Get the report ID
-            report_id = None
-            with get_db_session() as session:
-                report = session.query(AnalyticsReport).filter(
-                    AnalyticsReport.report_type == 'model_comparison'
-                ).order_by(
-                    AnalyticsReport.created_at.desc()
-                ).first()
-                
-                if report:
-                    report_id = report.id
+            report_id = comparison.get('report_id')
             
             if report_id:
                 flash('Model comparison generated successfully', 'success')
@@ -298,7 +575,6 @@ def model_comparison():
     return render_template(
         'dashboard/model_comparison.html',
         form=form,
-        is_admin=is_admin(),
         title='Model Comparison'
     )
 
@@ -308,13 +584,7 @@ def model_comparison():
 def improvement_analysis():
     """Analyze areas for model improvement."""
     # Get available models
-    with get_db_session() as session:
-        models = session.query(Content.model_name).filter(
-            Content.source_type == 'ai',
-            Content.model_name.isnot(None)
-        ).distinct().all()
-        
-        models = [m[0] for m in models if m[0]]
+    models = get_ai_model_names()
     
     # Process form submission
     if request.method == 'POST':
@@ -326,7 +596,6 @@ def improvement_analysis():
             return render_template(
                 'dashboard/improvement_analysis.html',
                 models=models,
-                is_admin=is_admin(),
                 title='Improvement Analysis'
             )
         
@@ -337,17 +606,7 @@ def improvement_analysis():
         )
         
         if analysis and 'error' not in analysis:
-            # Get the report ID
-            report_id = None
-            with get_db_session() as session:
-                report = session.query(AnalyticsReport).filter(
-                    AnalyticsReport.report_type == 'improvement_areas'
-                ).order_by(
-                    AnalyticsReport.created_at.desc()
-                ).first()
-                
-                if report:
-                    report_id = report.id
+            report_id = analysis.get('report_id')
             
             if report_id:
                 flash('Improvement analysis generated successfully', 'success')
@@ -361,7 +620,6 @@ def improvement_analysis():
     return render_template(
         'dashboard/improvement_analysis.html',
         models=models,
-        is_admin=is_admin(),
         title='Improvement Analysis'
     )
 
@@ -382,17 +640,7 @@ def human_ai_gap():
         analysis = analytics_engine.analyze_human_ai_gap(selected_domains or None)
         
         if analysis and 'error' not in analysis:
-            # Get the report ID
-            report_id = None
-            with get_db_session() as session:
-                report = session.query(AnalyticsReport).filter(
-                    AnalyticsReport.report_type == 'human_ai_gap'
-                ).order_by(
-                    AnalyticsReport.created_at.desc()
-                ).first()
-                
-                if report:
-                    report_id = report.id
+            report_id = analysis.get('report_id')
             
             if report_id:
                 flash('Human-AI gap analysis generated successfully', 'success')
@@ -406,7 +654,6 @@ def human_ai_gap():
     return render_template(
         'dashboard/human_ai_gap.html',
         domains=domains,
-        is_admin=is_admin(),
         title='Human-AI Gap Analysis'
     )
 
@@ -419,7 +666,7 @@ def export_evaluations():
     form = ExportEvaluationsForm()
     
     # Set domain choices
-    form.domain.choices = [('', 'All Domains')] + [(d, get_domain_label(d)) for d in CONTENT_DOMAINS]
+    form.domain.choices = DOMAIN_CHOICES_WITH_ALL
     
     # Process form submission
     if form.validate_on_submit():
@@ -438,28 +685,23 @@ def export_evaluations():
         if source_type:
             filters['source_type'] = source_type
         
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        filename = f'evaluations_{timestamp}.csv'
-        filepath = f'static/exports/{filename}'
-        
-        # Ensure exports directory exists
-        import os
-        os.makedirs('static/exports', exist_ok=True)
+        # Generate filename; nanoseconds keep concurrent exports apart
+        filename = f'evaluations_{time.time_ns()}.csv'
         
-        # Export data
-        success, count = export_evaluations_to_csv(filepath, filters)
+        # Export in the background so large exports don't tie up the request; the
+        # job state lives on disk so any worker can answer the status polls
+        job_id = uuid.uuid4().hex
+        _purge_export_jobs()
+        _save_export_job(job_id, user_id=current_user.id, filename=filename, count=0, status='pending')
+        _export_executor.submit(_run_export, job_id, current_user.id, filename, filters)
         
-        if success:
-            flash(f'Successfully exported {count} evaluations to CSV', 'success')
-            return redirect(url_for('static', filename=f'exports/{filename}'))
-        else:
-            flash('Failed to export evaluations', 'danger')
+        flash('Export started, the download will be available shortly', 'info')
+        return redirect(url_for('dashboard_bp.export_evaluations', job=job_id))
     
     return render_template(
         'dashboard/export_evaluations.html',
         form=form,
-        is_admin=is_admin(),
+        export_job_id=request.args.get('job'),
         title='Export Evaluations'
     )
 
@@ -469,7 +711,7 @@ def export_evaluations():
 def quality_issues():
     """View quality control issues."""
     # Get quality issues
-    issues = quality_controller.flag_low_quality_evaluations()
+    issues = quality_controller.get_quality_issues()
     
     return render_template(
         'dashboard/quality_issues.html',
@@ -497,13 +739,8 @@ def evaluator_analysis(user_id):
         patterns = quality_controller.analyze_evaluator_patterns(user_id)
         
         # Get recent evaluations
-        recent_evaluations = session.query(
-            Evaluation,
-            Content.title,
-            Content.domain
-        ).join(
-            Content,
-            Evaluation.content_id == Content.id
+        recent_evaluations = session.query(Evaluation).options(
+            joinedload(Evaluation.content).load_only(Content.title, Content.domain)
         ).filter(
             Evaluation.evaluator_id == user_id,
             Evaluation.completion_time.isnot(None)
@@ -538,13 +775,7 @@ def improvement_suggestions():
     )
     
     # Get models and domains for filter dropdowns
-    with get_db_session() as session:
-        models = session.query(Content.model_name).filter(
-            Content.source_type == 'ai',
-            Content.model_name.isnot(None)
-        ).distinct().all()
-        
-        models = [m[0] for m in models if m[0]]
+    models = get_ai_model_names()
     
     return render_template(
         'dashboard/improvement_suggestions.html',
@@ -562,79 +793,56 @@ def improvement_suggestions():
 @login_required
 def api_dashboard_stats():
     """API endpoint for dashboard statistics."""
-    with get_db_session() as session:
-        # Get counts
-        content_count = session.query(Content).count()
-        evaluation_count = session.query(Evaluation).count()
-        completed_count = session.query(Evaluation).filter(
-            Evaluation.completion_time.isnot(None)
-        ).count()
-        
-        # Get content type breakdown
-        ai_content = session.query(Content).filter(Content.source_type == 'ai').count()
-        human_content = session.query(Content).filter(Content.source_type == 'human').count()
-        
-        # Get domain breakdown
-        domains = {}
-        for domain in CONTENT_DOMAINS:
-            count = session.query(Content).filter(Content.domain == domain).count()
-            domains[domain] = count
-        
-        # Get recent activity
-        activity = []
-        recent_evals = session.query(
-            Evaluation,
-            User.username,
-            Content.title
-        ).join(
-            User,
-            Evaluation.evaluator_id == User.id
-        ).join(
-            Content,
-            Evaluation.content_id == Content.id
-        ).filter(
-            Evaluation.completion_time.isnot(None)
-        ).order_by(
-            Evaluation.completion_time.desc()
-        ).limit(5).all()
-        
-        for eval, username, title in recent_evals:
-            activity.append({
-                'type': 'evaluation',
-                'user': username,
-                'content': title,
-                'timestamp': eval.completion_time.isoformat() if eval.completion_time else None
-            })
+    response = jsonify(get_dashboard_stats())
     
-    return jsonify({
-        'content_count': content_count,
-        'evaluation_count': evaluation_count,
-        'completion_rate': round(completed_count / evaluation_count * 100, 1) if evaluation_count else 0,
-        'content_types': {
-            'ai': ai_content,
-            'human': human_content
-        },
-        'domains': domains,
-        'recent_activity': activity
-    })
+    # Let pollers reuse the response, and get a 304 when it hasn't changed
+    response.cache_control.private = True
+    response.cache_control.max_age = DASHBOARD_STATS_CACHE_TTL
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @dashboard_bp.route('/api/report/<int:report_id>')
 @login_required
 def api_report(report_id):
     """API endpoint to get a specific report."""
-    report = analytics_engine.get_analytics_report(report_id)
+    # Check permission before loading the report's results
+    found, owner_id = analytics_engine.get_report_owner(report_id)
+    
+    if found and not is_admin() and owner_id != current_user.id:
+        return jsonify({'error': 'Not authorized to view this report'}), 403
+    
+    report = analytics_engine.get_analytics_report(report_id) if found else None
     
     if not report:
         return jsonify({'error': 'Report not found'}), 404
     
-    # Check permission
-    if not is_admin() and report.get('created_by') != current_user.id:
-        return jsonify({'error': 'Not authorized to view this report'}), 403
-    
     return jsonify(report)
 
 
+@dashboard_bp.route('/api/export/<job_id>')
+@login_required
+def api_export_status(job_id):
+    """API endpoint to poll a background CSV export."""
+    # Job IDs are hex UUIDs; anything else must not reach the filesystem
+    job = _load_export_job(job_id) if job_id.isalnum() else None
+    
+    if not job or job['user_id'] != current_user.id:
+        return jsonify({'error': 'Export not found'}), 404
+    
+    if job['status'] == 'pending':
+        return jsonify({'status': 'pending'})
+    
+    if job['status'] == 'failed':
+        return jsonify({'status': 'failed', 'error': 'Failed to export evaluations'})
+    
+    return jsonify({
+        'status': 'complete',
+        'count': job['count'],
+        'url': url_for('static', filename=f'exports/{job["filename"]}')
+    })
+
+
 # Error handlers
 @dashboard_bp.app_errorhandler(404)
 def page_not_found(e):
@@ -2,19 +2,26 @@
 Expert portal routes for the Generative AI Content Evaluation System.
 """
 import logging
+import threading
 from datetime import datetime
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session
+from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify, session, g
 from flask_login import login_required, current_user
+from cachetools import TTLCache
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.orm import joinedload, raiseload
 from flask_wtf import FlaskForm
 from wtforms import StringField, TextAreaField, SelectField, IntegerField, SelectMultipleField, SubmitField
 from wtforms.validators import DataRequired, Email, Length, Optional, NumberRange
 
-from database import get_db_session
+from database import get_request_session
 from models import User, ExpertProfile, Content, Evaluation, EvaluationCriterion
-from config import CONTENT_DOMAINS
+from config import EXPERT_DASHBOARD_CACHE_TTL, DEBUG
 from evaluator import Evaluator
 from quality_control import QualityController
-from utils import truncate_text, format_timestamp, get_domain_label
+from utils import (
+    truncate_text, format_timestamp, parse_page_cursor, format_page_cursor,
+    DOMAIN_CHOICES
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +34,14 @@ expert_bp = Blueprint('expert_bp', __name__)
 evaluator = Evaluator()
 quality_controller = QualityController()
 
+# Per-expert dashboard counts, keyed by (user ID, expertise domains)
+_expert_stats_cache = TTLCache(maxsize=1024, ttl=EXPERT_DASHBOARD_CACHE_TTL)
+_expert_stats_lock = threading.Lock()
+
+# In debug runs an unplanned lazy load in these views raises instead of
+# querying, so it is caught in development without turning into a 500 in production
+_STRICT_LOADS = (raiseload('*'),) if DEBUG else ()
+
 
 # Form classes
 class ExpertProfileForm(FlaskForm):
@@ -42,42 +57,134 @@ class ExpertProfileForm(FlaskForm):
 
 
 # Helper functions
+def _get_expert_profile():
+    """
+    Load the current user's verification status and expertise domains, once per request.
+    
+    Returns:
+        Tuple of (verified, domains); (False, []) for users without a profile
+    """
+    if 'expert_profile' not in g:
+        profile = None
+        if current_user.is_authenticated:
+            with get_request_session() as session:
+                profile = session.query(
+                    ExpertProfile.verified,
+                    ExpertProfile.domains
+                ).filter(
+                    ExpertProfile.user_id == current_user.id
+                ).first()
+        
+        g.expert_profile = (bool(profile.verified), profile.domains or []) if profile else (False, [])
+    
+    return g.expert_profile
+
+
 def is_expert_verified():
     """Check if the current user is a verified expert."""
-    if not current_user.is_authenticated:
-        return False
-    
-    with get_db_session() as session:
-        profile = session.query(ExpertProfile).filter(
-            ExpertProfile.user_id == current_user.id,
-            ExpertProfile.verified == True
-        ).first()
-        
-        return profile is not None
+    return _get_expert_profile()[0]
 
 
 def get_expert_domains():
     """Get domains where the current user is considered an expert."""
-    if not current_user.is_authenticated:
-        return []
+    return _get_expert_profile()[1]
+
+
+def count_evaluations_by_domain(session, domains):
+    """
+    Count the current user's evaluations in each domain with one GROUP BY.
     
-    with get_db_session() as session:
-        profile = session.query(ExpertProfile).filter(
-            ExpertProfile.user_id == current_user.id
-        ).first()
-        
-        if not profile:
-            return []
+    Args:
+        session: Database session
+        domains: Domains to count
+        
+    Returns:
+        Dictionary mapping each domain to a (total, completed) tuple
+    """
+    counts = {domain: (0, 0) for domain in domains}
+    if not domains:
+        return counts
+    
+    # COUNT(column) skips NULLs, so it only counts completed evaluations
+    rows = session.query(
+        Content.domain,
+        func.count(Evaluation.id),
+        func.count(Evaluation.completion_time)
+    ).join(
+        Content,
+        Evaluation.content_id == Content.id
+    ).filter(
+        Evaluation.evaluator_id == current_user.id,
+        Content.domain.in_(domains)
+    ).group_by(
+        Content.domain
+    ).all()
+    
+    counts.update((domain, (total, completed)) for domain, total, completed in rows)
+    return counts
+
+
+def get_expert_dashboard_stats(domains):
+    """
+    Get the current user's per-domain and quality check counts for the expert dashboard.
+    
+    Results are cached for EXPERT_DASHBOARD_CACHE_TTL seconds and dropped when
+    the user submits an evaluation.
+    
+    Args:
+        domains: The user's expertise domains
+        
+    Returns:
+        Tuple of (domain_stats, quality_stats) dictionaries
+    """
+    key = (current_user.id, tuple(domains))
+    with _expert_stats_lock:
+        cached = _expert_stats_cache.get(key)
+    
+    if cached is not None:
+        return cached
+    
+    with get_request_session() as session:
+        # Get counts by domain
+        domain_stats = {}
+        for domain, (eval_count, completed_count) in count_evaluations_by_domain(session, domains).items():
+            domain_stats[domain] = {
+                'total': eval_count,
+                'completed': completed_count,
+                'completion_rate': round(completed_count / eval_count * 100, 1) if eval_count else 0
+            }
         
-        domains = profile.domains
-        if isinstance(domains, str):
-            import json
-            try:
-                domains = json.loads(domains)
-            except:
-                domains = []
+        # Get quality check stats
+        quality_stats = {
+            'passed': session.query(Evaluation).filter(
+                Evaluation.evaluator_id == current_user.id,
+                Evaluation.passed_quality_checks == True
+            ).count(),
+            'failed': session.query(Evaluation).filter(
+                Evaluation.evaluator_id == current_user.id,
+                Evaluation.passed_quality_checks == False
+            ).count(),
+            'unknown': session.query(Evaluation).filter(
+                Evaluation.evaluator_id == current_user.id,
+                Evaluation.passed_quality_checks.is_(None),
+                Evaluation.completion_time.isnot(None)
+            ).count()
+        }
         
-        return domains if domains else []
+        total_with_checks = sum(quality_stats.values())
+        quality_stats['pass_rate'] = round(quality_stats['passed'] / total_with_checks * 100, 1) if total_with_checks else 0
+    
+    with _expert_stats_lock:
+        _expert_stats_cache[key] = (domain_stats, quality_stats)
+    
+    return domain_stats, quality_stats
+
+
+def _forget_expert_dashboard_stats(user_id: int):
+    """Drop a user's cached dashboard counts, for all domain selections."""
+    with _expert_stats_lock:
+        for key in [key for key in _expert_stats_cache if key[0] == user_id]:
+            _expert_stats_cache.pop(key, None)
 
 
 # Routes
@@ -92,7 +199,7 @@ def index():
     domains = get_expert_domains()
     
     # Get assigned evaluations
-    with get_db_session() as session:
+    with get_request_session() as session:
         assigned_evaluations = session.query(
             Evaluation,
             Content.title,
@@ -103,6 +210,8 @@ def index():
         ).filter(
             Evaluation.evaluator_id == current_user.id,
             Evaluation.completion_time.is_(None)
+        ).options(
+            *_STRICT_LOADS
         ).order_by(
             Evaluation.start_time.desc()
         ).limit(10).all()
@@ -118,22 +227,17 @@ def index():
         ).filter(
             Evaluation.evaluator_id == current_user.id,
             Evaluation.completion_time.isnot(None)
+        ).options(
+            *_STRICT_LOADS
         ).order_by(
             Evaluation.completion_time.desc()
         ).limit(5).all()
         
         # Count evaluations by domain
-        domain_counts = {}
-        for domain in domains:
-            count = session.query(Evaluation).join(
-                Content,
-                Evaluation.content_id == Content.id
-            ).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Content.domain == domain
-            ).count()
-            
-            domain_counts[domain] = count
+        domain_counts = {
+            domain: total
+            for domain, (total, completed) in count_evaluations_by_domain(session, domains).items()
+        }
     
     return render_template(
         'expert/index.html',
@@ -151,7 +255,7 @@ def index():
 def become_expert():
     """Page for users to create or update their expert profile."""
     # Check if user already has a profile
-    with get_db_session() as session:
+    with get_request_session() as session:
         profile = session.query(ExpertProfile).filter(
             ExpertProfile.user_id == current_user.id
         ).first()
@@ -160,11 +264,11 @@ def become_expert():
     form = ExpertProfileForm()
     
     # Set domain choices
-    form.domains.choices = [(d, get_domain_label(d)) for d in CONTENT_DOMAINS]
+    form.domains.choices = DOMAIN_CHOICES
     
     # Pre-fill form if profile exists
     if profile and request.method == 'GET':
-        form.domains.data = profile.domains if isinstance(profile.domains, list) else []
+        form.domains.data = profile.domains
         form.years_experience.data = profile.years_experience
         form.qualifications.data = profile.qualifications
         form.bio.data = profile.bio
@@ -211,7 +315,7 @@ def assignments():
     status = request.args.get('status', 'pending')
     domain = request.args.get('domain', '')
     
-    with get_db_session() as session:
+    with get_request_session() as session:
         # Base query
         query = session.query(
             Evaluation,
@@ -224,6 +328,10 @@ def assignments():
             Evaluation.content_id == Content.id
         ).filter(
             Evaluation.evaluator_id == current_user.id
+        ).options(
+            # The template only needs the selected Content columns, so any
+            # relationship access on these evaluations is a bug, not a query
+            *_STRICT_LOADS
         )
         
         # Apply filters
@@ -241,22 +349,26 @@ def assignments():
             if expert_domains:
                 query = query.filter(Content.domain.in_(expert_domains))
         
-        # Order by date
-        if status == 'completed':
-            query = query.order_by(Evaluation.completion_time.desc())
-        else:
-            query = query.order_by(Evaluation.start_time.desc())
+        # Order by date, with the ID breaking ties
+        sort_column = Evaluation.completion_time if status == 'completed' else Evaluation.start_time
         
-        # Get paginated results
-        page = request.args.get('page', 1, type=int)
-        per_page = 10
-        offset = (page - 1) * per_page
+        # Continue after the last assignment of the previous page, if any
+        after = parse_page_cursor(request.args.get('after', ''))
+        if after:
+            query = query.filter(tuple_(sort_column, Evaluation.id) < tuple_(*after))
+        
+        query = query.order_by(sort_column.desc(), Evaluation.id.desc())
         
-        total = query.count()
-        assignments = query.limit(per_page).offset(offset).all()
+        # Fetch one extra assignment to tell whether there is a next page
+        per_page = 10
+        assignments = query.limit(per_page + 1).all()
     
-    # Calculate pagination
-    total_pages = (total + per_page - 1) // per_page
+    has_more = len(assignments) > per_page
+    assignments = assignments[:per_page]
+    next_after = None
+    if has_more:
+        last = assignments[-1].Evaluation
+        next_after = format_page_cursor(getattr(last, sort_column.key), last.id)
     
     return render_template(
         'expert/assignments.html',
@@ -264,9 +376,8 @@ def assignments():
         status=status,
         domain=domain,
         expert_domains=get_expert_domains(),
-        page=page,
-        total_pages=total_pages,
-        total=total,
+        has_more=has_more,
+        next_after=next_after,
         title='My Assignments'
     )
 
@@ -279,24 +390,30 @@ def content_detail(content_id):
         flash('You must be a verified expert to view content details', 'warning')
         return redirect(url_for('expert_bp.become_expert'))
     
-    with get_db_session() as session:
-        content = session.query(Content).get(content_id)
+    with get_request_session() as session:
+        # Load the content together with the user's evaluation of it, if any
+        row = session.query(Content, Evaluation).outerjoin(
+            Evaluation,
+            and_(
+                Evaluation.content_id == Content.id,
+                Evaluation.evaluator_id == current_user.id
+            )
+        ).filter(
+            Content.id == content_id
+        ).first()
         
-        if not content:
+        if not row:
             flash('Content not found', 'danger')
             return redirect(url_for('expert_bp.assignments'))
         
+        content, evaluation = row
+        
         # Verify user has permission to view this content
         if content.domain not in get_expert_domains() and current_user.role != 'admin':
             flash('You do not have permission to view this content', 'danger')
             return redirect(url_for('expert_bp.assignments'))
         
         # Check if user has an assigned evaluation for this content
-        evaluation = session.query(Evaluation).filter(
-            Evaluation.evaluator_id == current_user.id,
-            Evaluation.content_id == content_id
-        ).first()
-        
         if not evaluation:
             flash('This content is not assigned to you', 'warning')
             return redirect(url_for('expert_bp.assignments'))
@@ -317,9 +434,11 @@ def evaluate(evaluation_id):
         flash('You must be a verified expert to evaluate content', 'warning')
         return redirect(url_for('expert_bp.become_expert'))
     
-    with get_db_session() as session:
-        # Get evaluation
-        evaluation = session.query(Evaluation).get(evaluation_id)
+    with get_request_session() as session:
+        # Get evaluation, with its content in the same query
+        evaluation = session.query(Evaluation).options(
+            joinedload(Evaluation.content)
+        ).get(evaluation_id)
         
         if not evaluation:
             flash('Evaluation not found', 'danger')
@@ -335,8 +454,7 @@ def evaluate(evaluation_id):
             flash('This evaluation has already been completed', 'info')
             return redirect(url_for('expert_bp.view_evaluation', evaluation_id=evaluation_id))
         
-        # Get content
-        content = session.query(Content).get(evaluation.content_id)
+        content = evaluation.content
         
         # Get criteria
         criteria = evaluator.get_evaluation_criteria(content.domain)
@@ -396,6 +514,7 @@ def evaluate(evaluation_id):
         )
         
         if success:
+            _forget_expert_dashboard_stats(current_user.id)
             flash('Evaluation submitted successfully', 'success')
             return redirect(url_for('expert_bp.view_evaluation', evaluation_id=evaluation_id))
         else:
@@ -420,9 +539,12 @@ def view_evaluation(evaluation_id):
         flash('You must be a verified expert to view evaluations', 'warning')
         return redirect(url_for('expert_bp.become_expert'))
     
-    with get_db_session() as session:
+    with get_request_session() as session:
         # Get evaluation with joins
-        evaluation = session.query(Evaluation).get(evaluation_id)
+        evaluation = session.query(Evaluation).options(
+            joinedload(Evaluation.content),
+            *_STRICT_LOADS
+        ).get(evaluation_id)
         
         if not evaluation:
             flash('Evaluation not found', 'danger')
@@ -433,8 +555,7 @@ def view_evaluation(evaluation_id):
             flash('You do not have permission to view this evaluation', 'danger')
             return redirect(url_for('expert_bp.assignments'))
         
-        # Get content
-        content = session.query(Content).get(evaluation.content_id)
+        content = evaluation.content
         
         # Get scores
         scores = session.query(
@@ -469,55 +590,7 @@ def dashboard():
     
     # Get domains and counts
     domains = get_expert_domains()
-    
-    with get_db_session() as session:
-        # Get counts by domain
-        domain_stats = {}
-        for domain in domains:
-            # Count evaluations in this domain
-            eval_count = session.query(Evaluation).join(
-                Content,
-                Evaluation.content_id == Content.id
-            ).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Content.domain == domain
-            ).count()
-            
-            # Count completed evaluations
-            completed_count = session.query(Evaluation).join(
-                Content,
-                Evaluation.content_id == Content.id
-            ).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Content.domain == domain,
-                Evaluation.completion_time.isnot(None)
-            ).count()
-            
-            domain_stats[domain] = {
-                'total': eval_count,
-                'completed': completed_count,
-                'completion_rate': round(completed_count / eval_count * 100, 1) if eval_count else 0
-            }
-        
-        # Get quality check stats
-        quality_stats = {
-            'passed': session.query(Evaluation).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Evaluation.passed_quality_checks == True
-            ).count(),
-            'failed': session.query(Evaluation).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Evaluation.passed_quality_checks == False
-            ).count(),
-            'unknown': session.query(Evaluation).filter(
-                Evaluation.evaluator_id == current_user.id,
-                Evaluation.passed_quality_checks.is_(None),
-                Evaluation.completion_time.isnot(None)
-            ).count()
-        }
-        
-        total_with_checks = sum(quality_stats.values())
-        quality_stats['pass_rate'] = round(quality_stats['passed'] / total_with_checks * 100, 1) if total_with_checks else 0
+    domain_stats, quality_stats = get_expert_dashboard_stats(domains)
     
     return render_template(
         'expert/dashboard.html',
@@ -553,7 +626,7 @@ def api_domain_content(domain):
     if domain not in expert_domains and current_user.role != 'admin':
         return jsonify({'error': 'Not authorized for this domain'}), 403
     
-    with get_db_session() as session:
+    with get_request_session() as session:
         # Get content in this domain
         content_items = session.query(Content).filter(
             Content.domain == domain
@@ -3,20 +3,27 @@ Main application entry point for the Generative AI Content Evaluation System.
 """
 import logging
 import os
-from flask import Flask, render_template, redirect, url_for, flash, request, jsonify, session
+import threading
+from flask import Flask, render_template, redirect, url_for, flash, request, jsonify, session, g, has_request_context
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
+from cachetools import TTLCache
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event, select
 from werkzeug.security import check_password_hash
 from datetime import datetime, timedelta
 
-from database import init_db, get_db_session
-from models import User, Content, Evaluation, EvaluationCriterion
+from database import Session, init_db, get_db_session, rebuild_summary_tables, remove_request_session, warm_pool
+from models import User, EvaluationCriterion
 from evaluator import Evaluator
 from quality_control import QualityController
 from analytics import AnalyticsEngine
 from interfaces.web_interface import web_bp
 from interfaces.expert_portal import expert_bp
-from interfaces.dashboard import dashboard_bp
-from config import APP_PORT, APP_HOST, SECRET_KEY, DEBUG, CONTENT_DOMAINS, EVALUATION_CRITERIA
+from interfaces.dashboard import dashboard_bp, get_content_breakdown, get_evaluation_counts
+from config import (
+    APP_PORT, APP_HOST, SECRET_KEY, DEBUG, CONTENT_DOMAINS, EVALUATION_CRITERIA, TEMPLATE_CACHE_DIR,
+    NPLUSONE_DETECT, NPLUSONE_RAISE, SYSTEM_STATISTICS_CACHE_TTL, USER_CACHE_TTL
+)
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +42,35 @@ app.config['SECRET_KEY'] = SECRET_KEY
 app.config['DEBUG'] = DEBUG
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=24)
 
+# Outside debug mode templates only change on deploy, so skip the per-render
+# freshness checks and share compiled templates between worker processes
+if not DEBUG:
+    if TEMPLATE_CACHE_DIR:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+if NPLUSONE_DETECT:
+    @event.listens_for(Session, "do_orm_execute")
+    def _detect_n_plus_one(orm_execute_state):
+        """Report relationships lazily loaded more than once in the same request."""
+        if orm_execute_state.lazy_loaded_from is None or not has_request_context():
+            return
+        
+        # e.g. "Evaluation.content"
+        relationship = str(orm_execute_state.loader_strategy_path[-1])
+        lazy_loads = g.setdefault('lazy_loads', {})
+        lazy_loads[relationship] = lazy_loads.get(relationship, 0) + 1
+        
+        # Warn once per relationship per request
+        if lazy_loads[relationship] == 2:
+            message = f"Potential n+1 query detected on {relationship} in {request.endpoint}"
+            if NPLUSONE_RAISE:
+                raise RuntimeError(message)
+            logging.getLogger('nplusone').warning(message)
+
+
 # Initialize LoginManager
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -42,6 +78,9 @@ login_manager.login_view = 'web_bp.login'
 login_manager.login_message = 'Please log in to access this page.'
 login_manager.login_message_category = 'info'
 
+# Close the shared request session once each request is done
+app.teardown_appcontext(remove_request_session)
+
 # Register blueprints
 app.register_blueprint(web_bp)
 app.register_blueprint(expert_bp, url_prefix='/expert')
@@ -52,12 +91,57 @@ evaluator = Evaluator()
 quality_controller = QualityController()
 analytics_engine = AnalyticsEngine()
 
+# /api/statistics is public and shows the same system-wide numbers to everyone
+_statistics_cache = TTLCache(maxsize=1, ttl=SYSTEM_STATISTICS_CACHE_TTL)
+_statistics_lock = threading.Lock()
+
+
+# Every authenticated request loads its user; recently loaded users are reused
+# for USER_CACHE_TTL seconds as long as their role and status are unchanged
+_user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL)
+_user_cache_lock = threading.Lock()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _forget_cached_user(mapper, connection, target):
+    """Drop a user from the cache when their row changes."""
+    with _user_cache_lock:
+        _user_cache.pop(target.id, None)
+
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Load a user from the database."""
+    """
+    Load a user, reusing a recently loaded copy while it is still current.
+    
+    Role and is_active drive authorization, so they are re-read on every
+    request. A cached copy is only returned when both still match, which also
+    covers changes made by other workers or through Core updates.
+    """
+    user_id = int(user_id)
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    
     with get_db_session() as session:
-        return session.query(User).get(int(user_id))
+        current = session.execute(
+            select(User.role, User.is_active).where(User.id == user_id)
+        ).first()
+        
+        if current is None:
+            with _user_cache_lock:
+                _user_cache.pop(user_id, None)
+            return None
+        
+        if cached is not None and (cached.role, cached.is_active) == tuple(current):
+            return cached
+        
+        user = session.get(User, user_id)
+    
+    with _user_cache_lock:
+        _user_cache[user_id] = user
+    
+    return user
 
 
 @app.before_request
@@ -90,32 +174,39 @@ def health_check():
 
 @app.route('/api/statistics')
 def api_statistics():
-    """API endpoint for basic system statistics."""
+    """API endpoint for basic system statistics, cached for SYSTEM_STATISTICS_CACHE_TTL seconds."""
+    with _statistics_lock:
+        statistics = _statistics_cache.get("statistics")
+    
+    if statistics is None:
+        statistics = _count_system_statistics()
+        with _statistics_lock:
+            _statistics_cache["statistics"] = statistics
+    
+    response = jsonify(statistics)
+    response.cache_control.public = True
+    response.cache_control.max_age = SYSTEM_STATISTICS_CACHE_TTL
+    return response
+
+
+def _count_system_statistics() -> dict:
+    """Count content and evaluations for the statistics API."""
     with get_db_session() as session:
-        total_content = session.query(Content).count()
-        total_evaluations = session.query(Evaluation).count()
-        completed_evaluations = session.query(Evaluation).filter(
-            Evaluation.completion_time.isnot(None)
-        ).count()
-        
-        content_by_domain = {}
-        for domain in CONTENT_DOMAINS:
-            count = session.query(Content).filter(Content.domain == domain).count()
-            content_by_domain[domain] = count
+        # One grouped content count and one evaluation count, shared with the admin dashboard
+        content = get_content_breakdown(session)
+        total_evaluations, completed_evaluations = get_evaluation_counts(session)
         
-        content_by_source = {
-            'ai': session.query(Content).filter(Content.source_type == 'ai').count(),
-            'human': session.query(Content).filter(Content.source_type == 'human').count()
-        }
-        
-        return jsonify({
-            'total_content': total_content,
+        return {
+            'total_content': content['content_count'],
             'total_evaluations': total_evaluations,
             'completed_evaluations': completed_evaluations,
             'completion_rate': round(completed_evaluations / total_evaluations * 100, 1) if total_evaluations else 0,
-            'content_by_domain': content_by_domain,
-            'content_by_source': content_by_source
-        })
+            'content_by_domain': content['content_by_domain'],
+            'content_by_source': {
+                'ai': content['ai_content'],
+                'human': content['human_content']
+            }
+        }
 
 
 @app.errorhandler(404)
@@ -141,10 +232,23 @@ def initialize_application():
         logger.error("Failed to initialize database")
         return False
     
+    warm_pool()
+    
+    # Warm the criteria cache so the first evaluations don't hit the database
+    for domain in [None] + CONTENT_DOMAINS:
+        evaluator.get_evaluation_criteria(domain)
+    
     logger.info("Application initialized successfully")
     return True
 
 
+@app.cli.command('rebuild-summaries')
+def rebuild_summaries_command():
+    """Recount the summary tables from the underlying evaluations and content."""
+    rebuilt = rebuild_summary_tables()
+    print(f"Rebuilt {', '.join(rebuilt) or 'no tables'}")
+
+
 if __name__ == '__main__':
     # Initialize the application if needed
     initialize_application()
@@ -2,12 +2,39 @@
 Database models for the Generative AI Content Evaluation System.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, JSON
+
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, Text, Date, DateTime, Boolean, ForeignKey, JSON, Index, or_, text
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
 
 Base = declarative_base()
 
+# JSON stored pre-parsed as JSONB on PostgreSQL, plain JSON elsewhere
+JSON_DOCUMENT = JSON().with_variant(JSONB(), 'postgresql')
+
+
+class DomainList(TypeDecorator):
+    """List of domain names stored as JSON, always loaded as a list."""
+    impl = JSON_DOCUMENT
+    cache_ok = True
+    
+    def process_result_value(self, value, dialect):
+        # The driver has already decoded the JSON; init_db() rewrites older
+        # rows that held the list as an encoded string
+        return value if isinstance(value, list) else []
+
+
+# Improvement suggestion priorities and statuses
+PRIORITY_HIGH = 'high'
+PRIORITY_MEDIUM = 'medium'
+PRIORITY_LOW = 'low'
+STATUS_OPEN = 'open'
+
+# Sort rank of each improvement suggestion priority (lower sorts first)
+PRIORITY_RANKS = {PRIORITY_HIGH: 1, PRIORITY_MEDIUM: 2, PRIORITY_LOW: 3}
+
 class User(Base):
     """User model for authentication and user management."""
     __tablename__ = 'users'
@@ -34,10 +61,18 @@ class User(Base):
 class ExpertProfile(Base):
     """Expert profile with expertise details."""
     __tablename__ = 'expert_profiles'
+    __table_args__ = (
+        # Domain membership lookups (domains @> '["..."]') on PostgreSQL
+        Index(
+            'ix_expert_domains', 'domains',
+            postgresql_using='gin',
+            postgresql_ops={'domains': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), unique=True)
-    domains = Column(JSON)  # List of expertise domains
+    domains = Column(DomainList)  # List of expertise domains
     years_experience = Column(Integer)
     qualifications = Column(Text)
     bio = Column(Text)
@@ -53,6 +88,18 @@ class ExpertProfile(Base):
 class Content(Base):
     """Content model for storing AI-generated and benchmark content."""
     __tablename__ = 'contents'
+    __table_args__ = (
+        # Analytics filters by model, source type and optionally domain
+        Index('ix_content_model_source_domain', 'model_name', 'source_type', 'domain'),
+        # Distinct AI model names for the dashboard filters
+        Index(
+            'ix_content_source_model', 'source_type', 'model_name',
+            postgresql_where=text('model_name IS NOT NULL'),
+            sqlite_where=text('model_name IS NOT NULL')
+        ),
+        # Dashboard content breakdown groups by domain and source type
+        Index('ix_content_domain_source', 'domain', 'source_type'),
+    )
     
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
@@ -60,7 +107,8 @@ class Content(Base):
     domain = Column(String(50), nullable=False)  # e.g., creative_writing, technical_documentation
     source_type = Column(String(20), nullable=False)  # 'ai' or 'human'
     model_name = Column(String(100))  # AI model name if applicable
-    metadata = Column(JSON)  # Additional metadata
+    # 'metadata' is reserved on declarative classes, so the attribute is renamed
+    content_metadata = Column('metadata', JSON)  # Additional metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -91,6 +139,25 @@ class EvaluationCriterion(Base):
 class Evaluation(Base):
     """Evaluation session information."""
     __tablename__ = 'evaluations'
+    __table_args__ = (
+        Index('ix_eval_content_completion', 'content_id', 'completion_time'),
+        # Each evaluator evaluates a piece of content at most once
+        Index('ix_eval_evaluator_content', 'evaluator_id', 'content_id', unique=True),
+        # Pending evaluations per evaluator
+        Index(
+            'ix_eval_user_pending', 'evaluator_id',
+            postgresql_where=text('completion_time IS NULL'),
+            sqlite_where=text('completion_time IS NULL')
+        ),
+        # Analytics only reads evaluations that did not fail quality checks
+        Index(
+            'ix_eval_passed_qc_content_completion', 'content_id', 'completion_time',
+            postgresql_where=text('passed_quality_checks IS NOT FALSE'),
+            sqlite_where=text('passed_quality_checks IS NOT FALSE')
+        ),
+        # An evaluator's most recently completed evaluations
+        Index('ix_eval_evaluator_completed', 'evaluator_id', text('completion_time DESC')),
+    )
     
     id = Column(Integer, primary_key=True)
     evaluator_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -111,9 +178,61 @@ class Evaluation(Base):
         return f"<Evaluation(id={self.id}, evaluator_id={self.evaluator_id}, content_id={self.content_id})>"
 
 
+# Evaluations count towards analytics unless they explicitly failed quality checks.
+# A plain "!= False" would also drop NULL (not yet checked) rows in SQL.
+PASSED_QC = or_(
+    Evaluation.passed_quality_checks.is_(None),
+    Evaluation.passed_quality_checks.is_(True)
+)
+
+
+class EvaluationStat(Base):
+    """Running evaluation counts per evaluator, content domain and source type."""
+    __tablename__ = 'evaluation_stats'
+    
+    evaluator_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    domain = Column(String(50), primary_key=True)
+    source_type = Column(String(20), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    completed = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<EvaluationStat(evaluator_id={self.evaluator_id}, domain='{self.domain}', source_type='{self.source_type}')>"
+
+
+class ContentStat(Base):
+    """Running content counts per domain and source type."""
+    __tablename__ = 'content_stats'
+    
+    domain = Column(String(50), primary_key=True)
+    source_type = Column(String(20), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<ContentStat(domain='{self.domain}', source_type='{self.source_type}', total={self.total})>"
+
+
+class ScoreRollup(Base):
+    """Daily score sums per AI model, content domain and criterion, for analytics."""
+    __tablename__ = 'score_rollups'
+    
+    model_name = Column(String(100), primary_key=True)
+    domain = Column(String(50), primary_key=True)
+    criterion_id = Column(Integer, ForeignKey('evaluation_criteria.id'), primary_key=True)
+    day = Column(Date, primary_key=True)  # Day the evaluations were completed
+    score_sum = Column(Float, nullable=False, default=0)
+    score_count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<ScoreRollup(model_name='{self.model_name}', domain='{self.domain}', criterion_id={self.criterion_id}, day={self.day})>"
+
+
 class EvaluationScore(Base):
     """Individual criterion scores for an evaluation."""
     __tablename__ = 'evaluation_scores'
+    __table_args__ = (
+        Index('ix_score_eval_crit', 'evaluation_id', 'criterion_id'),
+    )
     
     id = Column(Integer, primary_key=True)
     evaluation_id = Column(Integer, ForeignKey('evaluations.id'), nullable=False)
@@ -152,11 +271,20 @@ class AnalyticsReport(Base):
     report_type = Column(String(50), nullable=False)  # e.g., model_comparison, domain_analysis
     title = Column(String(200), nullable=False)
     description = Column(Text)
-    parameters = Column(JSON)  # Report generation parameters
-    results = Column(JSON)  # Report results
+    parameters = Column(JSON_DOCUMENT)  # Report generation parameters
+    results = Column(JSON_DOCUMENT)  # Report results
     created_at = Column(DateTime, default=datetime.utcnow)
     created_by = Column(Integer, ForeignKey('users.id'))
     
+    __table_args__ = (
+        # Recent reports are listed newest first
+        Index('ix_reports_created_desc', created_at.desc(), id),
+        # Non-admins page through their own reports by (created_at, id)
+        Index('ix_reports_creator_created', created_by, created_at.desc(), id.desc()),
+        # Newest reports of a given type
+        Index('ix_reports_type_created', report_type, created_at.desc()),
+    )
+    
     def __repr__(self):
         return f"<AnalyticsReport(id={self.id}, report_type='{self.report_type}', title='{self.title}')>"
 
@@ -167,14 +295,26 @@ class ImprovementSuggestion(Base):
     
     id = Column(Integer, primary_key=True)
     model_name = Column(String(100), nullable=False)
-    domain = Column(String(50), nullable=False)
+    domain = Column(String(50))  # None for general, cross-domain suggestions
     criterion = Column(String(50), nullable=False)
     current_score = Column(Float)
     target_score = Column(Float)
     suggestion = Column(Text, nullable=False)
-    priority = Column(String(20), default='medium')  # high, medium, low
-    status = Column(String(20), default='open')  # open, in_progress, implemented, closed
+    priority = Column(String(20), default=PRIORITY_MEDIUM)  # high, medium, low
+    priority_rank = Column(SmallInteger, default=PRIORITY_RANKS[PRIORITY_MEDIUM])  # Kept in sync with priority
+    status = Column(String(20), default=STATUS_OPEN)  # open, in_progress, implemented, closed
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    __table_args__ = (
+        Index('ix_sugg_rank_created', priority_rank, created_at.desc()),
+        # Newest suggestions with a given status
+        Index('ix_sugg_status_created', status, created_at.desc()),
+    )
+    
+    @validates('priority')
+    def _sync_priority_rank(self, key, priority):
+        self.priority_rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[PRIORITY_LOW])
+        return priority
+    
     def __repr__(self):
         return f"<ImprovementSuggestion(id={self.id}, model_name='{self.model_name}', domain='{self.domain}', criterion='{self.criterion}')>"
\ No newline at end of file
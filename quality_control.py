@@ -3,9 +3,14 @@ Quality control mechanisms for ensuring consistent and reliable human evaluation
 """
 import logging
 import random
+import threading
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any
 
+from cachetools import TTLCache
+from sqlalchemy import and_, event, func, or_, select
+
 from database import get_db_session
 from models import (
     QualityCheckQuestion, Evaluation, User, Content, EvaluationScore, 
@@ -13,13 +18,71 @@ from models import (
 )
 from config import (
     MIN_EVALUATION_TIME_SECONDS, QUALITY_CHECK_FREQUENCY, 
-    AGREEMENT_THRESHOLD, CONTENT_DOMAINS
+    AGREEMENT_THRESHOLD, CONTENT_DOMAINS, QUALITY_ISSUES_CACHE_TTL, QUALITY_CHECK_ANSWER_CACHE_TTL
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Flagging scans every completed evaluation, so the result is reused between page loads
+_quality_issues_cache = TTLCache(maxsize=1, ttl=QUALITY_ISSUES_CACHE_TTL)
+_quality_issues_lock = threading.Lock()
+
+
+# Lower-cased correct answer per active quality check question. Only the answer
+# key is cached (never the grading), so stale entries are bounded by the TTL
+_answer_key_cache = TTLCache(maxsize=1024, ttl=QUALITY_CHECK_ANSWER_CACHE_TTL)
+_answer_key_lock = threading.Lock()
+
+
+def _get_answer_key(question_ids: List[int]) -> Dict[int, str]:
+    """
+    Get the correct answers of the given active quality check questions.
+    
+    Questions missing from the cache are loaded with a single query.
+    
+    Args:
+        question_ids: IDs of the questions to look up
+        
+    Returns:
+        Dictionary mapping question ID to lower-cased correct answer, without
+        unknown or inactive questions
+    """
+    with _answer_key_lock:
+        answer_key = {
+            question_id: _answer_key_cache[question_id]
+            for question_id in question_ids if question_id in _answer_key_cache
+        }
+    
+    missing = [question_id for question_id in question_ids if question_id not in answer_key]
+    if missing:
+        with get_db_session() as session:
+            loaded = {
+                question_id: correct_answer.lower()
+                for question_id, correct_answer in session.execute(
+                    select(QualityCheckQuestion.id, QualityCheckQuestion.correct_answer).where(
+                        QualityCheckQuestion.id.in_(missing),
+                        QualityCheckQuestion.active == True
+                    )
+                )
+            }
+        
+        with _answer_key_lock:
+            _answer_key_cache.update(loaded)
+        answer_key.update(loaded)
+    
+    return answer_key
+
+
+@event.listens_for(QualityCheckQuestion, "after_insert")
+@event.listens_for(QualityCheckQuestion, "after_update")
+@event.listens_for(QualityCheckQuestion, "after_delete")
+def _invalidate_answer_key(mapper, connection, target):
+    """Drop the cached answer key whenever a quality check question changes."""
+    with _answer_key_lock:
+        _answer_key_cache.clear()
+
 
 class QualityController:
     """
@@ -82,20 +145,19 @@ class QualityController:
         if not answers:
             return False
         
+        answer_key = _get_answer_key(list(answers))
+        
         correct_count = 0
+        for question_id, answer in answers.items():
+            if question_id not in answer_key:
+                logger.warning(f"Quality check question ID {question_id} not found")
+                continue
+            
+            # Answers that aren't plain strings (e.g. multi-select lists) never match
+            if isinstance(answer, str) and answer.lower() == answer_key[question_id]:
+                correct_count += 1
         total_count = len(answers)
         
-        with get_db_session() as session:
-            for question_id, answer in answers.items():
-                question = session.query(QualityCheckQuestion).get(question_id)
-                
-                if not question:
-                    logger.warning(f"Quality check question ID {question_id} not found")
-                    continue
-                
-                if question.correct_answer.lower() == answer.lower():
-                    correct_count += 1
-        
         # Must get at least 70% correct
         pass_threshold = 0.7
         passed = (correct_count / total_count) >= pass_threshold if total_count > 0 else False
@@ -179,12 +241,9 @@ class QualityController:
                 return {"status": "No evaluation scores found"}
             
             # Group scores by criterion
-            scores_by_criterion = {}
+            scores_by_criterion = defaultdict(list)
             for score in scores:
-                criterion_id = score.criterion_id
-                if criterion_id not in scores_by_criterion:
-                    scores_by_criterion[criterion_id] = []
-                scores_by_criterion[criterion_id].append(score.score)
+                scores_by_criterion[score.criterion_id].append(score.score)
             
             # Calculate variance for each criterion
             variance_by_criterion = {}
@@ -260,12 +319,9 @@ class QualityController:
             ).all()
             
             # Group scores by criterion
-            scores_by_criterion = {}
+            scores_by_criterion = defaultdict(list)
             for score in scores:
-                criterion_id = score.criterion_id
-                if criterion_id not in scores_by_criterion:
-                    scores_by_criterion[criterion_id] = []
-                scores_by_criterion[criterion_id].append(score.score)
+                scores_by_criterion[score.criterion_id].append(score.score)
             
             # Calculate agreement for each criterion
             agreement_by_criterion = {}
@@ -318,44 +374,86 @@ class QualityController:
         flagged_evaluations = []
         
         with get_db_session() as session:
-            # Get all completed evaluations
-            evaluations = session.query(Evaluation).filter(
-                Evaluation.completion_time.isnot(None)
-            ).all()
+            # Evaluations with at least two scores that are all identical
+            straight_lined = select(
+                EvaluationScore.evaluation_id
+            ).group_by(
+                EvaluationScore.evaluation_id
+            ).having(
+                func.count() >= 2,
+                func.min(EvaluationScore.score) == func.max(EvaluationScore.score)
+            ).subquery()
+            
+            # Only fetch completed evaluations that have at least one flag
+            fast_completion = and_(
+                Evaluation.duration_seconds != 0,
+                Evaluation.duration_seconds < MIN_EVALUATION_TIME_SECONDS
+            )
+            evaluations = session.query(
+                Evaluation.id,
+                Evaluation.evaluator_id,
+                Evaluation.content_id,
+                Evaluation.duration_seconds,
+                Evaluation.passed_quality_checks,
+                Evaluation.completion_time,
+                straight_lined.c.evaluation_id.isnot(None)
+            ).outerjoin(
+                straight_lined, straight_lined.c.evaluation_id == Evaluation.id
+            ).filter(
+                Evaluation.completion_time.isnot(None),
+                or_(
+                    fast_completion,
+                    Evaluation.passed_quality_checks.is_(False),
+                    straight_lined.c.evaluation_id.isnot(None)
+                )
+            ).order_by(Evaluation.id)
             
-            for evaluation in evaluations:
+            for (evaluation_id, evaluator_id, content_id, duration_seconds,
+                 passed_quality_checks, completion_time, is_straight_lined) in evaluations:
                 flags = []
                 
                 # Check evaluation duration
-                if evaluation.duration_seconds and evaluation.duration_seconds < MIN_EVALUATION_TIME_SECONDS:
-                    flags.append(f"Fast completion: {evaluation.duration_seconds} seconds")
+                if duration_seconds and duration_seconds < MIN_EVALUATION_TIME_SECONDS:
+                    flags.append(f"Fast completion: {duration_seconds} seconds")
                 
                 # Check quality checks
-                if evaluation.passed_quality_checks is False:
+                if passed_quality_checks is False:
                     flags.append("Failed quality checks")
                 
                 # Check for straight-line scoring
-                scores = session.query(EvaluationScore).filter(
-                    EvaluationScore.evaluation_id == evaluation.id
-                ).all()
-                
-                if len(scores) >= 2:
-                    first_score = scores[0].score
-                    if all(s.score == first_score for s in scores):
-                        flags.append("Straight-line scoring")
+                if is_straight_lined:
+                    flags.append("Straight-line scoring")
                 
-                # If any flags, add to the result
-                if flags:
-                    flagged_evaluations.append({
-                        "evaluation_id": evaluation.id,
-                        "evaluator_id": evaluation.evaluator_id,
-                        "content_id": evaluation.content_id,
-                        "flags": flags,
-                        "completion_time": evaluation.completion_time.isoformat()
-                    })
+                flagged_evaluations.append({
+                    "evaluation_id": evaluation_id,
+                    "evaluator_id": evaluator_id,
+                    "content_id": content_id,
+                    "flags": flags,
+                    "completion_time": completion_time.isoformat()
+                })
         
         return flagged_evaluations
     
+    def get_quality_issues(self) -> List[Dict[str, Any]]:
+        """
+        Get flagged evaluations, recomputed at most every QUALITY_ISSUES_CACHE_TTL seconds.
+        
+        Returns:
+            List of potentially problematic evaluations with reasons
+        """
+        with _quality_issues_lock:
+            cached = _quality_issues_cache.get("issues")
+        
+        if cached is not None:
+            return cached
+        
+        issues = self.flag_low_quality_evaluations()
+        
+        with _quality_issues_lock:
+            _quality_issues_cache["issues"] = issues
+        
+        return issues
+    
     def create_quality_check_question(
         self, 
         question_text: str, 
@@ -0,0 +1,60 @@
+"""
+Shared fixtures: every test runs against a fresh SQLite database file.
+"""
+import os
+import tempfile
+
+# Must be set before config/database are imported, since the engine is built at import
+_db_dir = tempfile.mkdtemp(prefix="genai-eval-tests-")
+os.environ["DB_TYPE"] = "sqlite"
+os.environ["SQLITE_DB_PATH"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest
+
+from database import Base, engine, init_db, get_db_session
+from models import User, Content, EvaluationCriterion
+
+
+@pytest.fixture
+def db():
+    """Recreate all tables with the default criteria and admin user."""
+    Base.metadata.drop_all(engine)
+    assert init_db()
+    yield
+
+
+@pytest.fixture
+def make_user(db):
+    """Create an evaluator and return its ID."""
+    def _make_user(username, role='evaluator'):
+        with get_db_session() as session:
+            user = User(username=username, email=f"{username}@example.com", password_hash="x", role=role)
+            session.add(user)
+            session.flush()
+            return user.id
+    return _make_user
+
+
+@pytest.fixture
+def make_content(db):
+    """Create a piece of content and return its ID."""
+    def _make_content(domain='news_articles', source_type='ai', model_name='gpt'):
+        with get_db_session() as session:
+            content = Content(
+                title=f"{domain} {source_type}",
+                text="x" * 100,
+                domain=domain,
+                source_type=source_type,
+                model_name=model_name if source_type == 'ai' else None
+            )
+            session.add(content)
+            session.flush()
+            return content.id
+    return _make_content
+
+
+@pytest.fixture
+def criteria(db):
+    """IDs of the default evaluation criteria."""
+    with get_db_session() as session:
+        return [criterion_id for (criterion_id,) in session.query(EvaluationCriterion.id).order_by(EvaluationCriterion.id)]
@@ -0,0 +1,133 @@
+"""
+Tests for the analytics engine.
+"""
+from sqlalchemy import update
+
+import analytics
+from analytics import AnalyticsEngine
+from database import get_db_session, rebuild_summary_tables
+from evaluator import Evaluator
+from models import Evaluation, EvaluationCriterion, ImprovementSuggestion
+
+
+def submit_evaluations(make_user, make_content, criteria):
+    """Have three evaluators score content from two models in two domains."""
+    evaluator = Evaluator()
+    users = [make_user(f"user{i}") for i in range(3)]
+    contents = [
+        make_content(domain, 'ai', model_name)
+        for domain in ('news_articles', 'creative_writing')
+        for model_name in ('gpt', 'claude')
+    ]
+
+    evaluation_ids = []
+    for i, user in enumerate(users):
+        for j, content in enumerate(contents):
+            evaluation_id = evaluator.start_evaluation(user, content)
+            scores = {criterion_id: float(1 + (i + j + k) % 5) for k, criterion_id in enumerate(criteria)}
+            assert evaluator.submit_evaluation(evaluation_id, scores, 3.0)[0]
+            evaluation_ids.append(evaluation_id)
+
+    return evaluation_ids
+
+
+def submit_score(evaluator, user_id, content_id, criteria, score):
+    """Have a user give every criterion of a piece of content the same score."""
+    evaluation_id = evaluator.start_evaluation(user_id, content_id)
+    assert evaluator.submit_evaluation(evaluation_id, {criterion_id: score for criterion_id in criteria}, score)[0]
+    return evaluation_id
+
+
+def compare_models(monkeypatch, use_rollups):
+    monkeypatch.setattr(analytics, "ANALYTICS_SCORE_ROLLUPS", use_rollups)
+    report = AnalyticsEngine().generate_model_comparison(
+        ["gpt", "claude"], ["news_articles", "creative_writing"], timeframe="all_time"
+    )
+    return report["models"], report["overall_ranking"]
+
+
+def test_score_rollups_match_live_aggregation(monkeypatch, make_user, make_content, criteria):
+    evaluation_ids = submit_evaluations(make_user, make_content, criteria)
+
+    assert compare_models(monkeypatch, True) == compare_models(monkeypatch, False)
+
+    # Failing quality checks after the fact bypasses submit_evaluation(), so the
+    # rollups only agree again once they are rebuilt
+    with get_db_session() as session:
+        session.execute(
+            update(Evaluation).where(Evaluation.id.in_(evaluation_ids[::3])).values(passed_quality_checks=False)
+        )
+
+    assert 'score_rollups' in rebuild_summary_tables()
+    assert compare_models(monkeypatch, True) == compare_models(monkeypatch, False)
+
+
+def test_criteria_names_follow_criterion_changes(criteria):
+    assert analytics.get_criteria_names()[criteria[0]] == "accuracy"
+
+    with get_db_session() as session:
+        session.get(EvaluationCriterion, criteria[0]).name = "correctness"
+
+    assert analytics.get_criteria_names()[criteria[0]] == "correctness"
+
+
+def test_human_benchmark_follows_human_submissions(make_user, make_content, criteria):
+    evaluator = Evaluator()
+    evaluation_id = evaluator.start_evaluation(make_user("alice"), make_content('news_articles', 'human'))
+    engine = AnalyticsEngine()
+
+    assert engine.analyze_human_ai_gap()["error"] == "No human benchmark data available"
+
+    # Submitting only writes evaluations through Core, which the Content listeners never see
+    assert evaluator.submit_evaluation(evaluation_id, {criterion_id: 4.0 for criterion_id in criteria}, 4.0)[0]
+    assert engine.analyze_human_ai_gap()["error"] == "No AI model data available"
+
+
+def test_improvement_suggestions_format_the_target_score(make_user, make_content, criteria):
+    evaluator = Evaluator()
+    user = make_user("alice")
+    submit_score(evaluator, user, make_content('news_articles', 'ai', 'weak'), criteria, 2.0)
+    submit_score(evaluator, user, make_content('news_articles', 'ai', 'strong'), criteria, 5.0)
+
+    results = AnalyticsEngine().identify_improvement_areas("weak", threshold=0.5, comparison_model="strong")
+
+    assert results["suggestions"]
+    for suggestion in results["suggestions"]:
+        assert "from 2.00 to 5.00." in suggestion["suggestion"]
+
+
+def test_general_suggestions_are_saved_without_a_domain(make_user, make_content, criteria):
+    evaluator = Evaluator()
+    user = make_user("alice")
+    submit_score(evaluator, user, make_content('news_articles', 'ai', 'weak'), criteria, 2.0)
+    submit_score(evaluator, user, make_content('news_articles', 'ai', 'strong'), criteria, 5.0)
+
+    results = AnalyticsEngine().identify_improvement_areas("weak", threshold=0.5, comparison_model="strong")
+
+    # One suggestion for the weakest criterion in the domain, general ones for the rest
+    with get_db_session() as session:
+        domains = [domain for (domain,) in session.query(ImprovementSuggestion.domain)]
+    assert len(domains) == len(results["suggestions"])
+    assert domains.count('news_articles') == 1
+    assert domains.count(None) == len(criteria) - 1
+
+
+def test_unchecked_evaluations_count_and_failed_ones_do_not(make_user, make_content, criteria):
+    evaluator = Evaluator()
+    user = make_user("alice")
+    unchecked = submit_score(evaluator, user, make_content('news_articles', 'ai', 'weak'), criteria, 2.0)
+    failed = submit_score(evaluator, user, make_content('news_articles', 'ai', 'weak'), criteria, 1.0)
+    submit_score(evaluator, user, make_content('news_articles', 'ai', 'strong'), criteria, 5.0)
+
+    with get_db_session() as session:
+        session.execute(update(Evaluation).where(Evaluation.id == unchecked).values(passed_quality_checks=None))
+        session.execute(update(Evaluation).where(Evaluation.id == failed).values(passed_quality_checks=False))
+
+    engine = AnalyticsEngine()
+    results = engine.identify_improvement_areas("weak", threshold=0.5, comparison_model="strong")
+    assert results["suggestions"]
+    for suggestion in results["suggestions"]:
+        assert "from 2.00 to 5.00." in suggestion["suggestion"]
+
+    report = engine.generate_model_comparison(["weak"], timeframe="all_time")
+    assert report["models"]["weak"]["evaluations"] == 1
@@ -0,0 +1,142 @@
+"""
+Tests for the dashboard blueprint and its helpers.
+"""
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from cachetools import TTLCache
+from flask import Flask
+from flask_login import LoginManager, UserMixin
+
+from database import get_db_session
+from interfaces import dashboard
+from models import AnalyticsReport
+
+
+class LoggedInUser(UserMixin):
+    """Logged-in user for the test app; the User model has no Flask-Login mixin."""
+
+    def __init__(self, user_id, role):
+        self.id = user_id
+        self.role = role
+
+
+@pytest.fixture
+def client(make_user):
+    """Test client of an app serving the dashboard, with a login(username, role) helper."""
+    app = Flask(__name__)
+    app.config.update(SECRET_KEY="test", TESTING=True)
+    app.register_blueprint(dashboard.dashboard_bp, url_prefix='/dashboard')
+
+    users = {}
+    login_manager = LoginManager(app)
+    login_manager.user_loader(lambda user_id: users.get(int(user_id)))
+
+    client = app.test_client()
+
+    def login(username, role='evaluator'):
+        user_id = make_user(username, role)
+        users[user_id] = LoggedInUser(user_id, role)
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+        return user_id
+
+    client.login = login
+    return client
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    """Capture the context of rendered pages, since most dashboard templates don't exist yet."""
+    contexts = []
+
+    def render_template(template, **context):
+        contexts.append(context)
+        return template
+
+    monkeypatch.setattr(dashboard, "render_template", render_template)
+    return contexts
+
+
+@pytest.fixture
+def export_dirs(monkeypatch, tmp_path):
+    """Point exports and export job state at a temporary directory."""
+    monkeypatch.setattr(dashboard, "EXPORT_DIR", str(tmp_path / "exports"))
+    monkeypatch.setattr(dashboard, "EXPORT_JOB_DIR", str(tmp_path / "jobs"))
+    os.makedirs(dashboard.EXPORT_DIR)
+    os.makedirs(dashboard.EXPORT_JOB_DIR)
+
+
+def test_export_jobs_settle_as_failed_when_the_export_raises(monkeypatch, export_dirs):
+    def broken_export(file_path, filters):
+        raise RuntimeError("database went away")
+    monkeypatch.setattr(dashboard, "export_evaluations_to_csv", broken_export)
+
+    dashboard._save_export_job("abc", user_id=1, filename="x.csv", count=0, status='pending')
+    dashboard._run_export("abc", 1, "x.csv", {})
+
+    assert dashboard._load_export_job("abc")["status"] == 'failed'
+
+
+def test_expired_export_jobs_are_purged_with_their_files(export_dirs):
+    for job_id in ("old", "new"):
+        dashboard._save_export_job(job_id, user_id=1, filename=f"{job_id}.csv", count=1, status='complete')
+        open(os.path.join(dashboard.EXPORT_DIR, f"{job_id}.csv"), 'w').close()
+
+    expired = time.time() - dashboard.EXPORT_JOB_TTL - 1
+    os.utime(dashboard._export_job_path("old"), (expired, expired))
+    dashboard._purge_export_jobs()
+
+    assert sorted(os.listdir(dashboard.EXPORT_JOB_DIR)) == ["new.json"]
+    assert sorted(os.listdir(dashboard.EXPORT_DIR)) == ["new.csv"]
+
+
+def test_reports_page_through_rows_with_equal_timestamps(client, rendered):
+    admin = client.login("root", role='admin')
+
+    # Pages of 10 end inside a run of reports created at the same instant
+    start = datetime(2026, 1, 1)
+    with get_db_session() as session:
+        session.add_all(
+            AnalyticsReport(report_type="t", title=str(i), created_by=admin, created_at=start + timedelta(minutes=i // 5))
+            for i in range(13)
+        )
+
+    seen = []
+    after = ''
+    while True:
+        assert client.get('/dashboard/reports', query_string={'after': after}).status_code == 200
+        context = rendered[-1]
+        seen.extend((report.created_at, report.id) for report in context['reports'])
+        if not context['has_more']:
+            break
+        after = context['next_after']
+
+    assert len(rendered) == 2
+    assert seen == sorted(seen, reverse=True)
+    assert len(set(seen)) == 13
+
+
+def test_dashboard_stats_answer_repeat_polls_with_304(monkeypatch, client, make_content):
+    monkeypatch.setattr(dashboard, "_dashboard_stats_cache", TTLCache(maxsize=1, ttl=dashboard.DASHBOARD_STATS_CACHE_TTL))
+    client.login("alice")
+    make_content('news_articles', 'ai')
+
+    response = client.get('/dashboard/api/dashboard/stats')
+    assert response.status_code == 200
+    assert response.cache_control.private
+    assert response.cache_control.max_age == dashboard.DASHBOARD_STATS_CACHE_TTL
+    etag = response.headers['ETag']
+
+    repeat = client.get('/dashboard/api/dashboard/stats', headers={'If-None-Match': etag})
+    assert repeat.status_code == 304
+    assert repeat.data == b''
+
+    # Once the cached stats expire and the numbers change, the old ETag no longer matches
+    dashboard._dashboard_stats_cache.clear()
+    make_content('creative_writing', 'human')
+    changed = client.get('/dashboard/api/dashboard/stats', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
@@ -0,0 +1,116 @@
+"""
+Tests for database initialization, its backfills and the content_stats summary table.
+"""
+import orjson
+from sqlalchemy import Text, cast, delete, func, insert, update
+
+from analytics import AnalyticsEngine
+from database import get_db_session, init_db, rebuild_summary_tables
+from models import (
+    Content, ContentStat, ExpertProfile, ImprovementSuggestion, PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW, PRIORITY_RANKS
+)
+
+
+def live_content_stats():
+    """Count content per domain and source type straight from the content table."""
+    with get_db_session() as session:
+        return sorted(session.query(
+            Content.domain, Content.source_type, func.count()
+        ).group_by(
+            Content.domain, Content.source_type
+        ).all())
+
+
+def summary_content_stats():
+    """Read the content_stats summary rows, dropping rows that count nothing."""
+    with get_db_session() as session:
+        return sorted(
+            tuple(row) for row in session.query(
+                ContentStat.domain, ContentStat.source_type, ContentStat.total
+            ).all()
+            if row.total
+        )
+
+
+def test_content_stats_follow_insert_move_and_delete(make_content):
+    content_ids = [
+        make_content('news_articles', 'ai'),
+        make_content('news_articles', 'ai'),
+        make_content('creative_writing', 'human')
+    ]
+    assert summary_content_stats() == live_content_stats()
+
+    with get_db_session() as session:
+        content = session.get(Content, content_ids[0])
+        content.domain = 'marketing_copy'
+        content.source_type = 'human'
+    assert summary_content_stats() == live_content_stats()
+
+    with get_db_session() as session:
+        session.delete(session.get(Content, content_ids[1]))
+    assert summary_content_stats() == live_content_stats()
+
+
+def test_core_content_writes_need_a_rebuild(make_content):
+    make_content('news_articles', 'ai')
+
+    # Core statements skip the ORM listeners that maintain content_stats
+    with get_db_session() as session:
+        session.execute(insert(Content).values(title="t", text="x", domain='news_articles', source_type='human'))
+        session.execute(delete(Content).where(Content.source_type == 'ai'))
+    assert summary_content_stats() != live_content_stats()
+
+    # Restarting leaves the populated table alone; an explicit rebuild reconciles it
+    assert init_db()
+    assert summary_content_stats() != live_content_stats()
+
+    assert 'content_stats' in rebuild_summary_tables()
+    assert summary_content_stats() == live_content_stats()
+
+
+def test_priority_ranks_are_backfilled_and_order_suggestions(db):
+    suggestion = dict(model_name='gpt', domain='news_articles', criterion='accuracy', suggestion='x')
+
+    with get_db_session() as session:
+        session.add_all(
+            ImprovementSuggestion(**suggestion, priority=priority)
+            for priority in (PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW)
+        )
+        session.flush()
+
+        # Rows from before the rank column existed have no rank
+        session.execute(
+            update(ImprovementSuggestion).where(ImprovementSuggestion.priority != PRIORITY_MEDIUM).values(priority_rank=None)
+        )
+
+    assert init_db()
+
+    with get_db_session() as session:
+        ranks = dict(session.query(ImprovementSuggestion.priority, ImprovementSuggestion.priority_rank))
+    assert ranks == PRIORITY_RANKS
+
+    suggestions = AnalyticsEngine().get_improvement_suggestions(model_name='gpt')
+    assert [s['priority'] for s in suggestions] == [PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW]
+
+
+def test_string_encoded_expert_domains_are_migrated(make_user):
+    stored = {
+        make_user("listed"): ['news_articles'],
+        make_user("encoded"): '["creative_writing", "marketing_copy"]',
+        make_user("garbled"): 'news_articles'
+    }
+    with get_db_session() as session:
+        session.add_all(ExpertProfile(user_id=user_id, domains=domains) for user_id, domains in stored.items())
+
+    assert init_db()
+
+    # Check the stored JSON itself, since DomainList would hide strings as empty lists
+    with get_db_session() as session:
+        domains = {
+            user_id: orjson.loads(raw) for user_id, raw in session.query(
+                ExpertProfile.user_id, cast(ExpertProfile.domains, Text)
+            )
+        }
+    assert [domains[user_id] for user_id in stored] == [
+        ['news_articles'], ['creative_writing', 'marketing_copy'], []
+    ]
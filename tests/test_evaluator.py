@@ -0,0 +1,148 @@
+"""
+Tests for the evaluation workflow and the evaluation_stats summary it maintains.
+"""
+import random
+from datetime import datetime, timedelta
+
+from cachetools import TTLCache
+from sqlalchemy import DateTime, func, literal, select, update
+
+import evaluator as evaluator_module
+from config import QUALIFICATION_CACHE_TTL
+from database import get_db_session, init_db, rebuild_summary_tables
+from evaluator import Evaluator, _seconds_between
+from models import Content, Evaluation, EvaluationStat, User
+
+
+def live_evaluation_stats():
+    """Count evaluations per evaluator, domain and source type straight from the evaluations."""
+    with get_db_session() as session:
+        return sorted(session.query(
+            Evaluation.evaluator_id,
+            Content.domain,
+            Content.source_type,
+            func.count(),
+            func.count(Evaluation.completion_time)
+        ).join(
+            Content, Content.id == Evaluation.content_id
+        ).group_by(
+            Evaluation.evaluator_id, Content.domain, Content.source_type
+        ).all())
+
+
+def summary_evaluation_stats():
+    """Read the evaluation_stats summary rows, dropping rows that count nothing."""
+    with get_db_session() as session:
+        return sorted(
+            tuple(row) for row in session.query(
+                EvaluationStat.evaluator_id,
+                EvaluationStat.domain,
+                EvaluationStat.source_type,
+                EvaluationStat.total,
+                EvaluationStat.completed
+            ).all()
+            if row.total
+        )
+
+
+def test_evaluation_stats_follow_start_and_submit(make_user, make_content, criteria):
+    evaluator = Evaluator()
+    users = [make_user("alice"), make_user("bob")]
+    contents = [
+        make_content('news_articles', 'ai'),
+        make_content('news_articles', 'human'),
+        make_content('creative_writing', 'ai')
+    ]
+
+    evaluation_ids = [evaluator.start_evaluation(user, content) for user in users for content in contents]
+
+    # Starting the same pair again must not count twice
+    assert evaluator.start_evaluation(users[0], contents[0]) == evaluation_ids[0]
+    assert summary_evaluation_stats() == live_evaluation_stats()
+
+    scores = {criterion_id: 4.0 for criterion_id in criteria}
+    for evaluation_id in evaluation_ids[:4]:
+        assert evaluator.submit_evaluation(evaluation_id, scores, 4.0) == (True, "Evaluation submitted successfully")
+
+    # Submitting again must neither succeed nor count twice
+    success, _ = evaluator.submit_evaluation(evaluation_ids[0], scores, 4.0)
+    assert not success
+    assert summary_evaluation_stats() == live_evaluation_stats()
+
+
+def test_init_db_leaves_populated_evaluation_stats_alone(make_user, make_content):
+    evaluator = Evaluator()
+    user = make_user("alice")
+    evaluator.start_evaluation(user, make_content())
+
+    with get_db_session() as session:
+        session.execute(update(EvaluationStat).values(total=99))
+
+    # Restarting the app must not recount (and race) a table that is already populated
+    assert init_db()
+    assert summary_evaluation_stats()[0][3] == 99
+
+    assert 'evaluation_stats' in rebuild_summary_tables()
+    assert summary_evaluation_stats() == live_evaluation_stats()
+
+
+def test_seconds_between_keeps_exact_minutes(db):
+    random.seed(0)
+    with get_db_session() as session:
+        for _ in range(500):
+            start = datetime(2026, 1, 1) + timedelta(
+                seconds=random.randint(0, 10 ** 8), microseconds=random.randint(0, 999) * 1000
+            )
+            seconds = session.execute(
+                select(_seconds_between(session, literal(start, DateTime), start + timedelta(seconds=60)))
+            ).scalar()
+            assert seconds == 60
+
+
+def test_submit_checks_evaluation_before_quality_checks(monkeypatch, make_user, make_content, criteria):
+    evaluator = Evaluator()
+    checked = []
+    monkeypatch.setattr(
+        evaluator.quality_controller, "validate_quality_checks", lambda answers: checked.append(answers) or True
+    )
+    scores = {criterion_id: 3.0 for criterion_id in criteria}
+
+    assert evaluator.submit_evaluation(12345, scores, 3.0, quality_check_answers={1: "a"}) == (
+        False, "Evaluation ID 12345 not found"
+    )
+
+    evaluation_id = evaluator.start_evaluation(make_user("alice"), make_content())
+    assert evaluator.submit_evaluation(evaluation_id, scores, 3.0, quality_check_answers={1: "a"})[0]
+    assert evaluator.submit_evaluation(evaluation_id, scores, 3.0, quality_check_answers={1: "a"}) == (
+        False, f"Evaluation ID {evaluation_id} already completed"
+    )
+    assert len(checked) == 1
+
+
+def test_qualifications_expire_after_core_writes(monkeypatch, make_user):
+    now = [0]
+    monkeypatch.setattr(
+        evaluator_module, "_qualification_cache", TTLCache(maxsize=16, ttl=QUALIFICATION_CACHE_TTL, timer=lambda: now[0])
+    )
+    evaluator = Evaluator()
+    admin = make_user("root", role='admin')
+    assert evaluator.get_expert_qualification(admin, 'news_articles')
+
+    # Core writes (and other workers) never reach the ORM listeners that clear the cache
+    with get_db_session() as session:
+        session.execute(update(User).where(User.id == admin).values(is_active=False))
+    assert evaluator.get_expert_qualification(admin, 'news_articles')
+
+    now[0] += QUALIFICATION_CACHE_TTL + 1
+    assert not evaluator.get_expert_qualification(admin, 'news_articles')
+
+
+def test_content_selection_prefers_the_least_evaluated_match(make_user, make_content):
+    evaluator = Evaluator()
+    evaluated, fresh = make_content('news_articles', 'ai'), make_content('news_articles', 'ai')
+    make_content('creative_writing', 'ai')
+    evaluator.start_evaluation(make_user("alice"), evaluated)
+
+    assert evaluator.get_content_for_evaluation(domain='news_articles').id == fresh
+    assert evaluator.get_content_for_evaluation(domain='news_articles', exclude_ids=[fresh]).id == evaluated
+    assert evaluator.get_content_for_evaluation(domain='news_articles', source_type='human') is None
@@ -0,0 +1,53 @@
+"""
+Tests for quality check grading.
+"""
+from cachetools import TTLCache
+from sqlalchemy import update
+
+import quality_control
+from config import QUALITY_CHECK_ANSWER_CACHE_TTL
+from database import get_db_session
+from models import QualityCheckQuestion
+from quality_control import QualityController
+
+
+def make_questions(*answers):
+    """Create active quality check questions with the given correct answers and return their IDs."""
+    with get_db_session() as session:
+        questions = [QualityCheckQuestion(question_text="q", correct_answer=answer) for answer in answers]
+        session.add_all(questions)
+        session.flush()
+        return [question.id for question in questions]
+
+
+def test_quality_checks_grade_against_the_answer_key(db):
+    first, second, third = make_questions("Yes", "No", "Blue")
+    controller = QualityController()
+
+    assert controller.validate_quality_checks({first: "yes", second: "NO", third: "blue"})
+    assert not controller.validate_quality_checks({first: "yes", second: "yes", third: "red"})
+
+    # Multi-select answers and unknown questions count as wrong instead of failing
+    assert not controller.validate_quality_checks({first: ["yes"], second: "no", 12345: "x"})
+
+
+def test_answer_key_changes_apply_once_the_cache_expires(monkeypatch, db):
+    now = [0]
+    monkeypatch.setattr(
+        quality_control, "_answer_key_cache",
+        TTLCache(maxsize=16, ttl=QUALITY_CHECK_ANSWER_CACHE_TTL, timer=lambda: now[0])
+    )
+    (question,) = make_questions("Yes")
+    controller = QualityController()
+    assert controller.validate_quality_checks({question: "yes"})
+
+    # Core writes (and other workers) never reach the ORM listener that clears the key
+    with get_db_session() as session:
+        session.execute(
+            update(QualityCheckQuestion).where(QualityCheckQuestion.id == question).values(correct_answer="No")
+        )
+    assert controller.validate_quality_checks({question: "yes"})
+
+    now[0] += QUALITY_CHECK_ANSWER_CACHE_TTL + 1
+    assert not controller.validate_quality_checks({question: "yes"})
+    assert controller.validate_quality_checks({question: "no"})
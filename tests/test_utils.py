@@ -0,0 +1,109 @@
+"""
+Tests for the shared utility functions.
+"""
+import csv
+import os
+from datetime import datetime
+
+import pytest
+
+import utils
+from database import get_db_session
+from evaluator import Evaluator
+from models import Content, Evaluation, User
+from utils import export_evaluations_to_csv, format_page_cursor, parse_page_cursor
+
+# Columns every export starts with, before one column per scored criterion
+EXPORT_HEADERS = [
+    'evaluation_id', 'evaluator_username', 'content_title',
+    'content_domain', 'source_type', 'model_name',
+    'overall_rating', 'start_time', 'completion_time',
+    'duration_seconds', 'passed_quality_checks', 'comments'
+]
+
+
+def expected_export(domain=None):
+    """Build the export the way it was built before streaming: all rows at once, from ORM objects."""
+    with get_db_session() as session:
+        query = session.query(Evaluation, User.username, Content).join(
+            User, Evaluation.evaluator_id == User.id
+        ).join(
+            Content, Evaluation.content_id == Content.id
+        ).filter(
+            Evaluation.completion_time.isnot(None)
+        )
+        if domain:
+            query = query.filter(Content.domain == domain)
+
+        rows = []
+        for evaluation, username, content in query.order_by(Evaluation.id):
+            row = dict(zip(EXPORT_HEADERS, [
+                evaluation.id, username, content.title,
+                content.domain, content.source_type, content.model_name,
+                evaluation.overall_rating, evaluation.start_time.isoformat(), evaluation.completion_time.isoformat(),
+                evaluation.duration_seconds, evaluation.passed_quality_checks, evaluation.comments
+            ]))
+            row.update({score.criterion.name: score.score for score in evaluation.scores})
+            rows.append({key: '' if value is None else str(value) for key, value in row.items()})
+
+    # Criteria an evaluation didn't score are left blank
+    headers = EXPORT_HEADERS + sorted({key for row in rows for key in row} - set(EXPORT_HEADERS))
+    return headers, [{header: row.get(header, '') for header in headers} for row in rows]
+
+
+def read_export(file_path):
+    """Read an exported CSV back as its header and rows."""
+    with open(file_path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+    return reader.fieldnames, rows
+
+
+@pytest.mark.parametrize("timestamp", [
+    datetime(2026, 3, 1, 12, 30),
+    datetime(2026, 3, 1, 12, 30, 5, 123456),
+])
+def test_page_cursors_round_trip(timestamp):
+    assert parse_page_cursor(format_page_cursor(timestamp, 42)) == (timestamp, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "42", "yesterday,42", "2026-03-01T12:30:00,", "2026-03-01T12:30:00,x"])
+def test_invalid_page_cursors_start_from_the_top(cursor):
+    assert parse_page_cursor(cursor) is None
+
+
+def test_streamed_export_matches_the_full_export(monkeypatch, tmp_path, make_user, make_content, criteria):
+    # Small batches, so rows and their scores span several fetches
+    monkeypatch.setattr(utils, "EXPORT_BATCH_SIZE", 2)
+    evaluator = Evaluator()
+    users = [make_user("alice"), make_user("bob")]
+    contents = [
+        make_content('news_articles', 'ai', 'gpt'),
+        make_content('news_articles', 'human'),
+        make_content('creative_writing', 'ai', 'claude')
+    ]
+
+    for i, (user, content) in enumerate((user, content) for user in users for content in contents):
+        evaluation_id = evaluator.start_evaluation(user, content)
+        if i == 4:
+            continue  # Left pending, so never exported
+        scored = criteria[:3] if i % 2 else criteria
+        assert evaluator.submit_evaluation(
+            evaluation_id, {criterion_id: float(1 + (i + j) % 5) for j, criterion_id in enumerate(scored)},
+            3.5, comments=f'evaluation "{i}", with a comma'
+        )[0]
+
+    for domain in (None, 'news_articles'):
+        file_path = str(tmp_path / f"{domain}.csv")
+        headers, rows = expected_export(domain)
+
+        assert export_evaluations_to_csv(file_path, {'domain': domain} if domain else None) == (True, len(rows))
+        assert read_export(file_path) == (headers, rows)
+
+
+def test_empty_export_leaves_no_file(tmp_path, make_content):
+    make_content('news_articles', 'ai')
+    file_path = str(tmp_path / "empty.csv")
+
+    assert export_evaluations_to_csv(file_path, {'domain': 'news_articles'}) == (False, 0)
+    assert not os.path.exists(file_path)
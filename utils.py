@@ -8,8 +8,11 @@ import os
 import io
 import random
 import string
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union, Tuple
+from sqlalchemy import select
 from werkzeug.security import generate_password_hash, check_password_hash
 
 from database import get_db_session
@@ -23,6 +26,9 @@ from config import CONTENT_DOMAINS, EVALUATION_CRITERIA
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Evaluations fetched and written per batch when exporting to CSV
+EXPORT_BATCH_SIZE = 1000
+
 
 def import_content_from_json(file_path: str) -> Tuple[int, int]:
     """
@@ -78,7 +84,7 @@ def import_content_from_json(file_path: str) -> Tuple[int, int]:
                     domain=domain,
                     source_type=source_type,
                     model_name=model_name,
-                    metadata=metadata,
+                    content_metadata=metadata,
                     created_at=datetime.utcnow()
                 )
                 
@@ -95,10 +101,50 @@ def import_content_from_json(file_path: str) -> Tuple[int, int]:
         return 0, 0
 
 
+def _filter_export_query(query, filters: Optional[Dict[str, Any]]):
+    """
+    Restrict a query over evaluations joined with their content to completed, filtered evaluations.
+    
+    Args:
+        query: Select statement joining Evaluation and Content
+        filters: Optional filters to apply (domain, model_name, date_range, etc.)
+        
+    Returns:
+        Filtered select statement
+    """
+    # Apply filters if provided
+    if filters:
+        if 'domain' in filters:
+            query = query.where(Content.domain == filters['domain'])
+        
+        if 'model_name' in filters:
+            query = query.where(Content.model_name == filters['model_name'])
+        
+        if 'source_type' in filters:
+            query = query.where(Content.source_type == filters['source_type'])
+        
+        if 'start_date' in filters and 'end_date' in filters:
+            query = query.where(
+                Evaluation.completion_time.between(filters['start_date'], filters['end_date'])
+            )
+        
+        if 'evaluator_id' in filters:
+            query = query.where(Evaluation.evaluator_id == filters['evaluator_id'])
+        
+        if 'quality_check' in filters:
+            query = query.where(Evaluation.passed_quality_checks == filters['quality_check'])
+    
+    # Get only completed evaluations
+    return query.where(Evaluation.completion_time.isnot(None))
+
+
 def export_evaluations_to_csv(file_path: str, filters: Dict[str, Any] = None) -> Tuple[bool, int]:
     """
     Export evaluations to a CSV file.
     
+    Evaluations are streamed from the database in batches of EXPORT_BATCH_SIZE
+    and written as they arrive, so memory use doesn't grow with the export.
+    
     Args:
         file_path: Path to save the CSV file
         filters: Optional filters to apply (domain, model_name, date_range, etc.)
@@ -108,122 +154,102 @@ def export_evaluations_to_csv(file_path: str, filters: Dict[str, Any] = None) ->
     """
     try:
         with get_db_session() as session:
-            # Build query with joins to get all related data
-            query = session.query(
-                Evaluation,
-                User.username.label('evaluator_username'),
-                Content.title.label('content_title'),
-                Content.domain.label('content_domain'),
-                Content.source_type.label('content_source_type'),
-                Content.model_name.label('model_name')
-            ).join(
-                User, Evaluation.evaluator_id == User.id
-            ).join(
-                Content, Evaluation.content_id == Content.id
-            )
-            
-            # Apply filters if provided
-            if filters:
-                if 'domain' in filters:
-                    query = query.filter(Content.domain == filters['domain'])
-                
-                if 'model_name' in filters:
-                    query = query.filter(Content.model_name == filters['model_name'])
-                
-                if 'source_type' in filters:
-                    query = query.filter(Content.source_type == filters['source_type'])
-                
-                if 'start_date' in filters and 'end_date' in filters:
-                    query = query.filter(
-                        Evaluation.completion_time.between(filters['start_date'], filters['end_date'])
-                    )
-                
-                if 'evaluator_id' in filters:
-                    query = query.filter(Evaluation.evaluator_id == filters['evaluator_id'])
-                
-                if 'quality_check' in filters:
-                    query = query.filter(Evaluation.passed_quality_checks == filters['quality_check'])
-            
-            # Get only completed evaluations
-            query = query.filter(Evaluation.completion_time.isnot(None))
-            
-            # Execute query
-            results = query.all()
-            
-            if not results:
-                logger.warning("No evaluations found matching the criteria")
-                return False, 0
-            
-            # Get all evaluation IDs
-            eval_ids = [result[0].id for result in results]
+            # Plain columns, so rows come back as tuples without ORM identity tracking
+            query = _filter_export_query(
+                select(
+                    Evaluation.id,
+                    User.username,
+                    Content.title,
+                    Content.domain,
+                    Content.source_type,
+                    Content.model_name,
+                    Evaluation.overall_rating,
+                    Evaluation.start_time,
+                    Evaluation.completion_time,
+                    Evaluation.duration_seconds,
+                    Evaluation.passed_quality_checks,
+                    Evaluation.comments
+                ).join(
+                    User, Evaluation.evaluator_id == User.id
+                ).join(
+                    Content, Evaluation.content_id == Content.id
+                ),
+                filters
+            ).order_by(Evaluation.id)
             
-            # Get scores for these evaluations
-            scores_query = session.query(
-                EvaluationScore.evaluation_id,
-                EvaluationCriterion.name.label('criterion_name'),
-                EvaluationScore.score
-            ).join(
-                EvaluationCriterion, EvaluationScore.criterion_id == EvaluationCriterion.id
-            ).filter(
-                EvaluationScore.evaluation_id.in_(eval_ids)
+            # The criteria that appear in the exported scores become the score columns
+            criteria_query = _filter_export_query(
+                select(EvaluationCriterion.name).distinct().select_from(
+                    EvaluationScore
+                ).join(
+                    EvaluationCriterion, EvaluationScore.criterion_id == EvaluationCriterion.id
+                ).join(
+                    Evaluation, EvaluationScore.evaluation_id == Evaluation.id
+                ).join(
+                    User, Evaluation.evaluator_id == User.id
+                ).join(
+                    Content, Evaluation.content_id == Content.id
+                ),
+                filters
             )
+            all_criteria = sorted(session.scalars(criteria_query))
             
-            # Group scores by evaluation ID
-            scores_by_eval = {}
-            for eval_id, criterion, score in scores_query:
-                if eval_id not in scores_by_eval:
-                    scores_by_eval[eval_id] = {}
-                scores_by_eval[eval_id][criterion] = score
+            # Create CSV headers
+            headers = [
+                'evaluation_id', 'evaluator_username', 'content_title',
+                'content_domain', 'source_type', 'model_name',
+                'overall_rating', 'start_time', 'completion_time',
+                'duration_seconds', 'passed_quality_checks', 'comments'
+            ]
             
-            # Write to CSV
+            # Add criteria headers
+            headers.extend(all_criteria)
+            
+            count = 0
             with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                # Get all unique criteria for headers
-                all_criteria = set()
-                for scores in scores_by_eval.values():
-                    all_criteria.update(scores.keys())
-                
-                # Create CSV headers
-                headers = [
-                    'evaluation_id', 'evaluator_username', 'content_title',
-                    'content_domain', 'source_type', 'model_name',
-                    'overall_rating', 'start_time', 'completion_time',
-                    'duration_seconds', 'passed_quality_checks', 'comments'
-                ]
-                
-                # Add criteria headers
-                headers.extend(sorted(all_criteria))
-                
                 writer = csv.DictWriter(f, fieldnames=headers)
                 writer.writeheader()
                 
-                # Write rows
-                for result in results:
-                    evaluation = result[0]
-                    
-                    row = {
-                        'evaluation_id': evaluation.id,
-                        'evaluator_username': result[1],
-                        'content_title': result[2],
-                        'content_domain': result[3],
-                        'source_type': result[4],
-                        'model_name': result[5],
-                        'overall_rating': evaluation.overall_rating,
-                        'start_time': evaluation.start_time.isoformat() if evaluation.start_time else '',
-                        'completion_time': evaluation.completion_time.isoformat() if evaluation.completion_time else '',
-                        'duration_seconds': evaluation.duration_seconds,
-                        'passed_quality_checks': evaluation.passed_quality_checks,
-                        'comments': evaluation.comments
-                    }
+                # Server-side cursor where the driver supports it
+                results = session.execute(
+                    query.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+                )
+                
+                for batch in results.partitions():
+                    # Get scores for this batch of evaluations
+                    scores_by_eval = defaultdict(dict)
+                    scores_query = select(
+                        EvaluationScore.evaluation_id,
+                        EvaluationCriterion.name,
+                        EvaluationScore.score
+                    ).join(
+                        EvaluationCriterion, EvaluationScore.criterion_id == EvaluationCriterion.id
+                    ).where(
+                        EvaluationScore.evaluation_id.in_([result[0] for result in batch])
+                    )
+                    for eval_id, criterion, score in session.execute(scores_query):
+                        scores_by_eval[eval_id][criterion] = score
                     
-                    # Add scores
-                    if evaluation.id in scores_by_eval:
-                        for criterion, score in scores_by_eval[evaluation.id].items():
-                            row[criterion] = score
+                    # Write rows
+                    for result in batch:
+                        row = dict(zip(headers, result))
+                        row['start_time'] = result.start_time.isoformat() if result.start_time else ''
+                        row['completion_time'] = result.completion_time.isoformat() if result.completion_time else ''
+                        
+                        # Add scores
+                        row.update(scores_by_eval.get(result[0], {}))
+                        
+                        writer.writerow(row)
                     
-                    writer.writerow(row)
+                    count += len(batch)
             
-            logger.info(f"Exported {len(results)} evaluations to {file_path}")
-            return True, len(results)
+            if not count:
+                os.remove(file_path)
+                logger.warning("No evaluations found matching the criteria")
+                return False, 0
+            
+            logger.info(f"Exported {count} evaluations to {file_path}")
+            return True, count
             
     except Exception as e:
         logger.error(f"Error exporting evaluations to CSV: {e}")
@@ -512,6 +538,39 @@ def format_timestamp(timestamp, format_str='%Y-%m-%d %H:%M:%S'):
         return str(timestamp)
 
 
+def parse_page_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+    """
+    Parse a keyset pagination cursor of the form "<ISO timestamp>,<row id>".
+    
+    Args:
+        cursor: Cursor from the request, possibly empty
+        
+    Returns:
+        Tuple of (timestamp, row_id), or None if the cursor is missing or invalid
+    """
+    timestamp, _, row_id = cursor.rpartition(',')
+    
+    try:
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except ValueError:
+        return None
+
+
+def format_page_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    Build the cursor that continues a keyset-paginated listing after a row.
+    
+    Args:
+        timestamp: Sort timestamp of the last row on the page
+        row_id: ID of the last row on the page
+        
+    Returns:
+        Cursor string understood by parse_page_cursor()
+    """
+    return f'{timestamp.isoformat()},{row_id}'
+
+
+@lru_cache(maxsize=256)
 def get_domain_label(domain_code):
     """
     Get a human-readable label for a domain code.
@@ -527,4 +586,9 @@ def get_domain_label(domain_code):
     
     # Convert snake_case to Title Case
     words = domain_code.split('_')
-    return ' '.join(word.capitalize() for word in words)
\ No newline at end of file
+    return ' '.join(word.capitalize() for word in words)
+
+
+# Select field choices for the configured domains, built once at import
+DOMAIN_CHOICES = tuple((domain, get_domain_label(domain)) for domain in CONTENT_DOMAINS)
+DOMAIN_CHOICES_WITH_ALL = (('', 'All Domains'),) + DOMAIN_CHOICES